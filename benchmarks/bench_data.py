@@ -0,0 +1,91 @@
+"""
+Micro-benchmarks for feed parsing, filtering and competition search.
+
+Run through benchmarks/run.py, or on their own:
+    uv run python benchmarks/bench_data.py
+"""
+
+import json
+from typing import Any, Dict, List
+
+from harness import FIXTURES, summarize, time_call
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.index import CompetitionIndex
+from bcci_tv.api.utils import (
+    filter_matches_by_status,
+    filter_tournament_standings,
+    simplify_standings,
+    summarize_competitions,
+)
+
+SEARCH_QUERIES = ["ranji 2025", "vijay hazare", "VHT", "cooch behr", "trophy"]
+
+
+def synthetic_catalog(template: Dict[str, Any], size: int) -> Dict[str, Any]:
+    """
+    Scales a real competition catalog up to size entries, varying IDs,
+    names and seasons so search and ranking have realistic work to do.
+    """
+    base = template["competition"]
+    competitions = []
+    for i in range(size):
+        comp = dict(base[i % len(base)])
+        year = 2025 - (i // len(base)) % 30
+        comp["CompetitionID"] = str(100000 + i)
+        comp["CompetitionName"] = f"{comp['CompetitionName']} {year}"
+        comp["MatchStartDate"] = f"15 Oct {year}"
+        competitions.append(comp)
+    return {**template, "competition": competitions, "livecompetition": []}
+
+
+def run(scale: float = 1.0) -> List[Dict[str, Any]]:
+    client = BCCIApiClient()
+    runs = max(5, int(200 * scale))
+    results = []
+
+    for path in sorted(FIXTURES.glob("*.js")):
+        raw = path.read_bytes()
+        samples = time_call(lambda: client._parse_jsonp(raw), runs)
+        results.append(
+            summarize(f"parse_jsonp[{path.name}]", "parse", samples, bytes=len(raw))
+        )
+
+    standings = client._parse_jsonp((FIXTURES / "standings.js").read_bytes())
+    samples = time_call(
+        lambda: simplify_standings(filter_tournament_standings(standings)), runs
+    )
+    results.append(summarize("filter_and_simplify_standings", "filter", samples))
+
+    schedule = client._parse_jsonp((FIXTURES / "intl_schedule.js").read_bytes())
+    for status in ["upcoming", "live", "post"]:
+        samples = time_call(lambda: filter_matches_by_status(schedule, status), runs)
+        results.append(
+            summarize(f"filter_matches_by_status[{status}]", "filter", samples)
+        )
+
+    template = client._parse_jsonp((FIXTURES / "competitions.js").read_bytes())
+    for size in [1000, 10000]:
+        catalog = synthetic_catalog(template, size)
+        samples = time_call(
+            lambda: CompetitionIndex(catalog, "domestic"), max(3, runs // 20), warmup=1
+        )
+        results.append(summarize(f"build_index[{size}]", "search", samples))
+
+        index = CompetitionIndex(catalog, "domestic")
+        for query in SEARCH_QUERIES:
+            samples = time_call(
+                lambda: summarize_competitions(
+                    index.search(query, limit=10), circuit="domestic"
+                ),
+                runs,
+            )
+            results.append(
+                summarize(f"search_competitions[{size}:{query}]", "search", samples)
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,73 @@
+"""
+Compares BCCIApiClient._parse_jsonp against the previous str-based parser
+on the feeds in tests/fixtures.
+
+Usage:
+    uv run python benchmarks/bench_parse.py
+    uv run --with orjson python benchmarks/bench_parse.py
+"""
+
+import json
+import timeit
+import tracemalloc
+from pathlib import Path
+
+from bcci_tv.api import client as client_module
+from bcci_tv.api.client import BCCIApiClient
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def legacy_parse_jsonp(text: str):
+    """The original parser: decodes to str, strips, slices and uses stdlib json."""
+    text = text.strip()
+    if text.startswith(("{", "[")):
+        return json.loads(text)
+    start = text.find("(")
+    end = text.rfind(")")
+    if start != -1 and end != -1:
+        return json.loads(text[start + 1 : end])
+    return json.loads(text)
+
+
+def main():
+    client = BCCIApiClient()
+    backend = "orjson" if client_module.orjson is not None else "json"
+    print(f"JSON backend: {backend}")
+    print(
+        f"{'fixture':<22} {'size':>8} {'legacy ms':>10} {'bytes ms':>10} {'speedup':>8}"
+    )
+
+    for path in sorted(FIXTURES.glob("*.js")):
+        raw = path.read_bytes()
+        number = 200
+
+        # The legacy path includes the bytes -> str decode that response.text did
+        legacy = timeit.timeit(
+            lambda: legacy_parse_jsonp(raw.decode("utf-8")), number=number
+        )
+        current = timeit.timeit(lambda: client._parse_jsonp(raw), number=number)
+
+        assert legacy_parse_jsonp(raw.decode("utf-8")) == client._parse_jsonp(raw)
+        print(
+            f"{path.name:<22} {len(raw):>8} {legacy / number * 1000:>10.3f} "
+            f"{current / number * 1000:>10.3f} {legacy / current:>7.2f}x"
+        )
+
+    # Memory kept per cached innings, with and without the scorecard projection
+    raw = (FIXTURES / "match_innings1.js").read_bytes()
+    fields = [f"Innings1.{field}" for field in BCCIApiClient.SCORECARD_FIELDS]
+    for label, kwargs in [("full", {}), ("projected", {"fields": fields})]:
+        tracemalloc.start()
+        data = client._parse_jsonp(raw, **kwargs)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del data
+        print(
+            f"match_innings1.js {label:<10} retained {retained / 1024:>8.1f} KiB "
+            f"peak {peak / 1024:>8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+End-to-end latency of every MCP tool against a local stub upstream
+(bcci_tv.api.stub.StubUpstream serving tests/fixtures), so results don't
+depend on the network.
+
+Each tool is measured cold (fresh client, empty caches) and warm (repeat
+calls on the shared client). --latency adds a per-request upstream delay.
+
+Run through benchmarks/run.py, or on their own:
+    uv run python benchmarks/bench_tools.py
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from harness import FIXTURES, summarize, time_async
+
+from bcci_tv.api.stub import StubUpstream
+
+ToolCall = Tuple[str, Callable[[], Awaitable[Any]]]
+
+
+def tool_calls() -> List[ToolCall]:
+    """One representative call per MCP tool, with IDs present in the fixtures."""
+    from bcci_tv.mcp import server
+
+    return [
+        ("search_competitions", lambda: server.search_competitions.fn("ranji")),
+        ("get_live_tournaments", lambda: server.get_live_tournaments.fn("domestic")),
+        (
+            "get_tournament_details",
+            lambda: server.get_tournament_details.fn(326, "domestic"),
+        ),
+        (
+            "get_tournament_schedule",
+            lambda: server.get_tournament_schedule.fn(236, "international", "upcoming"),
+        ),
+        ("get_tournament_standings", lambda: server.get_tournament_standings.fn(326)),
+        (
+            "get_domestic_match_summary",
+            lambda: server.get_domestic_match_summary.fn(15629),
+        ),
+        (
+            "get_domestic_match_summary[innings]",
+            lambda: server.get_domestic_match_summary.fn(15629, innings=1),
+        ),
+        ("get_intl_match_summary", lambda: server.get_intl_match_summary.fn(2014)),
+        (
+            "get_intl_match_summary[innings]",
+            lambda: server.get_intl_match_summary.fn(2014, innings=1),
+        ),
+        (
+            "get_match_summaries",
+            lambda: server.get_match_summaries.fn([15629, 15630, 15631], "domestic"),
+        ),
+        ("get_team_history", lambda: server.get_team_history.fn("India")),
+        ("get_player_history", lambda: server.get_player_history.fn("Arpit")),
+    ]
+
+
+async def _run(scale: float, latency: float) -> List[Dict[str, Any]]:
+    from bcci_tv.mcp import session
+
+    home = Path(os.environ["HOME"])
+    cold_runs = max(3, int(20 * scale))
+    warm_runs = max(5, int(100 * scale))
+
+    async def reset():
+        await session.close_client()
+        shutil.rmtree(home / ".bcci-tv", ignore_errors=True)
+
+    results = []
+    with StubUpstream(fixtures_dir=FIXTURES, latency=latency) as stub:
+        os.environ["BCCI_TV_UPSTREAM_URL"] = stub.url
+        for name, call in tool_calls():
+            requests = stub.requests
+            samples = await time_async(call, cold_runs, before=reset)
+            results.append(
+                summarize(
+                    f"tool[{name}]:cold",
+                    "tools",
+                    samples,
+                    upstream_requests=(stub.requests - requests) / (cold_runs + 1),
+                )
+            )
+
+            await reset()
+            # Populates the team and player history the store-backed tools read
+            for populate_name, populate in tool_calls():
+                if populate_name != name:
+                    await populate()
+            requests = stub.requests
+            samples = await time_async(call, warm_runs)
+            results.append(
+                summarize(
+                    f"tool[{name}]:warm",
+                    "tools",
+                    samples,
+                    upstream_requests=(stub.requests - requests) / (warm_runs + 1),
+                )
+            )
+        await session.close_client()
+    return results
+
+
+def run(scale: float = 1.0, latency: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Measures every tool with caches and the local store under a temporary
+    home directory, leaving the real ~/.bcci-tv untouched.
+    """
+    saved = dict(os.environ)
+    home = tempfile.mkdtemp(prefix="bcci-tv-bench-")
+    os.environ.update(
+        HOME=home,
+        BCCI_TV_WARMUP="0",
+        BCCI_TV_STORE_PATH=str(Path(home) / ".bcci-tv" / "store.db"),
+        # The stub is local: don't let rate limiting dominate the numbers
+        BCCI_TV_RATE_LIMIT="100000",
+        BCCI_TV_RATE_BURST="100000",
+    )
+    try:
+        return asyncio.run(_run(scale, latency))
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
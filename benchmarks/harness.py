@@ -0,0 +1,136 @@
+"""
+Timing, result and comparison helpers shared by the benchmark suite.
+
+Results are plain dicts so they can be written as JSON and diffed between
+releases: {"name", "group", "runs", "mean_ms", "median_ms", "p95_ms",
+"min_ms", "max_ms", ...extra}.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from bcci_tv.api import client as client_module
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "tests" / "fixtures"
+
+
+def summarize(
+    name: str, group: str, samples: List[float], **extra: Any
+) -> Dict[str, Any]:
+    """Builds a result from per-run durations in seconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "name": name,
+        "group": group,
+        "runs": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "p95_ms": round(p95 * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+        **extra,
+    }
+
+
+def time_call(fn: Callable[[], Any], runs: int, warmup: int = 3) -> List[float]:
+    """Times runs calls of fn, after warmup untimed calls."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def time_async(
+    fn: Callable[[], Awaitable[Any]],
+    runs: int,
+    warmup: int = 1,
+    before: Optional[Callable[[], Awaitable[Any]]] = None,
+) -> List[float]:
+    """
+    Times runs awaits of fn, after warmup untimed ones. before, if given,
+    is awaited (untimed) ahead of every run, e.g. to reset caches.
+    """
+    for _ in range(warmup):
+        if before is not None:
+            await before()
+        await fn()
+    samples = []
+    for _ in range(runs):
+        if before is not None:
+            await before()
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Describes the machine and build the results were measured on."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "json_backend": "orjson" if client_module.orjson is not None else "json",
+    }
+
+
+def write_results(path: Path, results: List[Dict[str, Any]]):
+    payload = {"environment": environment(), "results": results}
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def compare(
+    baseline: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    threshold: float = 1.25,
+    metric: str = "median_ms",
+) -> List[Dict[str, Any]]:
+    """
+    Returns the benchmarks whose metric grew by more than threshold times
+    its baseline value. Benchmarks missing from either side are ignored.
+    """
+    previous = {r["name"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result["name"])
+        if before is None or not before.get(metric):
+            continue
+        ratio = result[metric] / before[metric]
+        if ratio > threshold:
+            regressions.append(
+                {
+                    "name": result["name"],
+                    "baseline": before[metric],
+                    "current": result[metric],
+                    "ratio": round(ratio, 2),
+                }
+            )
+    return regressions
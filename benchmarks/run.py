@@ -0,0 +1,80 @@
+"""
+Runs the benchmark suite and writes machine-readable results.
+
+Usage:
+    uv run python benchmarks/run.py -o results.json
+    uv run python benchmarks/run.py --compare baseline.json --threshold 1.25
+    uv run python benchmarks/run.py --only parse,filter --scale 0.1
+
+Groups: parse, filter, search (bench_data.py) and tools (bench_tools.py).
+With --compare, exits with status 1 if any benchmark's median is more than
+--threshold times its baseline, so it can gate a release.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import bench_data
+import bench_tools
+from harness import compare, write_results
+
+GROUPS = ["parse", "filter", "search", "tools"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", type=Path, help="Write results as JSON.")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio reported as a regression.",
+    )
+    parser.add_argument(
+        "--only", help=f"Comma-separated groups to run ({', '.join(GROUPS)})."
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplier for the number of runs."
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds of stub upstream latency for the tools group.",
+    )
+    args = parser.parse_args()
+
+    groups = set(args.only.split(",")) if args.only else set(GROUPS)
+    results = []
+    if groups & {"parse", "filter", "search"}:
+        results += [r for r in bench_data.run(scale=args.scale) if r["group"] in groups]
+    if "tools" in groups:
+        results += bench_tools.run(scale=args.scale, latency=args.latency)
+
+    print(f"{'benchmark':<58} {'median ms':>10} {'p95 ms':>10}")
+    for r in results:
+        print(f"{r['name']:<58} {r['median_ms']:>10.3f} {r['p95_ms']:>10.3f}")
+
+    if args.output:
+        write_results(args.output, results)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(baseline, results, threshold=args.threshold)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['name']}: {r['baseline']:.3f} -> "
+                f"{r['current']:.3f} ms ({r['ratio']}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
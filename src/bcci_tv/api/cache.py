@@ -0,0 +1,477 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks (Windows): shared mode falls back to atomic writes only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Default size limit of the on-disk feed cache
+CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Last access time of each cached feed, for LRU eviction
+MANIFEST_NAME = ".manifest.json"
+
+
+def _encode(data: Any) -> bytes:
+    return zlib.compress(json.dumps(data).encode("utf-8"))
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """
+    Writes a file through a temporary file and a rename, so concurrent
+    readers (in this or another process) never see a partial file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _decode(raw: bytes) -> Any:
+    # zlib streams start with 0x78; anything else is a plain JSON file written
+    # before entries were compressed
+    if raw[:1] == b"\x78":
+        raw = zlib.decompress(raw)
+    return json.loads(raw)
+
+
+class CacheEntry(NamedTuple):
+    """A cached feed together with the HTTP validators it was served with."""
+
+    data: Any
+    validators: Dict[str, str]
+    mtime: float
+
+
+class FeedCache:
+    """
+    Two-tier cache for parsed API feeds.
+
+    Entries are stored as zlib-compressed JSON files in the cache directory.
+    Parsed copies are also kept in memory, keyed by the file's mtime, so
+    repeat lookups skip the file read and decode until the file changes or
+    its TTL expires.
+
+    HTTP validators (ETag / Last-Modified) are kept in a sidecar
+    "<name>.meta" file so expired entries can be revalidated with a
+    conditional GET instead of being re-downloaded.
+
+    The directory is kept under max_bytes: when a write goes over it, the
+    least recently used entries are evicted. Access times are kept in a
+    manifest file (mtimes can't be used, they track freshness). Writes keep
+    a running size total, so the directory is only rescanned (and the
+    manifest saved) when the limit is crossed or every PRUNE_INTERVAL
+    seconds, which also picks up entries written by other processes.
+
+    Files are replaced atomically, so several processes can share a cache
+    directory. In shared mode, lock() also holds an advisory file lock, so
+    one process refreshes a feed while the others wait for its result.
+    """
+
+    # Seconds between attempts to take a contended lock
+    LOCK_POLL_INTERVAL = 0.05
+
+    # Seconds between directory rescans while under the size limit
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = 86400,
+        max_bytes: int = CACHE_MAX_BYTES,
+        shared: bool = False,
+        lock_timeout: float = 30.0,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.lock_timeout = lock_timeout
+        self._memory: Dict[str, CacheEntry] = {}
+        self._access: Optional[Dict[str, float]] = None
+        # On-disk size of each entry as of the last prune plus later writes
+        self._sizes: Optional[Dict[str, int]] = None
+        self._total_bytes = 0
+        self._next_prune = 0.0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.lock_waits = 0
+
+    @property
+    def access_times(self) -> Dict[str, float]:
+        """Last access time of each entry, loaded from the manifest on first use."""
+        if self._access is None:
+            try:
+                with open(self.cache_dir / MANIFEST_NAME, "r") as f:
+                    self._access = {k: float(v) for k, v in json.load(f).items()}
+            except FileNotFoundError:
+                self._access = {}
+            except Exception as e:
+                logger.warning(f"Failed to read cache manifest: {e}")
+                self._access = {}
+        return self._access
+
+    def _record_access(self, name: str):
+        self.access_times[name] = time.time()
+
+    def _merge_manifest(self):
+        """Picks up later access times recorded by other processes."""
+        try:
+            with open(self.cache_dir / MANIFEST_NAME, "r") as f:
+                on_disk = json.load(f)
+        except Exception:
+            return
+        access = self.access_times
+        for name, accessed in on_disk.items():
+            if float(accessed) > access.get(name, 0.0):
+                access[name] = float(accessed)
+
+    def _save_manifest(self, names: Iterable[str]):
+        """Writes the access times of the given entries to the manifest."""
+        access = self.access_times
+        manifest = {name: access[name] for name in names if name in access}
+        try:
+            _write_atomic(
+                self.cache_dir / MANIFEST_NAME, json.dumps(manifest).encode("utf-8")
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write cache manifest: {e}")
+
+    @asynccontextmanager
+    async def lock(self, name: str) -> AsyncIterator[bool]:
+        """
+        Holds an exclusive lock on an entry across processes, in shared mode.
+        Yields True if another process held the lock and this one waited.
+
+        Waits at most lock_timeout seconds, then carries on without the lock
+        rather than stalling. Outside shared mode (or without fcntl) this
+        does nothing.
+        """
+        if not self.shared or fcntl is None:
+            yield False
+            return
+
+        lock_file = open(self.cache_dir / f".{name}.lock", "a")
+        try:
+            waited = False
+            deadline = time.monotonic() + self.lock_timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        logger.warning(f"Timed out waiting for the lock on {name}")
+                        break
+                    waited = True
+                    await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+            if waited:
+                self.lock_waits += 1
+            yield waited
+        finally:
+            # Closing the file releases the lock
+            lock_file.close()
+
+    def _load(self, name: str) -> Optional[CacheEntry]:
+        """Returns the entry for name regardless of age, or None if missing."""
+        cache_file = self.cache_dir / name
+        try:
+            mtime = cache_file.stat().st_mtime
+        except OSError:
+            self._memory.pop(name, None)
+            return None
+
+        entry = self._memory.get(name)
+        if entry is not None and entry.mtime == mtime:
+            return entry
+
+        try:
+            with open(cache_file, "rb") as f:
+                data = _decode(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to read cache {name}: {e}")
+            return None
+
+        validators = {}
+        meta_file = self.cache_dir / f"{name}.meta"
+        if meta_file.exists():
+            try:
+                with open(meta_file, "r") as f:
+                    validators = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to read cache metadata {name}: {e}")
+
+        entry = CacheEntry(data, validators, mtime)
+        self._memory[name] = entry
+        return entry
+
+    def get(self, name: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Returns the cached data for name, or None if it is missing or older
+        than ttl (defaults to the cache-wide TTL).
+        """
+        ttl = self.ttl if ttl is None else ttl
+        cached = self._memory.get(name)
+        entry = self._load(name)
+        if entry is None or (time.time() - entry.mtime) >= ttl:
+            self.misses += 1
+            return None
+
+        if entry is cached:
+            self.memory_hits += 1
+        else:
+            self.disk_hits += 1
+        self._record_access(name)
+        return entry.data
+
+    def get_stale(self, name: str) -> Optional[CacheEntry]:
+        """Returns the entry for name even if it has expired, for revalidation."""
+        entry = self._load(name)
+        if entry is not None:
+            self._record_access(name)
+        return entry
+
+    def set(self, name: str, data: Any, validators: Optional[Dict[str, str]] = None):
+        """Stores data (and optional HTTP validators) on disk and in memory."""
+        cache_file = self.cache_dir / name
+        meta_file = self.cache_dir / f"{name}.meta"
+        validators = validators or {}
+        try:
+            # Validators go first: a reader never pairs new data with old ones
+            meta = json.dumps(validators).encode("utf-8") if validators else b""
+            if validators:
+                _write_atomic(meta_file, meta)
+            else:
+                meta_file.unlink(missing_ok=True)
+            payload = _encode(data)
+            _write_atomic(cache_file, payload)
+            mtime = cache_file.stat().st_mtime
+            self._memory[name] = CacheEntry(data, validators, mtime)
+        except Exception as e:
+            logger.warning(f"Failed to write cache {name}: {e}")
+            self._memory.pop(name, None)
+            return
+        self._record_access(name)
+        if self._sizes is not None:
+            size = len(payload) + len(meta)
+            self._total_bytes += size - self._sizes.get(name, 0)
+            self._sizes[name] = size
+        if (
+            self._sizes is None
+            or self._total_bytes > self.max_bytes
+            or time.monotonic() >= self._next_prune
+        ):
+            self.prune(keep=name)
+
+    def touch(self, name: str):
+        """Marks an entry as fresh again after the server confirmed it is unchanged."""
+        entry = self._load(name)
+        if entry is None:
+            return
+        cache_file = self.cache_dir / name
+        try:
+            cache_file.touch()
+            mtime = cache_file.stat().st_mtime
+        except OSError as e:
+            logger.warning(f"Failed to refresh cache {name}: {e}")
+            return
+        self._memory[name] = entry._replace(mtime=mtime)
+        self._record_access(name)
+        self.revalidations += 1
+
+    def _entry_sizes(self) -> Dict[str, int]:
+        """On-disk size of each entry, including its validators file."""
+        sizes: Dict[str, int] = {}
+        try:
+            files = list(os.scandir(self.cache_dir))
+        except OSError:
+            return sizes
+        for f in files:
+            if f.name.startswith(".") or not f.is_file():
+                continue
+            name = f.name[: -len(".meta")] if f.name.endswith(".meta") else f.name
+            try:
+                sizes[name] = sizes.get(name, 0) + f.stat().st_size
+            except OSError:
+                continue
+        return sizes
+
+    def remove(self, name: str):
+        """Deletes an entry and its validators from disk and memory."""
+        for path in (self.cache_dir / name, self.cache_dir / f"{name}.meta"):
+            path.unlink(missing_ok=True)
+        self._memory.pop(name, None)
+        self.access_times.pop(name, None)
+        if self._sizes is not None:
+            self._total_bytes -= self._sizes.pop(name, 0)
+
+    def prune(
+        self, max_bytes: Optional[int] = None, keep: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Evicts the least recently used entries until the cache fits in
+        max_bytes (defaults to the cache's limit). The entry named keep is
+        never evicted. Returns the number of entries and bytes removed.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        sizes = self._entry_sizes()
+        total = sum(sizes.values())
+        removed = {"entries": 0, "bytes": 0}
+        evicted = set()
+        self._merge_manifest()
+        if total > max_bytes:
+            access = self.access_times
+            # Entries missing from the manifest fall back to their mtime
+            order = sorted(
+                (n for n in sizes if n != keep),
+                key=lambda n: access.get(n) or self._mtime(n),
+            )
+            for name in order:
+                if total <= max_bytes:
+                    break
+                try:
+                    self.remove(name)
+                except OSError as e:
+                    logger.warning(f"Failed to evict cache {name}: {e}")
+                    continue
+                total -= sizes[name]
+                evicted.add(name)
+                removed["entries"] += 1
+                removed["bytes"] += sizes[name]
+            self.evictions += removed["entries"]
+
+        # Forget entries deleted from disk by someone else
+        for name in set(self.access_times) - set(sizes):
+            del self.access_times[name]
+        self._sizes = {n: size for n, size in sizes.items() if n not in evicted}
+        self._total_bytes = total
+        self._next_prune = time.monotonic() + self.PRUNE_INTERVAL
+        self._save_manifest(self._sizes)
+        return removed
+
+    def flush(self):
+        """Saves the access times recorded since the last prune to the manifest."""
+        if self._sizes is None:
+            return
+        self._merge_manifest()
+        self._save_manifest(self._sizes)
+
+    def _mtime(self, name: str) -> float:
+        try:
+            return (self.cache_dir / name).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def usage(self) -> Dict[str, int]:
+        """Returns the number of entries on disk, their size and the size limit."""
+        sizes = self._entry_sizes()
+        return {
+            "entries": len(sizes),
+            "bytes": sum(sizes.values()),
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "lock_waits": self.lock_waits,
+        }
+
+    def clear_memory(self):
+        """Drops the in-memory tier, forcing the next lookups to read from disk."""
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters for both tiers."""
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+
+class MemoryCache:
+    """
+    Bounded in-memory cache with a per-entry TTL.
+
+    Entries stored with ttl=None never expire; once max_entries is reached
+    the least recently used entry is evicted. Expired entries are kept until
+    then, so get_stale() can still serve them when a refresh fails.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        # key -> (stored at, expires at, value), on the monotonic clock
+        self._entries: OrderedDict[Hashable, Tuple[float, Optional[float], Any]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        _, expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Stores value for ttl seconds, or indefinitely when ttl is None."""
+        now = time.monotonic()
+        expires_at = None if ttl is None else now + ttl
+        self._entries[key] = (now, expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        Returns (age in seconds, value) for key even if it has expired, or
+        None if it is missing.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, _, value = entry
+        return time.monotonic() - stored_at, value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters and the current number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
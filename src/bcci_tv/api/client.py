@@ -1,15 +1,91 @@
+import asyncio
+import hashlib
 import httpx
 import logging
 import json
+import sqlite3
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+from bcci_tv.api.cache import CACHE_MAX_BYTES, CacheEntry, FeedCache, MemoryCache
+from bcci_tv.api.index import CompetitionIndex
+from bcci_tv.api.metrics import Metrics, TemplateMatcher
+from bcci_tv.api.models import (
+    InningsRecord,
+    MatchRecord,
+    StandingRecord,
+    schedule_records,
+    standings_records,
+)
+from bcci_tv.api.projection import build_projection, project
+from bcci_tv.api.store import MatchStore
+from bcci_tv.api.throttle import RETRY_STATUS_CODES, RequestThrottle
+from bcci_tv.api.tracing import set_attribute, traced
 from bcci_tv.api.utils import filter_live_competitions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Stale feeds served in the current context, see track_staleness()
+_stale_feeds: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "stale_feeds", default=None
+)
+
+
+@contextmanager
+def track_staleness() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collects the stale feeds served by any client within the block (including
+    tasks it starts), as {"feed", "age_seconds", "reason"} dicts.
+    """
+    feeds: List[Dict[str, Any]] = []
+    token = _stale_feeds.set(feeds)
+    try:
+        yield feeds
+    finally:
+        _stale_feeds.reset(token)
+
+
+def _mark_stale(feed: str, age: float, reason: str):
+    feeds = _stale_feeds.get()
+    if feeds is not None:
+        feeds.append({"feed": feed, "age_seconds": round(age), "reason": reason})
+
+
+_WHITESPACE = frozenset(b" \t\r\n")
+_JSON_START = frozenset(b"{[")
+
+
+def _json_loads(payload: memoryview) -> Any:
+    """
+    Decodes a JSON payload, using orjson when available.
+    orjson reads the memoryview in place; for the stdlib decoder it is decoded
+    straight to str, skipping json's encoding detection and a bytes copy.
+    Both raise json.JSONDecodeError on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(str(payload, "utf-8"))
+
 
 class BCCIApiClient:
     """
@@ -18,6 +94,19 @@ class BCCIApiClient:
 
     BASE_URL = "https://scores.bcci.tv"
 
+    # Seconds past its TTL that a cached feed is still served while it is
+    # refreshed in the background (stale-while-revalidate)
+    STALE_WHILE_REVALIDATE = 86400.0
+
+    # Seconds to cache summaries and innings of matches still in progress
+    LIVE_MATCH_TTL = 15.0
+
+    # Matches fetched at once by get_match_summaries
+    MATCH_BATCH_CONCURRENCY = 8
+
+    # Innings sections kept by default; the rest of the feed is dropped at parse
+    SCORECARD_FIELDS = ["BattingCard", "BowlingCard", "Extras", "FallOfWickets"]
+
     class Endpoints:
         DOMESTIC_COMPETITIONS = "/feeds/competition.js"
         INTERNATIONAL_COMPETITIONS = "/matchcentre/mc/competition.js"
@@ -35,9 +124,99 @@ class BCCIApiClient:
     class Cache:
         DOMESTIC_COMPETITIONS = "domestic_competitions.json"
         INTERNATIONAL_COMPETITIONS = "intl_competitions.json"
+        STANDINGS = "standings_{CompetitionID}.json"
+        # Standings projected to some columns, keyed by a digest of them
+        STANDINGS_FIELDS = "standings_{CompetitionID}_{digest}.json"
+        DOMESTIC_SCHEDULE = "domestic_schedule_{CompetitionID}.json"
+        INTERNATIONAL_SCHEDULE = "intl_schedule_{CompetitionID}.json"
+
+    # Endpoints and cache filenames are labelled in metrics by their template
+    _ENDPOINT_TEMPLATES = TemplateMatcher.from_class(Endpoints)
+    _CACHE_TEMPLATES = TemplateMatcher.from_class(Cache)
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeout: float = 30.0,
+        throttle: Optional[RequestThrottle] = None,
+        store: Optional[MatchStore] = None,
+        cache_max_bytes: int = CACHE_MAX_BYTES,
+        shared_cache: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        batch_concurrency: int = MATCH_BATCH_CONCURRENCY,
+    ):
+        """
+        Creates a client with its own connection pool, or shares an existing one.
+
+        Args:
+            http_client: An existing httpx.AsyncClient to share. The caller keeps
+                ownership and must close it; close() on this client leaves it open.
+            limits: Connection pool limits used when creating a new pool.
+            timeout: Request timeout in seconds used when creating a new pool.
+            throttle: Rate limiting, retry and concurrency policy for upstream
+                requests. Defaults to a RequestThrottle with default settings.
+            store: Local SQLite store fed with every catalog, schedule and
+                match feed fetched, for history queries. Disabled by default.
+            cache_max_bytes: Size limit of the on-disk feed cache; least
+                recently used feeds are evicted beyond it.
+            shared_cache: Set when several processes share the cache
+                directory, so only one of them refreshes a given feed at a time.
+            transport: httpx transport used when creating a new pool, e.g. a
+                CassetteTransport to record or replay responses. limits only
+                apply to the default transport.
+            batch_concurrency: Matches fetched at once by get_match_summaries.
+        """
+        if http_client is None:
+            self.client = self.create_http_client(
+                limits=limits, timeout=timeout, transport=transport
+            )
+            self._owns_client = True
+        else:
+            self.client = http_client
+            self._owns_client = False
+        self.throttle = throttle or RequestThrottle()
+        self._feed_cache: Optional[FeedCache] = None
+        self.cache_max_bytes = cache_max_bytes
+        self.shared_cache = shared_cache
+        self.batch_concurrency = batch_concurrency
+        self._competition_indexes: Dict[str, CompetitionIndex] = {}
+        self.match_cache = MemoryCache()
+        # Records built from feeds, keyed by feed kind and arguments, with the
+        # feed object they were built from
+        self._records = MemoryCache()
+        # (circuit, match_id) -> (CurrentInnings, IsMatchEnd) from the last summary
+        self._match_states: Dict[Tuple[str, int], Tuple[int, bool]] = {}
+        # In-flight fetches keyed by (endpoint, headers, fields), for coalescing
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Background refreshes of stale feeds, keyed by cache filename
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self.store = store
+        # Last feed object written to the store per key, so unchanged feeds
+        # (served from cache) aren't written again
+        self._stored_feeds: Dict[Tuple, Any] = {}
+        self.metrics = Metrics()
+        self.upstream_requests = 0
+        self.coalesced_requests = 0
+        self.stale_served = 0
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(base_url=self.BASE_URL, timeout=30.0)
+    @classmethod
+    def create_http_client(
+        cls,
+        limits: Optional[httpx.Limits] = None,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Creates a pooled HTTP client with keep-alive, suitable for sharing
+        across several BCCIApiClient instances.
+        """
+        return httpx.AsyncClient(
+            base_url=cls.BASE_URL,
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            transport=transport,
+        )
 
     def _get_cache_dir(self) -> Path:
         """Determines the local cache directory."""
@@ -45,38 +224,170 @@ class BCCIApiClient:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
+    @property
+    def cache(self) -> FeedCache:
+        """The two-tier (memory + disk) cache used for catalog feeds."""
+        if self._feed_cache is None:
+            self._feed_cache = FeedCache(
+                self._get_cache_dir(),
+                max_bytes=self.cache_max_bytes,
+                shared=self.shared_cache,
+            )
+        return self._feed_cache
+
     @classmethod
     def get_full_url(cls, endpoint: str) -> str:
         """Helper to construct full URLs for testing or logging."""
         return f"{cls.BASE_URL.rstrip('/')}/{endpoint.lstrip('/')}"
 
+    @traced(attributes=("cache_filename", "use_cache", "ttl"))
     async def _get_cached_feed(
-        self, endpoint: str, cache_filename: str, use_cache: bool = True
+        self,
+        endpoint: str,
+        cache_filename: str,
+        use_cache: bool = True,
+        ttl: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Generic helper to fetch and cache API feeds.
-        """
-        cache_file = self._get_cache_dir() / cache_filename
 
-        if use_cache and cache_file.exists():
-            if (time.time() - cache_file.stat().st_mtime) < 86400:
-                try:
-                    with open(cache_file, "r") as f:
-                        return json.load(f)
-                except Exception as e:
-                    logger.warning(f"Failed to read cache {cache_filename}: {e}")
+        A fresh cached copy is returned as-is when use_cache is set. A copy
+        that expired less than STALE_WHILE_REVALIDATE seconds ago is also
+        returned immediately, and refreshed in the background. Otherwise the
+        feed is revalidated with a conditional GET using the stored
+        ETag / Last-Modified validators, and a 304 reuses the cached copy.
+        With ttl=0 every call revalidates; such feeds are only stored when
+        the server sends validators.
 
-        response = await self._make_request("GET", endpoint)
-        data = self._parse_jsonp(response.text)
+        If upstream is unreachable or failing, the cached copy is served
+        instead. Stale copies are reported through track_staleness().
+
+        If fields are given, the feed is projected to them as it is parsed,
+        and the projected copy is what gets cached under cache_filename.
+        """
+        feed = self._CACHE_TEMPLATES.match(cache_filename)
+        if use_cache:
+            data = self.cache.get(cache_filename, ttl=ttl)
+            if data is not None:
+                self._record_cache(feed, "hit")
+                return data
+
+        stale = self.cache.get_stale(cache_filename)
+        age = time.time() - stale.mtime if stale is not None else 0.0
+        max_stale_age = (
+            self.cache.ttl if ttl is None else ttl
+        ) + self.STALE_WHILE_REVALIDATE
+        if stale is not None and use_cache and ttl != 0 and age < max_stale_age:
+            self._refresh_in_background(endpoint, cache_filename, ttl, fields)
+            self.stale_served += 1
+            self._record_cache(feed, "stale")
+            _mark_stale(cache_filename, age, "refreshing in the background")
+            return stale.data
 
         try:
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
-        except Exception as e:
-            logger.warning(f"Failed to write cache {cache_filename}: {e}")
+            data = await self._revalidate_feed(endpoint, cache_filename, ttl, fields)
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            if stale is None or not self._is_upstream_failure(e):
+                raise
+            logger.warning(f"Serving stale {cache_filename} after upstream error: {e}")
+            self.stale_served += 1
+            self._record_cache(feed, "stale")
+            _mark_stale(cache_filename, age, "upstream unavailable")
+            return stale.data
+        self._record_cache(feed, "miss")
+        return data
+
+    @staticmethod
+    def _is_upstream_failure(error: Exception) -> bool:
+        """True for errors that a cached copy should paper over."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRY_STATUS_CODES
+        return True
+
+    @traced(attributes=("cache_filename",))
+    async def _revalidate_feed(
+        self,
+        endpoint: str,
+        cache_filename: str,
+        ttl: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetches a feed with a conditional GET and updates the cache.
+
+        With a shared cache, only one process refreshes a feed at a time; the
+        others wait and reuse its result.
+        """
+        started = time.time()
+        async with self.cache.lock(cache_filename) as waited:
+            stale = self.cache.get_stale(cache_filename)
+            if waited and stale is not None and stale.mtime >= started:
+                # Refreshed by another process while this one waited
+                return stale.data
+            return await self._fetch_into_cache(
+                endpoint, cache_filename, ttl, stale, fields
+            )
 
+    async def _fetch_into_cache(
+        self,
+        endpoint: str,
+        cache_filename: str,
+        ttl: Optional[float],
+        stale: Optional[CacheEntry],
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        headers = {}
+        if stale is not None:
+            if "etag" in stale.validators:
+                headers["If-None-Match"] = stale.validators["etag"]
+            if "last_modified" in stale.validators:
+                headers["If-Modified-Since"] = stale.validators["last_modified"]
+
+        response, data = await self._fetch_feed(
+            endpoint, headers=headers, fields=fields
+        )
+        feed = self._CACHE_TEMPLATES.match(cache_filename)
+        if response.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            self.cache.touch(cache_filename)
+            self._record_cache(feed, "revalidated")
+            return stale.data
+        self._record_cache(feed, "refreshed")
+
+        validators = {}
+        if "etag" in response.headers:
+            validators["etag"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["last_modified"] = response.headers["last-modified"]
+        if validators or ttl != 0:
+            self.cache.set(cache_filename, data, validators=validators)
         return data
 
+    def _refresh_in_background(
+        self,
+        endpoint: str,
+        cache_filename: str,
+        ttl: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Starts revalidating a feed unless a refresh is already running."""
+        if cache_filename in self._refreshes:
+            return
+
+        def done(task: asyncio.Task):
+            self._refreshes.pop(cache_filename, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    f"Background refresh of {cache_filename} failed: {task.exception()}"
+                )
+
+        task = asyncio.create_task(
+            self._revalidate_feed(endpoint, cache_filename, ttl, fields)
+        )
+        self._refreshes[cache_filename] = task
+        task.add_done_callback(done)
+
+    @traced(attributes=("use_cache",))
     async def get_domestic_competitions(self, use_cache: bool = True) -> Dict[str, Any]:
         """Fetches domestic competitions."""
         return await self._get_cached_feed(
@@ -85,6 +396,7 @@ class BCCIApiClient:
             use_cache,
         )
 
+    @traced(attributes=("use_cache",))
     async def get_international_competitions(
         self, use_cache: bool = True
     ) -> Dict[str, Any]:
@@ -95,6 +407,7 @@ class BCCIApiClient:
             use_cache,
         )
 
+    @traced(attributes=("circuit",))
     async def get_live_tournaments(
         self, circuit: str = "domestic"
     ) -> List[Dict[str, Any]]:
@@ -107,32 +420,102 @@ class BCCIApiClient:
             data = await self.get_domestic_competitions(use_cache=False)
         return filter_live_competitions(data)
 
+    @traced(attributes=("circuit", "use_cache"))
+    async def get_competition_index(
+        self, circuit: str, use_cache: bool = True
+    ) -> CompetitionIndex:
+        """
+        Returns the ID index for a circuit's competition catalog.
+        The index is rebuilt only when the underlying catalog changes.
+        """
+        circuit = "international" if circuit == "international" else "domestic"
+        if circuit == "international":
+            data = await self.get_international_competitions(use_cache=use_cache)
+        else:
+            data = await self.get_domestic_competitions(use_cache=use_cache)
+
+        index = self._competition_indexes.get(circuit)
+        if index is None or index.source is not data:
+            index = CompetitionIndex(data, circuit)
+            self._competition_indexes[circuit] = index
+            await self._feed_store(("catalog", circuit), data, "add_catalog", circuit)
+        return index
+
+    @traced(attributes=("competition_id", "circuit"))
     async def get_competition_details(
         self, competition_id: int, circuit: str
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves full details for a specific competition from the specified circuit catalog.
         """
-        if circuit == "international":
-            data = await self.get_international_competitions()
-        else:
-            data = await self.get_domestic_competitions()
+        index = await self.get_competition_index(circuit)
+        return index.get(competition_id)
+
+    @traced(attributes=("circuit",))
+    async def resolve_competitions(
+        self, competition_ids: Iterable[int], circuit: Optional[str] = None
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Resolves many competition IDs to their details in one pass.
 
-        all_comps = data.get("competition", [])
-        str_id = str(competition_id)
-        for comp in all_comps:
-            if str(comp.get("CompetitionID")) == str_id:
-                return comp
+        If circuit is not provided, the domestic catalog is checked first,
+        followed by international. Unknown IDs map to None.
+        """
+        circuits = [circuit] if circuit else ["domestic", "international"]
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        for competition_id in competition_ids:
+            results[competition_id] = None
+
+        for c in circuits:
+            pending = [cid for cid, comp in results.items() if comp is None]
+            if not pending:
+                break
+            index = await self.get_competition_index(c)
+            for cid in pending:
+                results[cid] = index.get(cid)
+
+        return results
+
+    @traced(attributes=("competition_id",))
+    async def get_competition_circuit(self, competition_id: int) -> Optional[str]:
+        """
+        Returns the circuit ('domestic' or 'international') a competition ID
+        belongs to, checking domestic first, or None if it is unknown.
+        """
+        for circuit in ["domestic", "international"]:
+            index = await self.get_competition_index(circuit)
+            if competition_id in index:
+                return circuit
         return None
 
-    async def get_tournament_standings(self, competition_id: int) -> Dict[str, Any]:
+    @traced(attributes=("competition_id", "fields"))
+    async def get_tournament_standings(
+        self, competition_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
         """
         Fetches standings for a specific tournament.
+
+        If fields (standings columns such as "TeamName") are given, each row
+        of "points" is cut down to those columns, plus the Category and
+        OrderNo needed to group and rank it, as the feed is parsed.
         """
         endpoint = self.Endpoints.STANDINGS.format(CompetitionID=competition_id)
-        response = await self._make_request("GET", endpoint)
-        return self._parse_jsonp(response.text)
+        projection = None
+        if fields is None:
+            cache_filename = self.Cache.STANDINGS.format(CompetitionID=competition_id)
+        else:
+            columns = ["Category", "OrderNo", *fields]
+            projection = ["category", *(f"points.{column}" for column in columns)]
+            digest = hashlib.sha1(",".join(columns).encode()).hexdigest()[:12]
+            cache_filename = self.Cache.STANDINGS_FIELDS.format(
+                CompetitionID=competition_id, digest=digest
+            )
+        # Standings change during a tournament, so always revalidate.
+        return await self._get_cached_feed(
+            endpoint, cache_filename, ttl=0, fields=projection
+        )
 
+    @traced(attributes=("competition_id", "circuit"))
     async def get_tournament_schedule(
         self, competition_id: int, circuit: str
     ) -> Dict[str, Any]:
@@ -143,131 +526,537 @@ class BCCIApiClient:
             endpoint = self.Endpoints.INTERNATIONAL_SCHEDULE.format(
                 CompetitionID=competition_id
             )
+            cache_filename = self.Cache.INTERNATIONAL_SCHEDULE.format(
+                CompetitionID=competition_id
+            )
         else:
             endpoint = self.Endpoints.DOMESTIC_SCHEDULE.format(
                 CompetitionID=competition_id
             )
+            cache_filename = self.Cache.DOMESTIC_SCHEDULE.format(
+                CompetitionID=competition_id
+            )
 
-        response = await self._make_request("GET", endpoint)
-        return self._parse_jsonp(response.text)
+        # Schedules change as matches progress, so always revalidate.
+        data = await self._get_cached_feed(endpoint, cache_filename, ttl=0)
+        await self._feed_store(
+            ("schedule", circuit, competition_id),
+            data,
+            "add_schedule",
+            circuit,
+            competition_id,
+        )
+        return data
 
+    @traced(attributes=("match_id", "innings"))
     async def get_domestic_match_summary(
-        self, match_id: int, innings: Optional[int] = None
+        self,
+        match_id: int,
+        innings: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Fetches the match summary for a domestic match.
-        If innings is provided (1-4), fetches details for that specific innings.
+        If innings is provided (1-4), fetches details for that specific innings,
+        keeping only the given innings fields (defaults to SCORECARD_FIELDS).
         """
-        if innings is not None and (innings < 1 or innings > 4):
-            raise ValueError("Innings must be between 1 and 4")
+        fields = self._innings_fields(innings, fields)
+        cache_key = ("domestic", match_id, innings, fields)
+        cached = self._get_match_feed(cache_key)
+        if cached is not None:
+            return cached
 
         suffix = f"Innings{innings}" if innings is not None else "matchsummary"
         endpoint = self.Endpoints.DOMESTIC_MATCH_DETAILS.format(
             MatchID=match_id, suffix=suffix
         )
-        response = await self._make_request("GET", endpoint)
-        data = self._parse_jsonp(response.text)
-
-        # If a specific innings was requested, filter the nested object
-        if innings is not None:
-            innings_key = f"Innings{innings}"
-            if innings_key in data:
-                inner_data = data[innings_key]
-                keys_to_retain = [
-                    "BattingCard",
-                    "BowlingCard",
-                    "Extras",
-                    "FallOfWickets",
-                ]
-                data[innings_key] = {
-                    k: inner_data.get(k) for k in keys_to_retain if k in inner_data
-                }
-
-        return data
+        # For an innings, only the requested sections are kept
+        projection = (
+            [f"{suffix}.{field}" for field in fields] if innings is not None else None
+        )
+        return await self._fetch_match_feed(cache_key, endpoint, projection)
 
+    @traced(attributes=("match_id", "innings"))
     async def get_international_match_summary(
-        self, match_id: int, innings: Optional[int] = None
+        self,
+        match_id: int,
+        innings: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Fetches the match summary for an international match.
-        If innings is provided (1-4), fetches details for that specific innings.
+        If innings is provided (1-4), fetches details for that specific innings,
+        keeping only the given innings fields (defaults to SCORECARD_FIELDS).
         """
-        if innings is not None and (innings < 1 or innings > 4):
-            raise ValueError("Innings must be between 1 and 4")
+        fields = self._innings_fields(innings, fields)
+        cache_key = ("international", match_id, innings, fields)
+        cached = self._get_match_feed(cache_key)
+        if cached is not None:
+            return cached
 
         if innings is None:
             endpoint = self.Endpoints.INTERNATIONAL_MATCH_SUMMARY.format(
                 MatchID=match_id
             )
-            response = await self._make_request("GET", endpoint)
-            return self._parse_jsonp(response.text)
+            return await self._fetch_match_feed(cache_key, endpoint)
+
+        innings_str = f"Innings{innings}"
+        url = self.Endpoints.INTERNATIONAL_MATCH_INNINGS.format(
+            MatchID=match_id, innings_str=innings_str
+        )
+        # Only the requested sections are kept
+        projection = [f"{innings_str}.{field}" for field in fields]
+        return await self._fetch_match_feed(cache_key, url, projection)
+
+    @traced(attributes=("match_id", "circuit", "strict"))
+    async def get_full_match_summary(
+        self, match_id: int, circuit: str, strict: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fetches the overall summary of a match plus the details of every innings
+        played so far, as {"overall": {...}, "innings_details": [...]}.
+        Completed innings are served from cache, so only the live one is re-fetched.
+
+        Innings that fail to fetch are left out, unless strict is set, in which
+        case the first failure is raised instead of returning a partial match.
+        """
+        if circuit == "international":
+            fetch = self.get_international_match_summary
+        else:
+            fetch = self.get_domestic_match_summary
+
+        # Match data is nested within 'MatchSummary' list
+        overall_data = await fetch(match_id)
+        match_summary_list = overall_data.get("MatchSummary", [])
+        overall_summary = match_summary_list[0] if match_summary_list else {}
+
+        # Use CurrentInnings to determine how many innings to fetch.
+        num_innings = self._current_innings(overall_summary)
+
+        # Collect details for each innings concurrently.
+        innings_details = []
+        if num_innings > 0:
+            tasks = [fetch(match_id, i) for i in range(1, num_innings + 1)]
+            innings_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for innings, result in enumerate(innings_results, start=1):
+                if not isinstance(result, Exception):
+                    innings_details.append(result)
+                elif strict:
+                    raise result
+                else:
+                    logger.warning(
+                        f"Failed to fetch innings {innings} of match {match_id}: "
+                        f"{result}"
+                    )
+
+        return {"overall": overall_summary, "innings_details": innings_details}
+
+    @traced(attributes=("circuit", "innings"))
+    async def get_match_summaries(
+        self,
+        match_ids: Sequence[int],
+        circuit: str,
+        innings: Union[int, str, None] = "all",
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the summaries of many matches, at most `concurrency` at a time
+        (defaults to the client's batch_concurrency).
+
+        innings is "all" for the overall summary plus every innings played
+        (as get_full_match_summary), None for the overall summary only, or an
+        innings number. With "all", a match is reported as an error if any of
+        its innings could not be fetched. Results are returned in the order of match_ids, as
+        {"match_id": ..., "data": {...}} or {"match_id": ..., "error": "..."}
+        for matches that could not be fetched.
+        """
+        if innings != "all" and innings is not None and not isinstance(innings, int):
+            raise ValueError(f"innings must be 'all', None or 1-4, got {innings!r}")
+        if circuit == "international":
+            fetch = self.get_international_match_summary
+        else:
+            fetch = self.get_domestic_match_summary
+        semaphore = asyncio.Semaphore(concurrency or self.batch_concurrency)
+
+        async def fetch_one(match_id: int) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if innings == "all":
+                        data = await self.get_full_match_summary(
+                            match_id, circuit, strict=True
+                        )
+                    else:
+                        data = await fetch(match_id, innings)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch match {match_id}: {e}")
+                    return {"match_id": match_id, "error": str(e)}
+            return {"match_id": match_id, "data": data}
+
+        return await asyncio.gather(*(fetch_one(m) for m in match_ids))
+
+    # Typed records, built once per fetched feed
+
+    def _records_for(self, key: Tuple, data: Any, build: Callable[[Any], Any]) -> Any:
+        """
+        Returns the records built from data, building them only when the feed
+        object cached under key changed (a cached or revalidated feed is the
+        same object, so repeat calls skip the conversion and sorting).
+        """
+        cached = self._records.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        records = build(data)
+        self._records.set(key, (data, records))
+        return records
+
+    @traced(attributes=("competition_id",))
+    async def get_standings_records(
+        self, competition_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[StandingRecord]]:
+        """
+        Fetches standings as StandingRecords grouped by category, each group
+        ranked by OrderNo (see get_tournament_standings for fields).
+        """
+        data = await self.get_tournament_standings(competition_id, fields=fields)
+        key = ("standings", competition_id, None if fields is None else tuple(fields))
+        return self._records_for(key, data, standings_records)
+
+    @traced(attributes=("competition_id", "circuit"))
+    async def get_schedule_records(
+        self, competition_id: int, circuit: str
+    ) -> List[MatchRecord]:
+        """Fetches a tournament schedule as MatchRecords, in the feed's order."""
+        data = await self.get_tournament_schedule(competition_id, circuit)
+        key = ("schedule", circuit, competition_id)
+        return self._records_for(key, data, schedule_records)
+
+    @traced(attributes=("match_id", "circuit", "innings"))
+    async def get_innings_record(
+        self, match_id: int, circuit: str, innings: int
+    ) -> Optional[InningsRecord]:
+        """
+        Fetches an innings scorecard as an InningsRecord, or None if the feed
+        has no such innings.
+        """
+        if circuit == "international":
+            data = await self.get_international_match_summary(match_id, innings)
         else:
-            innings_str = f"Innings{innings}"
-            url = self.Endpoints.INTERNATIONAL_MATCH_INNINGS.format(
-                MatchID=match_id, innings_str=innings_str
+            data = await self.get_domestic_match_summary(match_id, innings)
+        key = ("innings", circuit, match_id, innings)
+        return self._records_for(
+            key, data, lambda d: InningsRecord.from_feed(d, innings)
+        )
+
+    def _innings_fields(
+        self, innings: Optional[int], fields: Optional[Sequence[str]]
+    ) -> Optional[Tuple[str, ...]]:
+        """Validates innings arguments and resolves the innings fields to keep."""
+        if innings is None:
+            if fields is not None:
+                raise ValueError("Fields can only be selected for a specific innings")
+            return None
+        if innings < 1 or innings > 4:
+            raise ValueError("Innings must be between 1 and 4")
+        return tuple(fields) if fields is not None else tuple(self.SCORECARD_FIELDS)
+
+    @staticmethod
+    def _current_innings(overall_summary: Dict[str, Any]) -> int:
+        """Parses CurrentInnings from a match summary, defaulting to 0."""
+        try:
+            return int(overall_summary.get("CurrentInnings", "0"))
+        except (ValueError, TypeError):
+            return 0
+
+    @staticmethod
+    def _match_feed_name(cache_key: Tuple) -> str:
+        """Metrics label of a match feed: e.g. domestic_match_summary."""
+        circuit, _, innings, _ = cache_key
+        return f"{circuit}_{'match_summary' if innings is None else 'innings'}"
+
+    def _get_match_feed(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        """Looks up a match summary or innings in the match cache."""
+        cached = self.match_cache.get(cache_key)
+        self._record_cache(
+            self._match_feed_name(cache_key), "miss" if cached is None else "hit"
+        )
+        return cached
+
+    async def _fetch_match_feed(
+        self,
+        cache_key: Tuple,
+        endpoint: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetches a match summary or innings and caches and stores it. If
+        upstream is unreachable or failing, the last copy in the match cache
+        is served instead, even if it has expired, and reported through
+        track_staleness().
+        """
+        try:
+            _, data = await self._fetch_feed(endpoint, fields=fields)
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            stale = self.match_cache.get_stale(cache_key)
+            if stale is None or not self._is_upstream_failure(e):
+                raise
+            age, data = stale
+            circuit, match_id, innings, _ = cache_key
+            label = f"{circuit} match {match_id}" + (
+                f" innings {innings}" if innings is not None else ""
             )
-            response = await self._make_request("GET", url)
-            data = self._parse_jsonp(response.text)
-
-            # Filter for specific keys
-            if innings_str in data:
-                inner_data = data[innings_str]
-                keys_to_retain = [
-                    "BattingCard",
-                    "BowlingCard",
-                    "Extras",
-                    "FallOfWickets",
-                ]
-                data[innings_str] = {
-                    k: inner_data.get(k) for k in keys_to_retain if k in inner_data
-                }
+            logger.warning(f"Serving stale {label} after upstream error: {e}")
+            self.stale_served += 1
+            self._record_cache(self._match_feed_name(cache_key), "stale")
+            _mark_stale(label, age, "upstream unavailable")
             return data
 
-    def _parse_jsonp(self, text: str) -> Dict[str, Any]:
+        self._cache_match_feed(cache_key, data)
+        await self._store_match_feed(cache_key, data)
+        return data
+
+    def _record_cache(self, feed: str, outcome: str):
+        """Counts a cache event and labels the current trace span with it."""
+        self.metrics.record_cache(feed, outcome)
+        set_attribute("cache", outcome)
+
+    def _cache_match_feed(self, cache_key: Tuple, data: Dict[str, Any]):
+        """
+        Caches a match summary or innings with a TTL based on match state.
+
+        Summaries of finished matches, and innings before the current one,
+        never change and are kept indefinitely. Anything still in play is
+        kept for LIVE_MATCH_TTL seconds.
+        """
+        circuit, match_id, innings, _ = cache_key
+        if innings is None:
+            match_summary_list = data.get("MatchSummary", [])
+            overall_summary = match_summary_list[0] if match_summary_list else {}
+            is_finished = str(overall_summary.get("IsMatchEnd", "0")) == "1"
+            self._match_states[(circuit, match_id)] = (
+                self._current_innings(overall_summary),
+                is_finished,
+            )
+            ttl = None if is_finished else self.LIVE_MATCH_TTL
+        else:
+            state = self._match_states.get((circuit, match_id))
+            if state is not None and (state[1] or innings < state[0]):
+                ttl = None
+            else:
+                ttl = self.LIVE_MATCH_TTL
+
+        self.match_cache.set(cache_key, data, ttl=ttl)
+
+    async def _store_match_feed(self, cache_key: Tuple, data: Dict[str, Any]):
+        """
+        Writes a freshly fetched match summary or innings to the store.
+        Cached match feeds never reach this, so nothing is written twice.
+        """
+        circuit, match_id, innings, _ = cache_key
+        if innings is None:
+            await self._feed_store(None, data, "add_match_summary", circuit, match_id)
+        else:
+            await self._feed_store(
+                None, data, "add_innings", circuit, match_id, innings
+            )
+
+    async def _feed_store(
+        self, key: Optional[Tuple], data: Any, method: str, *args: Any
+    ):
+        """
+        Writes a feed to the local store, if one is configured and the feed
+        stored under key (if given) changed since it was last written. The
+        write runs in a worker thread so sqlite doesn't block the event loop.
+        Store errors are logged, never raised: the store must not break API
+        calls.
+        """
+        if self.store is None or (
+            key is not None and self._stored_feeds.get(key) is data
+        ):
+            return
+        try:
+            await asyncio.to_thread(getattr(self.store, method), data, *args)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write {key} to the local store: {e}")
+            return
+        if key is not None:
+            self._stored_feeds[key] = data
+
+    @traced(attributes=("fields",))
+    def _parse_jsonp(
+        self, content: Union[bytes, str], fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
         """
         Parses JSONP-like response by removing the function wrapper.
         Example: oncomptetion({...}); -> {...}
+
+        Works on the raw response bytes: the payload is located with
+        memoryview offsets rather than by stripping and slicing copies,
+        and decoded with orjson when it is installed.
+
+        If fields (dotted paths such as "Innings1.BattingCard") are given,
+        only those subtrees are kept. The projection is applied straight after
+        decoding, before the result is shared or cached, so the rest of the
+        document is released immediately.
         """
-        text = text.strip()
+        if isinstance(content, str):
+            content = content.encode()
+        set_attribute("response_bytes", len(content))
+
+        view = memoryview(content)
+        start, end = 0, len(content)
+        while start < end and content[start] in _WHITESPACE:
+            start += 1
+        while end > start and content[end - 1] in _WHITESPACE:
+            end -= 1
+
+        # If it starts with { or [, it is likely pure JSON.
+        # Otherwise, look for JSONP pattern: callback(...)
+        if not (start < end and content[start] in _JSON_START):
+            open_paren = content.find(b"(", start, end)
+            close_paren = content.rfind(b")", start, end)
+            if open_paren != -1 and close_paren != -1:
+                start, end = open_paren + 1, close_paren
+
         try:
-            # If it starts with { or [, it is likely pure JSON
-            if text.startswith(("{", "[")):
-                return json.loads(text)
-
-            # Otherwise, look for JSONP pattern: callback(...)
-            start = text.find("(")
-            end = text.rfind(")")
-            if start != -1 and end != -1:
-                json_str = text[start + 1 : end]
-                return json.loads(json_str)
-
-            return json.loads(text)
+            data = _json_loads(view[start:end])
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from response: {str(e)}")
             raise
 
+        if fields:
+            return project(data, build_projection(fields))
+        return data
+
+    @traced(attributes=("endpoint", "fields"))
+    async def _fetch_feed(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[httpx.Response, Any]:
+        """
+        Fetches and parses a feed, coalescing identical concurrent requests.
+
+        Callers asking for the same endpoint (with the same headers and
+        fields) while a fetch is in flight await that fetch instead of issuing
+        their own GET. The parsed data is shared, so callers must not mutate
+        it. A 304 response is returned with data set to None.
+        """
+        key = (
+            endpoint,
+            tuple(sorted((headers or {}).items())),
+            tuple(fields) if fields else None,
+        )
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced_requests += 1
+        else:
+            task = asyncio.ensure_future(
+                self._fetch_and_parse(endpoint, headers, fields)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared fetch so one cancelled caller doesn't cancel the rest
+        return await asyncio.shield(task)
+
+    async def _fetch_and_parse(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[httpx.Response, Any]:
+        """Performs a single GET and parses its JSONP body."""
+        self.upstream_requests += 1
+        response = await self._make_request("GET", endpoint, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return response, None
+        start = time.perf_counter()
+        data = self._parse_jsonp(response.content, fields=fields)
+        self.metrics.record_parse(
+            self._ENDPOINT_TEMPLATES.match(endpoint), time.perf_counter() - start
+        )
+        return response, data
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns request and cache counters for this client."""
+        return {
+            "upstream_requests": self.upstream_requests,
+            "coalesced_requests": self.coalesced_requests,
+            "stale_served": self.stale_served,
+            "feed_cache": self.cache.stats(),
+            "match_cache": self.match_cache.stats(),
+            "throttle": self.throttle.stats(),
+        }
+
+    @traced(attributes=("method", "endpoint"))
     async def _make_request(
-        self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
         """
         Internal method to handle HTTP requests.
+        Requests go through the client's throttle (rate limit, adaptive
+        concurrency and retries). A 304 Not Modified response to a conditional
+        request is returned as-is.
         """
+        # Resolve relative endpoints ourselves so injected pools without a
+        # base_url still work.
+        url = endpoint if endpoint.startswith("http") else self.get_full_url(endpoint)
+        set_attribute("url.full", url)
+        start = time.perf_counter()
+        response: Optional[httpx.Response] = None
+        error: Optional[str] = None
         try:
-            response = await self.client.request(method, endpoint, params=params)
+            response = await self.throttle.send(
+                httpx.URL(url).host,
+                lambda: self.client.request(
+                    method, url, params=params, headers=headers
+                ),
+            )
+            if headers and response.status_code == httpx.codes.NOT_MODIFIED:
+                return response
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
+            error = str(e.response.status_code)
             logger.error(
                 f"HTTP error occurred: {e.response.status_code} - {e.response.text}"
             )
             raise
         except Exception as e:
+            error = type(e).__name__
             logger.error(f"An error occurred during request to {endpoint}: {str(e)}")
             raise
+        finally:
+            if response is not None:
+                set_attribute("http.response.status_code", response.status_code)
+            set_attribute("error.type", error)
+            self.metrics.record_request(
+                self._ENDPOINT_TEMPLATES.match(endpoint),
+                time.perf_counter() - start,
+                status=response.status_code if response is not None else None,
+                size=len(response.content) if response is not None else 0,
+                error=error,
+            )
 
     async def close(self):
-        """Closes the HTTP client."""
-        await self.client.aclose()
+        """
+        Cancels background refreshes, saves the cache's access times and
+        closes the HTTP client, unless it was injected by the caller.
+        """
+        refreshes = list(self._refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        if refreshes:
+            await asyncio.gather(*refreshes, return_exceptions=True)
+        if self._feed_cache is not None:
+            self._feed_cache.flush()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def __aenter__(self):
         return self
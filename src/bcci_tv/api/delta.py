@@ -0,0 +1,194 @@
+import hashlib
+import json
+from typing import Any, Dict, Hashable, List, Optional
+
+from bcci_tv.api.cache import MemoryCache
+from bcci_tv.api.tracing import traced
+
+# Fields that identify a row across versions of a scorecard section
+# (BattingCard, BowlingCard and FallOfWickets rows all carry a PlayerID)
+_ROW_ID_FIELDS = ("PlayerID",)
+
+
+def snapshot_version(data: Any) -> str:
+    """Returns a short token that changes whenever the data changes."""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _row_id(row: Any) -> Optional[Hashable]:
+    """
+    Identity of a list row: its PlayerID, or its only key for wrapper rows
+    such as {"Innings1": {...}}. None when the row has no identity.
+    """
+    if not isinstance(row, dict):
+        return None
+    for field in _ROW_ID_FIELDS:
+        if field in row:
+            return (field, row[field])
+    if len(row) == 1:
+        return next(iter(row))
+    return None
+
+
+def _diff_rows(old: List[Any], new: List[Any]) -> List[Any]:
+    """
+    Returns the rows of new that are added or changed since old.
+    Rows are matched by identity when they have one, by position otherwise.
+    """
+    old_by_id = {}
+    for row in old:
+        row_id = _row_id(row)
+        if row_id is not None:
+            old_by_id[row_id] = row
+
+    changed = []
+    for pos, row in enumerate(new):
+        row_id = _row_id(row)
+        if row_id is not None and row_id in old_by_id:
+            previous = old_by_id[row_id]
+        elif row_id is None and pos < len(old):
+            previous = old[pos]
+        else:
+            changed.append(row)
+            continue
+
+        if row == previous:
+            continue
+        if isinstance(row_id, str):
+            # Wrapper rows (whole innings) are diffed recursively
+            changed.append({row_id: diff_snapshot(previous[row_id], row[row_id])})
+        else:
+            changed.append(row)
+    return changed
+
+
+def diff_snapshot(old: Any, new: Any) -> Any:
+    """
+    Returns the parts of new that differ from old.
+
+    Dicts keep only the keys whose values changed, lists keep only their new
+    or changed rows (e.g. the batters whose line moved), and any other value
+    is returned whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            if key not in old:
+                changes[key] = value
+            elif old[key] != value:
+                changes[key] = diff_snapshot(old[key], value)
+        return changes
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_rows(old, new)
+    return new
+
+
+def has_removals(old: Any, new: Any) -> bool:
+    """
+    True when new lacks something old had: a dict key, an identified row, or
+    trailing rows without identity. diff_snapshot can't express these, so a
+    delta that would drop them must not be sent.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                return True
+            if new[key] != value and has_removals(value, new[key]):
+                return True
+        return False
+    if isinstance(old, list) and isinstance(new, list):
+        new_by_id = {}
+        for row in new:
+            row_id = _row_id(row)
+            if row_id is not None:
+                new_by_id[row_id] = row
+        for pos, row in enumerate(old):
+            row_id = _row_id(row)
+            if row_id is None:
+                if pos >= len(new):
+                    return True
+            elif row_id not in new_by_id:
+                return True
+            elif isinstance(row_id, str) and has_removals(
+                row[row_id], new_by_id[row_id][row_id]
+            ):
+                # Wrapper rows are diffed recursively, other rows sent whole
+                return True
+        return False
+    return False
+
+
+class SnapshotHistory:
+    """
+    Recent versions of match snapshots, so callers that pass back the version
+    they last saw can be sent only what changed since.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._versions = MemoryCache(max_entries=max_entries)
+        # key -> (data, version) of the last snapshot seen, so the same
+        # (cached) object isn't re-hashed on every call
+        self._latest = MemoryCache(max_entries=max_entries)
+        # id(component) -> (component, version) for the parts snapshots are
+        # built from. Snapshots of unsubscribed matches are new dicts on every
+        # call, but their summary and innings are the objects held in the
+        # client's match cache, so only parts that changed are serialized.
+        self._components = MemoryCache(max_entries=max_entries * 8)
+
+    def _component_version(self, value: Any) -> str:
+        if not isinstance(value, (dict, list)):
+            return snapshot_version(value)
+        cached = self._components.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        version = snapshot_version(value)
+        # Holding on to the component keeps its id from being reused
+        self._components.set(id(value), (value, version))
+        return version
+
+    def snapshot_version(self, data: Any) -> str:
+        """
+        Returns the version token of a snapshot, combined from the versions
+        of its top-level values (and of each item of top-level lists, such
+        as innings_details). Parts seen before are not serialized again.
+        """
+        if not isinstance(data, dict):
+            return snapshot_version(data)
+        parts = []
+        for key in sorted(data):
+            value = data[key]
+            if isinstance(value, list):
+                part = ",".join(self._component_version(item) for item in value)
+                parts.append(f"{key}=[{part}]")
+            else:
+                parts.append(f"{key}={self._component_version(value)}")
+        payload = "|".join(parts).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    def _version(self, key: Hashable, data: Any) -> str:
+        latest = self._latest.get(key)
+        if latest is not None and latest[0] is data:
+            return latest[1]
+        version = self.snapshot_version(data)
+        self._latest.set(key, (data, version))
+        self._versions.set((key, version), data)
+        return version
+
+    @traced(attributes=("since",))
+    def versioned(
+        self, key: Hashable, data: Dict[str, Any], since: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns data with its "version" token. When since names a version
+        still in the history, only the changes since that version are
+        returned, alongside "since". Deltas only add or replace values, so
+        the full snapshot is returned when anything was removed since.
+        """
+        version = self._version(key, data)
+        if since is not None:
+            previous = self._versions.get((key, since))
+            if previous is not None and not has_removals(previous, data):
+                changes = diff_snapshot(previous, data)
+                return {"version": version, "since": since, **changes}
+        return {**data, "version": version}
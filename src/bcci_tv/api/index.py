@@ -0,0 +1,222 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_AGE_GROUP_RE = re.compile(r"^u(\d+)$")
+
+# Words left out when deriving acronyms, so "SYED MUSHTAQ ALI TROPHY ELITE" -> "smat"
+_ACRONYM_SKIP_WORDS = {"elite", "plate"}
+
+# Query shorthands that can't be derived from competition names
+ALIASES = {
+    "ckn": ["c", "k", "nayudu"],
+    "odi": ["one", "day"],
+    "t20i": ["t20"],
+}
+
+# Relevance of a query token matching an indexed token exactly, by prefix or
+# within one typo.
+_EXACT_SCORE = 3.0
+_PREFIX_SCORE = 2.0
+_FUZZY_SCORE = 1.0
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lowercase alphanumeric tokens.
+    Age groups such as "U19" also yield "under" and "19".
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        tokens.append(token)
+        age_group = _AGE_GROUP_RE.match(token)
+        if age_group:
+            tokens.extend(["under", age_group.group(1)])
+    return tokens
+
+
+def _acronym(name: str) -> str:
+    """Derives an acronym from a name, e.g. 'VIJAY HAZARE TROPHY' -> 'vht'."""
+    words = [w for w in _TOKEN_RE.findall(name.lower()) if w not in _ACRONYM_SKIP_WORDS]
+    return "".join(w[0] for w in words) if len(words) > 1 else ""
+
+
+def _deletes(token: str) -> Set[str]:
+    """All variants of token with one character removed."""
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """
+    True if a and b differ by at most one insertion, deletion,
+    substitution or swap of adjacent characters.
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        # substitution, or transposition of two adjacent characters
+        return a[i + 1 :] == b[i + 1 :] or (
+            a[i : i + 2] == b[i : i + 2][::-1] and a[i + 2 :] == b[i + 2 :]
+        )
+    if len(a) > len(b):
+        return a[i + 1 :] == b[i:]
+    return a[i:] == b[i + 1 :]
+
+
+def _start_date(comp: Dict[str, Any]) -> int:
+    """Ordinal of the competition's start date, or 0 when unknown."""
+    try:
+        return datetime.strptime(comp.get("MatchStartDate", ""), "%d %b %Y").toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+class CompetitionIndex:
+    """
+    Lookup tables built once per competition catalog load.
+
+    Holds an ID index for direct lookups and an inverted token index for
+    ranked name search. The catalog dict the index was built from is kept as
+    `source`, so callers can cheaply tell whether a freshly loaded catalog
+    needs a new index.
+    """
+
+    def __init__(self, data: Dict[str, Any], circuit: str):
+        self.source = data
+        self.circuit = circuit
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+
+        seasons = {
+            str(div.get("SeasonID")): div.get("SeasonName", "")
+            for div in data.get("division", [])
+        }
+
+        self._competitions: List[Dict[str, Any]] = []
+        self._recency: List[int] = []
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        for comp in data.get("competition", []):
+            comp_id = comp.get("CompetitionID")
+            if comp_id is not None:
+                self.by_id.setdefault(str(comp_id), comp)
+
+            pos = len(self._competitions)
+            self._competitions.append(comp)
+            start_date = _start_date(comp)
+            self._recency.append(start_date)
+
+            name = comp.get("CompetitionName", "")
+            tokens = set(tokenize(name))
+            acronym = _acronym(name)
+            if acronym:
+                tokens.add(acronym)
+            # Season years, so "ranji 2025" or "2025-26" narrow the results
+            tokens.update(tokenize(seasons.get(str(comp.get("SeasonID")), "")))
+            if start_date:
+                tokens.add(str(datetime.fromordinal(start_date).year))
+            for token in tokens:
+                self._postings[token].add(pos)
+
+        self._sorted_tokens = sorted(self._postings)
+        # Symmetric-delete table for single-typo matching
+        self._fuzzy: Dict[str, Set[str]] = defaultdict(set)
+        for token in self._sorted_tokens:
+            if len(token) >= 4 and not token.isdigit():
+                self._fuzzy[token].add(token)
+                for variant in _deletes(token):
+                    self._fuzzy[variant].add(token)
+
+    def get(self, competition_id: Any) -> Optional[Dict[str, Any]]:
+        """Returns the competition with the given ID, or None."""
+        return self.by_id.get(str(competition_id))
+
+    def __contains__(self, competition_id: Any) -> bool:
+        return str(competition_id) in self.by_id
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def _match_token(self, query_token: str) -> Dict[int, float]:
+        """Scores every competition matching one query token."""
+        scores: Dict[int, float] = {}
+
+        def add(token: str, score: float):
+            for pos in self._postings[token]:
+                if scores.get(pos, 0.0) < score:
+                    scores[pos] = score
+
+        if query_token in self._postings:
+            add(query_token, _EXACT_SCORE)
+
+        if len(query_token) >= 2:
+            i = bisect_left(self._sorted_tokens, query_token)
+            while i < len(self._sorted_tokens) and self._sorted_tokens[i].startswith(
+                query_token
+            ):
+                add(self._sorted_tokens[i], _PREFIX_SCORE)
+                i += 1
+
+        if len(query_token) >= 4 and not query_token.isdigit():
+            candidates: Set[str] = set(self._fuzzy.get(query_token, ()))
+            for variant in _deletes(query_token):
+                candidates.update(self._fuzzy.get(variant, ()))
+            for token in candidates:
+                if _within_one_edit(query_token, token):
+                    add(token, _FUZZY_SCORE)
+
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """
+        Returns competitions matching every term of the query, best first.
+
+        Terms match indexed words exactly, as a prefix, or within one typo,
+        and known shorthands (acronyms like "SMAT", "VHT", or aliases) are
+        expanded. Results are ranked by relevance, then by most recent start
+        date. Falls back to a plain substring match if nothing is found.
+        """
+        query_tokens = []
+        for token in tokenize(query):
+            if token not in self._postings and token in ALIASES:
+                query_tokens.extend(ALIASES[token])
+            else:
+                query_tokens.append(token)
+        if not query_tokens:
+            return []
+
+        totals: Optional[Dict[int, float]] = None
+        for token in query_tokens:
+            scores = self._match_token(token)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {
+                    pos: total + scores[pos]
+                    for pos, total in totals.items()
+                    if pos in scores
+                }
+            if not totals:
+                break
+
+        if totals:
+            ranked = sorted(
+                totals, key=lambda pos: (-totals[pos], -self._recency[pos], pos)
+            )
+        else:
+            needle = query.lower()
+            ranked = [
+                pos
+                for pos, comp in enumerate(self._competitions)
+                if needle in comp.get("CompetitionName", "").lower()
+            ]
+
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self._competitions[pos] for pos in ranked]
@@ -0,0 +1,267 @@
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PARSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+# name -> (type, help, buckets)
+METRICS: Dict[str, Tuple[str, str, Optional[Sequence[float]]]] = {
+    "bcci_tv_upstream_requests_total": (
+        "counter",
+        "Upstream requests by endpoint template and final status code.",
+        None,
+    ),
+    "bcci_tv_upstream_errors_total": (
+        "counter",
+        "Failed upstream requests by endpoint template and error "
+        "(HTTP status code or exception type).",
+        None,
+    ),
+    "bcci_tv_upstream_response_bytes_total": (
+        "counter",
+        "Response bytes received by endpoint template.",
+        None,
+    ),
+    "bcci_tv_upstream_request_duration_seconds": (
+        "histogram",
+        "Upstream request latency, including retries, by endpoint template.",
+        LATENCY_BUCKETS,
+    ),
+    "bcci_tv_parse_duration_seconds": (
+        "histogram",
+        "Time spent parsing feeds, by endpoint template.",
+        PARSE_BUCKETS,
+    ),
+    "bcci_tv_cache_events_total": (
+        "counter",
+        "Cache events by feed and outcome: lookups answered fresh (hit), stale "
+        "or from upstream (miss), and refreshes that were revalidated (304) "
+        "or refreshed.",
+        None,
+    ),
+    "bcci_tv_tool_calls_total": (
+        "counter",
+        "MCP tool calls by tool and outcome (ok, error).",
+        None,
+    ),
+    "bcci_tv_tool_duration_seconds": (
+        "histogram",
+        "MCP tool latency by tool.",
+        LATENCY_BUCKETS,
+    ),
+}
+
+
+class TemplateMatcher:
+    """
+    Maps concrete endpoints or cache filenames back to the name of the
+    template they were formatted from, e.g. '/feeds/318-matchschedule.js'
+    to 'domestic_schedule'. Templates are tried in order; unknown values
+    map to 'other'.
+    """
+
+    def __init__(self, templates: Iterable[Tuple[str, str]]):
+        self._patterns: List[Tuple[str, Pattern[str]]] = []
+        for name, template in templates:
+            pattern = re.sub(r"\\\{\w+\\\}", "[^/?&]+", re.escape(template))
+            self._patterns.append((name.lower(), re.compile(f"^{pattern}$")))
+        self._cache: Dict[str, str] = {}
+
+    @classmethod
+    def from_class(cls, namespace: type) -> "TemplateMatcher":
+        """Builds a matcher from the string attributes of a class."""
+        return cls(
+            (name, value)
+            for name, value in vars(namespace).items()
+            if not name.startswith("_") and isinstance(value, str)
+        )
+
+    def match(self, value: str) -> str:
+        name = self._cache.get(value)
+        if name is None:
+            name = next(
+                (n for n, pattern in self._patterns if pattern.match(value)), "other"
+            )
+            # Bounded: one entry per distinct endpoint seen
+            if len(self._cache) < 4096:
+                self._cache[value] = name
+        return name
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as exposed by Prometheus."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile as the upper bound of the bucket it falls in
+        (the largest finite bound for the +Inf bucket).
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+def _format_labels(labels: _Labels, extra: str = "") -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metrics:
+    """
+    In-process registry of the counters and histograms in METRICS, with
+    string labels. Exposed as a JSON snapshot or Prometheus text format.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[_Labels, float]] = {}
+        self.histograms: Dict[str, Dict[_Labels, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str):
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(METRICS[name][2])
+        histogram.observe(value)
+
+    def record_request(
+        self,
+        endpoint: str,
+        seconds: float,
+        status: Optional[int] = None,
+        size: int = 0,
+        error: Optional[str] = None,
+    ):
+        """Records one upstream request (status is None if no response came)."""
+        self.inc(
+            "bcci_tv_upstream_requests_total",
+            endpoint=endpoint,
+            status=str(status) if status is not None else "none",
+        )
+        self.observe(
+            "bcci_tv_upstream_request_duration_seconds", seconds, endpoint=endpoint
+        )
+        if size:
+            self.inc("bcci_tv_upstream_response_bytes_total", size, endpoint=endpoint)
+        if error is not None:
+            self.inc("bcci_tv_upstream_errors_total", endpoint=endpoint, code=error)
+
+    def record_parse(self, endpoint: str, seconds: float):
+        self.observe("bcci_tv_parse_duration_seconds", seconds, endpoint=endpoint)
+
+    def record_cache(self, feed: str, outcome: str):
+        self.inc("bcci_tv_cache_events_total", feed=feed, outcome=outcome)
+
+    def record_tool(self, tool: str, seconds: float, ok: bool = True):
+        self.inc("bcci_tv_tool_calls_total", tool=tool, outcome="ok" if ok else "error")
+        self.observe("bcci_tv_tool_duration_seconds", seconds, tool=tool)
+
+    def cache_hit_rates(self) -> Dict[str, float]:
+        """Share of lookups per feed answered from cache (fresh or stale)."""
+        totals: Dict[str, float] = {}
+        served: Dict[str, float] = {}
+        for labels, value in self.counters.get(
+            "bcci_tv_cache_events_total", {}
+        ).items():
+            label = dict(labels)
+            if label["outcome"] not in ("hit", "stale", "miss"):
+                continue
+            feed = label["feed"]
+            totals[feed] = totals.get(feed, 0) + value
+            if label["outcome"] != "miss":
+                served[feed] = served.get(feed, 0) + value
+        return {
+            feed: round(served.get(feed, 0) / total, 4)
+            for feed, total in sorted(totals.items())
+        }
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Returns every series as JSON-friendly data. Histograms are reduced
+        to count, sum, mean and estimated p50/p95/p99.
+        """
+        data: Dict[str, object] = {}
+        for name, series in self.counters.items():
+            data[name] = [
+                {"labels": dict(labels), "value": value}
+                for labels, value in sorted(series.items())
+            ]
+        for name, series in self.histograms.items():
+            data[name] = [
+                {
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "mean": round(h.sum / h.count, 6) if h.count else None,
+                    "p50": h.quantile(0.5),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                }
+                for labels, h in sorted(series.items())
+            ]
+        data["cache_hit_rates"] = self.cache_hit_rates()
+        return data
+
+    def to_prometheus(self) -> str:
+        """Renders every series in the Prometheus text exposition format."""
+        lines = []
+        for name, (kind, help_text, _) in METRICS.items():
+            if name not in self.counters and name not in self.histograms:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                for labels, value in sorted(self.counters[name].items()):
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+                continue
+            for labels, h in sorted(self.histograms[name].items()):
+                cumulative = 0
+                bounds = [_format_value(b) for b in h.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, h.counts):
+                    cumulative += count
+                    le = _format_labels(labels, f'le="{bound}"')
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {h.sum!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,227 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def to_int(value: Any) -> int:
+    """Converts an API value ('7', 7, '7.0', '', None) to int, defaulting to 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+
+def to_float(value: Any) -> float:
+    """Converts an API value ('0.935', '', None) to float, defaulting to 0.0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_str(value: Any) -> str:
+    """Converts an API value to a stripped string ('' for None)."""
+    return "" if value is None else str(value).strip()
+
+
+@dataclass(slots=True)
+class StandingRecord:
+    """
+    One team's row in a standings table.
+
+    The numeric columns used for ranking are converted once, when the record
+    is built. row is the API dict the record was built from (not a copy), so
+    to_dict() returns exactly what the dict helpers do.
+    """
+
+    category: str
+    team_name: str
+    order_no: int
+    points: float
+    net_run_rate: float
+    row: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "StandingRecord":
+        return cls(
+            category=_to_str(row.get("Category")),
+            team_name=_to_str(row.get("TeamName")),
+            order_no=to_int(row.get("OrderNo")),
+            points=to_float(row.get("Points")),
+            net_run_rate=to_float(row.get("NetRunRate")),
+            row=row,
+        )
+
+    def to_dict(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Returns the API row, or only the given columns of it."""
+        if fields is None:
+            return self.row
+        return {key: self.row.get(key) for key in fields}
+
+
+@dataclass(slots=True)
+class MatchRecord:
+    """One match in a tournament schedule."""
+
+    match_id: int
+    competition_id: int
+    # Lowercased once, for filtering by status
+    status: str
+    match_date: str
+    row: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "MatchRecord":
+        return cls(
+            match_id=to_int(row.get("MatchID")),
+            competition_id=to_int(row.get("CompetitionID")),
+            status=_to_str(row.get("MatchStatus")).lower(),
+            match_date=_to_str(row.get("MatchDate")),
+            row=row,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.row
+
+
+@dataclass(slots=True)
+class BattingRecord:
+    """One batter's line in an innings scorecard."""
+
+    player_id: str
+    player_name: str
+    team_id: int
+    playing_order: int
+    out_desc: str
+    runs: int
+    balls: int
+    fours: int
+    sixes: int
+    strike_rate: float
+    row: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "BattingRecord":
+        return cls(
+            player_id=_to_str(row.get("PlayerID")),
+            player_name=_to_str(row.get("PlayerName")),
+            team_id=to_int(row.get("TeamID")),
+            playing_order=to_int(row.get("PlayingOrder")),
+            out_desc=_to_str(row.get("OutDesc")),
+            runs=to_int(row.get("Runs")),
+            balls=to_int(row.get("Balls")),
+            fours=to_int(row.get("Fours")),
+            sixes=to_int(row.get("Sixes")),
+            strike_rate=to_float(row.get("StrikeRate")),
+            row=row,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.row
+
+
+@dataclass(slots=True)
+class BowlingRecord:
+    """One bowler's line in an innings scorecard."""
+
+    player_id: str
+    player_name: str
+    team_id: int
+    bowling_order: int
+    # Cricket overs notation ("9.4" is nine overs and four balls), kept as text
+    overs: str
+    maidens: int
+    runs: int
+    wickets: int
+    wides: int
+    no_balls: int
+    economy: float
+    row: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "BowlingRecord":
+        return cls(
+            player_id=_to_str(row.get("PlayerID")),
+            player_name=_to_str(row.get("PlayerName")),
+            team_id=to_int(row.get("TeamID")),
+            bowling_order=to_int(row.get("BowlingOrder")),
+            overs=_to_str(row.get("Overs")),
+            maidens=to_int(row.get("Maidens")),
+            runs=to_int(row.get("Runs")),
+            wickets=to_int(row.get("Wickets")),
+            wides=to_int(row.get("Wides")),
+            no_balls=to_int(row.get("NoBalls")),
+            economy=to_float(row.get("Economy")),
+            row=row,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.row
+
+
+@dataclass(slots=True)
+class InningsRecord:
+    """The scorecard of one innings, with its totals from the Extras section."""
+
+    innings_no: int
+    team_id: int
+    total: str
+    extras: int
+    run_rate: float
+    batting: List[BattingRecord]
+    bowling: List[BowlingRecord]
+    has_extras: bool
+
+    @classmethod
+    def from_feed(cls, data: Dict[str, Any], innings: int) -> Optional["InningsRecord"]:
+        """
+        Builds the record from an innings feed (as returned by the match
+        summary methods with an innings), or None if the innings is missing.
+        """
+        inner = data.get(f"Innings{innings}")
+        if not isinstance(inner, dict):
+            return None
+        extras = (inner.get("Extras") or [{}])[0]
+        return cls(
+            innings_no=innings,
+            team_id=to_int(extras.get("TeamID")),
+            total=_to_str(extras.get("Total")),
+            extras=to_int(extras.get("TotalExtras")),
+            run_rate=to_float(extras.get("CurrentRunRate")),
+            batting=[
+                BattingRecord.from_dict(row)
+                for row in inner.get("BattingCard") or []
+                if row.get("PlayerID")
+            ],
+            bowling=[
+                BowlingRecord.from_dict(row)
+                for row in inner.get("BowlingCard") or []
+                if row.get("PlayerID")
+            ],
+            has_extras=bool(extras),
+        )
+
+
+def standings_records(data: Dict[str, Any]) -> Dict[str, List[StandingRecord]]:
+    """
+    Groups the teams of a standings feed by category, each group sorted by
+    OrderNo. Categories come in the feed's order; an empty dict is returned
+    when the feed has none.
+    """
+    grouped: Dict[str, List[StandingRecord]] = {
+        cat["Category"]: [] for cat in data.get("category", []) if cat.get("Category")
+    }
+    for team in data.get("points", []):
+        group = grouped.get(team.get("Category"))
+        if group is not None:
+            group.append(StandingRecord.from_dict(team))
+    for group in grouped.values():
+        group.sort(key=lambda record: record.order_no)
+    return grouped
+
+
+def schedule_records(data: Dict[str, Any]) -> List[MatchRecord]:
+    """Returns the matches of a schedule feed, in the feed's order."""
+    return [MatchRecord.from_dict(match) for match in data.get("Matchsummary") or []]
@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional, Sequence
+
+# A projection maps each wanted key to a nested projection, or to None to
+# keep the key's whole value, e.g. {"Innings1": {"BattingCard": None}}.
+Projection = Dict[str, Optional["Projection"]]
+
+
+def build_projection(fields: Sequence[str]) -> Projection:
+    """
+    Builds a projection from dotted field paths.
+    Example: ["Innings1.BattingCard", "Innings1.Extras"]
+    -> {"Innings1": {"BattingCard": None, "Extras": None}}
+
+    A path to a whole subtree wins over narrower paths inside it, in either
+    order: ["Innings1", "Innings1.BattingCard"] keeps all of Innings1.
+    """
+    projection: Projection = {}
+    for field in fields:
+        node: Optional[Projection] = projection
+        *parents, leaf = field.split(".")
+        for key in parents:
+            if key in node and node[key] is None:
+                # The whole subtree is already kept
+                node = None
+                break
+            node = node.setdefault(key, {})
+        if node is not None:
+            node[leaf] = None
+    return projection
+
+
+def project(data: Any, projection: Projection) -> Any:
+    """
+    Keeps only the projected keys of parsed data, in projection order.
+    Lists are projected item by item. Missing keys are left out; other
+    values are returned unchanged.
+    """
+    if isinstance(data, list):
+        return [project(item, projection) for item in data]
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, child in projection.items():
+        if key in data:
+            result[key] = data[key] if child is None else project(data[key], child)
+    return result
@@ -0,0 +1,228 @@
+import base64
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from bcci_tv.api.cache import _write_atomic
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay", "auto")
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMissError(httpx.RequestError):
+    """
+    Raised in replay mode for a request that was never recorded.
+
+    Not a TransportError: it is neither retried nor papered over with a
+    stale cached copy.
+    """
+
+
+class Cassette:
+    """
+    HTTP interactions recorded to a JSON file.
+
+    Interactions are keyed by method and URL. A URL recorded several times
+    (e.g. a live feed) is replayed in order, and the last response is
+    repeated once the sequence runs out.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self.interactions = json.load(f)["interactions"]
+
+    @staticmethod
+    def key(method: str, url: Union[str, httpx.URL]) -> str:
+        return f"{method.upper()} {url}"
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.interactions.values())
+
+    def add(
+        self,
+        method: str,
+        url: Union[str, httpx.URL],
+        response: httpx.Response,
+        content: bytes,
+    ):
+        """Records the response to a request (its body already read as content)."""
+        try:
+            body = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        key = self.key(method, url)
+        self.interactions.setdefault(key, []).append(
+            {"status": response.status_code, "headers": headers, **body}
+        )
+
+    def next(self, method: str, url: Union[str, httpx.URL]) -> Optional[Dict[str, Any]]:
+        """Returns the next recorded response for a request, or None."""
+        return self.next_for_key(self.key(method, url))
+
+    def next_for_key(self, key: str) -> Optional[Dict[str, Any]]:
+        responses = self.interactions.get(key)
+        if not responses:
+            return None
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        return responses[min(position, len(responses) - 1)]
+
+    @staticmethod
+    def content(recorded: Dict[str, Any]) -> bytes:
+        """The body of a recorded response."""
+        if "base64" in recorded:
+            return base64.b64decode(recorded["base64"])
+        return recorded["text"].encode("utf-8")
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"interactions": self.interactions}, indent=1)
+        _write_atomic(self.path, payload.encode("utf-8"))
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Records upstream responses to a cassette, or replays them without network.
+
+    Modes:
+        record: always call upstream and append each response to the cassette.
+        replay: only serve recorded responses; anything else raises
+            CassetteMissError.
+        auto: replay what is recorded, record the rest.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Path, Cassette],
+        mode: str = "replay",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"mode must be one of {CASSETTE_MODES}, got {mode!r}")
+        self.cassette = (
+            cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        )
+        self.mode = mode
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.replayed = 0
+        self.recorded = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode != "record":
+            recorded = self.cassette.next(request.method, request.url)
+            if recorded is not None:
+                self.replayed += 1
+                return httpx.Response(
+                    recorded["status"],
+                    headers=recorded["headers"],
+                    content=Cassette.content(recorded),
+                    request=request,
+                )
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url} "
+                    f"in {self.cassette.path}",
+                    request=request,
+                )
+
+        # Recorded under the URL as requested, before any redirect
+        method, url = request.method, request.url
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        self.cassette.add(method, url, response, content)
+        # Saved after every response, so an interrupted run keeps its recordings
+        self.cassette.save()
+        self.recorded += 1
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        return httpx.Response(
+            response.status_code, headers=headers, content=content, request=request
+        )
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class RedirectTransport(httpx.AsyncBaseTransport):
+    """
+    Sends every request to another server (e.g. a local StubUpstream),
+    keeping its path and query. All upstream hosts map to the same server.
+    """
+
+    def __init__(
+        self, target: str, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.target = httpx.URL(target)
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    def _redirect(self, url: httpx.URL) -> httpx.URL:
+        return url.copy_with(
+            scheme=self.target.scheme, host=self.target.host, port=self.target.port
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = self._redirect(request.url)
+        headers = request.headers.copy()
+        headers["Host"] = url.netloc.decode("ascii")
+        redirected = httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            stream=request.stream,
+            extensions=request.extensions,
+        )
+        return await self.transport.handle_async_request(redirected)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def build_transport(
+    limits: Optional[httpx.Limits] = None,
+    cassette: Optional[str] = None,
+    cassette_mode: str = "replay",
+    upstream_url: Optional[str] = None,
+) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Builds the transport for a cassette and/or an upstream override, or
+    returns None when neither is set (the default httpx transport is used).
+    Cassettes record the original URLs, before any redirect.
+    """
+    if not cassette and not upstream_url:
+        return None
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        limits=limits or httpx.Limits()
+    )
+    if upstream_url:
+        transport = RedirectTransport(upstream_url, transport)
+    if cassette:
+        transport = CassetteTransport(cassette, mode=cassette_mode, transport=transport)
+    return transport
+
+
+def split_key(key: str) -> Tuple[str, httpx.URL]:
+    """Splits a cassette key into its method and URL."""
+    method, url = key.split(" ", 1)
+    return method, httpx.URL(url)
@@ -0,0 +1,188 @@
+import asyncio
+import gzip
+import json
+import logging
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.utils import filter_matches_by_status
+
+logger = logging.getLogger(__name__)
+
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def snapshot_path(competition_id: int) -> Path:
+    """Default archive path for a tournament snapshot."""
+    return Path(f"tournament_{competition_id}.jsonl.gz")
+
+
+def _scan(data: bytes) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Yields each complete record of an archive with the offset just past it.
+    Stops at the first truncated or corrupt record.
+    """
+    view = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        decompressor = zlib.decompressobj(wbits=31)
+        chunks = []
+        end = pos
+        try:
+            # Fed in chunks, so only the tail of the last one is copied into
+            # unused_data rather than the rest of the archive
+            while not decompressor.eof and end < len(data):
+                chunk = view[end : end + _SCAN_CHUNK_SIZE]
+                end += len(chunk)
+                chunks.append(decompressor.decompress(chunk))
+            if not decompressor.eof:
+                return
+            record = json.loads(b"".join(chunks))
+        except (zlib.error, ValueError):
+            return
+        pos = end - len(decompressor.unused_data)
+        yield record, pos
+
+
+def read_snapshot(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the records of a snapshot archive, in the order they were written.
+    Each record is {"type": ..., "id": ..., "data": ...}, where type is one of
+    'competition', 'schedule', 'standings' or 'match'.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    for record, _ in _scan(data):
+        yield record
+
+
+class _SnapshotWriter:
+    """
+    Appends records to a snapshot archive, one gzip member per record, so
+    the archive stays readable (and resumable) if the export is interrupted.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.stored: Set[Tuple[str, Any]] = set()
+
+        good_offset = 0
+        if path.exists():
+            data = path.read_bytes()
+            for record, good_offset in _scan(data):
+                self.stored.add((record["type"], record["id"]))
+            if good_offset < len(data):
+                logger.warning(f"Discarding incomplete record at the end of {path}")
+
+        self._file = open(path, "r+b" if path.exists() else "wb")
+        # Drop a partially written record left by an interrupted export
+        self._file.truncate(good_offset)
+        self._file.seek(good_offset)
+
+    def __contains__(self, key: Tuple[str, Any]) -> bool:
+        return key in self.stored
+
+    def write(self, record_type: str, record_id: Any, data: Any):
+        payload = json.dumps({"type": record_type, "id": record_id, "data": data})
+        self._file.write(gzip.compress(payload.encode("utf-8")))
+        self._file.flush()
+        self.stored.add((record_type, record_id))
+
+    def close(self):
+        self._file.close()
+
+
+async def export_tournament(
+    client: BCCIApiClient,
+    competition_id: int,
+    circuit: Optional[str] = None,
+    path: Union[str, Path, None] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Exports a whole tournament to a compressed archive: its details, schedule,
+    standings and the full summary of every completed match.
+
+    Matches are fetched at most `concurrency` at a time (defaults to
+    MATCH_BATCH_CONCURRENCY) and written as soon as each one arrives. Records
+    already in the archive are skipped, so re-running an interrupted export
+    resumes where it stopped. If circuit is not provided, it is looked up
+    from the competition catalogs.
+
+    Returns a summary of the export, including the matches that failed
+    (which are retried on the next run).
+    """
+    if circuit is None:
+        circuit = await client.get_competition_circuit(competition_id)
+        if circuit is None:
+            raise ValueError(f"Competition {competition_id} not found")
+    path = Path(path) if path is not None else snapshot_path(competition_id)
+
+    writer = _SnapshotWriter(path)
+    try:
+        if ("competition", competition_id) not in writer:
+            details = await client.get_competition_details(competition_id, circuit)
+            if details is None:
+                raise ValueError(
+                    f"Competition {competition_id} not found in {circuit} circuit"
+                )
+            writer.write("competition", competition_id, details)
+
+        schedule = await client.get_tournament_schedule(competition_id, circuit)
+        if ("schedule", competition_id) not in writer:
+            writer.write("schedule", competition_id, schedule)
+
+        if ("standings", competition_id) not in writer:
+            try:
+                standings = await client.get_tournament_standings(competition_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch standings of {competition_id}: {e}")
+            else:
+                writer.write("standings", competition_id, standings)
+
+        match_ids = [
+            int(match["MatchID"])
+            for match in filter_matches_by_status(schedule, "post")
+            if match.get("MatchID") is not None
+        ]
+        pending = [m for m in match_ids if ("match", m) not in writer]
+
+        semaphore = asyncio.Semaphore(concurrency or client.MATCH_BATCH_CONCURRENCY)
+
+        async def fetch_match(match_id: int) -> Tuple[int, Any]:
+            async with semaphore:
+                try:
+                    # A match with an innings missing is not written, so
+                    # the next run retries it
+                    return match_id, await client.get_full_match_summary(
+                        match_id, circuit, strict=True
+                    )
+                except Exception as e:
+                    return match_id, e
+
+        errors = []
+        tasks = [asyncio.create_task(fetch_match(m)) for m in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                match_id, result = await next_done
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to fetch match {match_id}: {result}")
+                    errors.append({"match_id": match_id, "error": str(result)})
+                else:
+                    writer.write("match", match_id, result)
+        finally:
+            for task in tasks:
+                task.cancel()
+    finally:
+        writer.close()
+
+    return {
+        "path": str(path),
+        "circuit": circuit,
+        "matches": len(match_ids),
+        "written": len(pending) - len(errors),
+        "skipped": len(match_ids) - len(pending),
+        "errors": errors,
+    }
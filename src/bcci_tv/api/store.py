@@ -0,0 +1,492 @@
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from bcci_tv.api.models import InningsRecord, to_int
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS competitions (
+    circuit TEXT NOT NULL,
+    competition_id INTEGER NOT NULL,
+    name TEXT,
+    season TEXT,
+    category TEXT,
+    match_type TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    PRIMARY KEY (circuit, competition_id)
+);
+CREATE INDEX IF NOT EXISTS competitions_season ON competitions (season);
+
+CREATE TABLE IF NOT EXISTS teams (
+    circuit TEXT NOT NULL,
+    team_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (circuit, team_id)
+);
+
+CREATE TABLE IF NOT EXISTS venues (
+    circuit TEXT NOT NULL,
+    venue_id INTEGER NOT NULL,
+    name TEXT,
+    city TEXT,
+    PRIMARY KEY (circuit, venue_id)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    circuit TEXT NOT NULL,
+    match_id INTEGER NOT NULL,
+    competition_id INTEGER,
+    name TEXT,
+    match_order TEXT,
+    match_date TEXT,
+    status TEXT,
+    venue_id INTEGER,
+    team1_id INTEGER,
+    team2_id INTEGER,
+    winning_team_id INTEGER,
+    first_batting_summary TEXT,
+    second_batting_summary TEXT,
+    comments TEXT,
+    PRIMARY KEY (circuit, match_id)
+);
+CREATE INDEX IF NOT EXISTS matches_competition ON matches (circuit, competition_id);
+CREATE INDEX IF NOT EXISTS matches_team1 ON matches (circuit, team1_id, match_date);
+CREATE INDEX IF NOT EXISTS matches_team2 ON matches (circuit, team2_id, match_date);
+CREATE INDEX IF NOT EXISTS matches_date ON matches (match_date);
+
+CREATE TABLE IF NOT EXISTS innings (
+    circuit TEXT NOT NULL,
+    match_id INTEGER NOT NULL,
+    innings_no INTEGER NOT NULL,
+    team_id INTEGER,
+    total TEXT,
+    extras INTEGER,
+    run_rate REAL,
+    PRIMARY KEY (circuit, match_id, innings_no)
+);
+
+CREATE TABLE IF NOT EXISTS batting (
+    circuit TEXT NOT NULL,
+    match_id INTEGER NOT NULL,
+    innings_no INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    player_name TEXT,
+    team_id INTEGER,
+    playing_order INTEGER,
+    out_desc TEXT,
+    runs INTEGER,
+    balls INTEGER,
+    fours INTEGER,
+    sixes INTEGER,
+    strike_rate REAL,
+    PRIMARY KEY (circuit, match_id, innings_no, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS bowling (
+    circuit TEXT NOT NULL,
+    match_id INTEGER NOT NULL,
+    innings_no INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    player_name TEXT,
+    team_id INTEGER,
+    bowling_order INTEGER,
+    overs TEXT,
+    maidens INTEGER,
+    runs INTEGER,
+    wickets INTEGER,
+    wides INTEGER,
+    no_balls INTEGER,
+    economy REAL,
+    PRIMARY KEY (circuit, match_id, innings_no, player_id)
+);
+"""
+
+# Name lookups match anywhere in the name, which a b-tree index can't serve,
+# so the searched names are kept in trigram full-text indexes instead. These
+# mirror their table through triggers; INSERT OR REPLACE only fires the delete
+# trigger with recursive_triggers on.
+NAME_INDEXES = {"teams": "name", "batting": "player_name", "bowling": "player_name"}
+
+NAME_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table}_names USING fts5(
+    {column}, content='{table}', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS {table}_names_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO {table}_names (rowid, {column}) VALUES (new.rowid, new.{column});
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_names_delete AFTER DELETE ON {table} BEGIN
+    INSERT INTO {table}_names ({table}_names, rowid, {column})
+    VALUES ('delete', old.rowid, old.{column});
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_names_update AFTER UPDATE ON {table} BEGIN
+    INSERT INTO {table}_names ({table}_names, rowid, {column})
+    VALUES ('delete', old.rowid, old.{column});
+    INSERT INTO {table}_names (rowid, {column}) VALUES (new.rowid, new.{column});
+END;
+"""
+
+# NOCASE indexes older databases were created with; nothing queries them
+LEGACY_INDEXES = ["teams_name", "batting_player", "bowling_player"]
+
+
+def _iso_date(value: Any) -> Optional[str]:
+    """Normalizes the feeds' date formats ('2026-01-21', '21 Jan 2026') to ISO."""
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%d %b %Y"):
+        try:
+            return datetime.strptime(str(value).strip(), fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _strip(value: Any) -> Optional[str]:
+    return value.strip() if isinstance(value, str) else value
+
+
+class MatchStore:
+    """
+    Local SQLite store of everything the client has fetched: competitions,
+    teams, venues, match schedules, innings and batting/bowling rows.
+
+    Tables are indexed for history queries (a team's matches, a player's
+    innings) that would otherwise fan out over many schedule feeds. Writes
+    are upserts, so feeding the same feed twice is harmless.
+
+    The store may be used from any thread (the client writes to it from a
+    worker thread, off the event loop); calls are serialized.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        if path is None:
+            path = Path.home() / ".bcci-tv" / "store.db"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA recursive_triggers=ON")
+        self.conn.executescript(SCHEMA)
+        self._create_name_indexes()
+
+    def _create_name_indexes(self):
+        existing = {
+            row[0]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        for index in LEGACY_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {index}")
+        for table, column in NAME_INDEXES.items():
+            self.conn.executescript(
+                NAME_INDEX_SCHEMA.format(table=table, column=column)
+            )
+            # Databases from before the index need it filled in once
+            if f"{table}_names" not in existing:
+                self.conn.execute(
+                    f"INSERT INTO {table}_names ({table}_names) VALUES ('rebuild')"
+                )
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # Ingestion
+
+    def add_catalog(self, data: Dict[str, Any], circuit: str):
+        """Stores the competitions, teams and venues of a competition catalog."""
+        seasons = {
+            str(div.get("SeasonID")): div.get("SeasonName")
+            for div in data.get("division", [])
+        }
+        competitions = [
+            (
+                circuit,
+                to_int(comp.get("CompetitionID")),
+                _strip(comp.get("CompetitionName")),
+                seasons.get(str(comp.get("SeasonID"))),
+                comp.get("Category"),
+                comp.get("MatchTypeName"),
+                _iso_date(comp.get("MatchStartDate")),
+                _iso_date(comp.get("MatchEndDate")),
+            )
+            for comp in data.get("competition", [])
+            if comp.get("CompetitionID")
+        ]
+        teams = [
+            (circuit, to_int(team.get("TeamId")), _strip(team.get("TeamName")))
+            for team in data.get("teams", [])
+            if team.get("TeamId") and team.get("TeamName")
+        ]
+        venues = [
+            (circuit, to_int(venue.get("GroundId")), _strip(venue.get("GroundName")))
+            for venue in data.get("venues", [])
+            if venue.get("GroundId") and venue.get("GroundName")
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO competitions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                competitions,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO teams VALUES (?, ?, ?)", teams
+            )
+            self.conn.executemany(
+                "INSERT INTO venues (circuit, venue_id, name) VALUES (?, ?, ?) "
+                "ON CONFLICT DO UPDATE SET name = excluded.name",
+                venues,
+            )
+
+    def add_schedule(self, data: Dict[str, Any], circuit: str, competition_id: int):
+        """Stores the matches of a tournament schedule, with their teams and venues."""
+        matches, teams, venues = [], [], []
+        for match in data.get("Matchsummary") or []:
+            if not match.get("MatchID"):
+                continue
+            team1_id = to_int(match.get("FirstBattingTeamID")) or None
+            team2_id = to_int(match.get("SecondBattingTeamID")) or None
+            venue_id = to_int(match.get("GroundID")) or None
+            matches.append(
+                (
+                    circuit,
+                    to_int(match.get("MatchID")),
+                    to_int(match.get("CompetitionID")) or competition_id,
+                    _strip(match.get("MatchName")),
+                    match.get("MatchOrder"),
+                    _iso_date(match.get("MatchDate")),
+                    match.get("MatchStatus"),
+                    venue_id,
+                    team1_id,
+                    team2_id,
+                    to_int(match.get("WinningTeamID")) or None,
+                    match.get("FirstBattingSummary"),
+                    match.get("SecondBattingSummary"),
+                    match.get("Comments"),
+                )
+            )
+            for team_id, key in [
+                (team1_id, "FirstBattingTeamName"),
+                (team2_id, "SecondBattingTeamName"),
+            ]:
+                if team_id and match.get(key):
+                    teams.append((circuit, team_id, _strip(match[key])))
+            if venue_id and match.get("GroundName"):
+                venues.append(
+                    (circuit, venue_id, _strip(match["GroundName"]), match.get("city"))
+                )
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO matches "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                matches,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO teams VALUES (?, ?, ?)", teams
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO venues VALUES (?, ?, ?, ?)", venues
+            )
+
+    def add_match_summary(self, data: Dict[str, Any], circuit: str, match_id: int):
+        """Records the winner from a match summary, for matches already stored."""
+        summaries = data.get("MatchSummary") or []
+        if not summaries:
+            return
+        winner = to_int(summaries[0].get("WinningTeamID")) or None
+        if winner is not None:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "UPDATE matches SET winning_team_id = ? "
+                    "WHERE circuit = ? AND match_id = ?",
+                    (winner, circuit, match_id),
+                )
+
+    def add_innings(
+        self, data: Dict[str, Any], circuit: str, match_id: int, innings: int
+    ):
+        """Stores an innings total and its batting and bowling rows."""
+        record = InningsRecord.from_feed(data, innings)
+        if record is None:
+            return
+
+        key = (circuit, match_id, innings)
+        batting = [
+            (
+                *key,
+                b.player_id,
+                b.player_name,
+                b.team_id,
+                b.playing_order,
+                b.out_desc,
+                b.runs,
+                b.balls,
+                b.fours,
+                b.sixes,
+                b.strike_rate,
+            )
+            for b in record.batting
+        ]
+        bowling = [
+            (
+                *key,
+                b.player_id,
+                b.player_name,
+                b.team_id,
+                b.bowling_order,
+                b.overs,
+                b.maidens,
+                b.runs,
+                b.wickets,
+                b.wides,
+                b.no_balls,
+                b.economy,
+            )
+            for b in record.bowling
+        ]
+
+        with self._lock, self.conn:
+            if record.has_extras:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO innings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        *key,
+                        record.team_id,
+                        record.total,
+                        record.extras,
+                        record.run_rate,
+                    ),
+                )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO batting "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batting,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO bowling "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                bowling,
+            )
+
+    # Queries
+
+    def _rows(self, sql: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, tuple(params))]
+
+    def find_teams(
+        self, name: str, circuit: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Returns the teams whose name contains name (case-insensitive)."""
+        sql = (
+            "SELECT circuit, team_id, name FROM teams "
+            "WHERE rowid IN (SELECT rowid FROM teams_names WHERE name LIKE ?)"
+        )
+        params: List[Any] = [f"%{name.strip()}%"]
+        if circuit:
+            sql += " AND circuit = ?"
+            params.append(circuit)
+        return self._rows(sql + " ORDER BY name", params)
+
+    def team_matches(
+        self,
+        team: str,
+        season: Optional[str] = None,
+        circuit: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the stored matches of every team whose name contains `team`,
+        newest first. season matches the competition's season ('2025-26',
+        or a prefix such as '2025') or the year of the match date.
+        """
+        results: List[Dict[str, Any]] = []
+        for t in self.find_teams(team, circuit):
+            sql = """
+                SELECT m.circuit, m.match_id, m.name, m.match_order, m.match_date,
+                       m.status, m.competition_id, c.name AS competition,
+                       c.season, v.name AS venue, v.city,
+                       t1.name AS team1, t2.name AS team2, w.name AS winner,
+                       m.first_batting_summary, m.second_batting_summary,
+                       m.comments
+                FROM matches m
+                LEFT JOIN competitions c
+                    ON c.circuit = m.circuit AND c.competition_id = m.competition_id
+                LEFT JOIN venues v
+                    ON v.circuit = m.circuit AND v.venue_id = m.venue_id
+                LEFT JOIN teams t1 ON t1.circuit = m.circuit AND t1.team_id = m.team1_id
+                LEFT JOIN teams t2 ON t2.circuit = m.circuit AND t2.team_id = m.team2_id
+                LEFT JOIN teams w
+                    ON w.circuit = m.circuit AND w.team_id = m.winning_team_id
+                WHERE m.circuit = ? AND (m.team1_id = ? OR m.team2_id = ?)
+            """
+            params: List[Any] = [t["circuit"], t["team_id"], t["team_id"]]
+            if season:
+                sql += " AND (c.season LIKE ? OR substr(m.match_date, 1, 4) = ?)"
+                params += [f"{season}%", season]
+            results.extend(self._rows(sql, params))
+
+        results.sort(key=lambda m: m["match_date"] or "", reverse=True)
+        return results[:limit]
+
+    def player_innings(
+        self, player: str, circuit: Optional[str] = None, limit: int = 100
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns the stored batting and bowling rows of players whose name
+        contains `player`, newest match first.
+        """
+        results = {}
+        for table, columns in [
+            ("batting", "b.runs, b.balls, b.fours, b.sixes, b.strike_rate, b.out_desc"),
+            (
+                "bowling",
+                "b.overs, b.maidens, b.runs, b.wickets, b.wides, b.no_balls, b.economy",
+            ),
+        ]:
+            sql = f"""
+                SELECT b.circuit, b.match_id, b.innings_no, b.player_name,
+                       m.name AS match, m.match_date, {columns}
+                FROM {table} b
+                LEFT JOIN matches m
+                    ON m.circuit = b.circuit AND m.match_id = b.match_id
+                WHERE b.rowid IN (
+                    SELECT rowid FROM {table}_names WHERE player_name LIKE ?
+                )
+            """
+            params: List[Any] = [f"%{player.strip()}%"]
+            if circuit:
+                sql += " AND b.circuit = ?"
+                params.append(circuit)
+            sql += " ORDER BY m.match_date DESC, b.match_id DESC LIMIT ?"
+            params.append(limit)
+            results[table] = self._rows(sql, params)
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of rows in each table."""
+        tables = [
+            "competitions",
+            "teams",
+            "venues",
+            "matches",
+            "innings",
+            "batting",
+            "bowling",
+        ]
+        with self._lock:
+            return {
+                table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in tables
+            }
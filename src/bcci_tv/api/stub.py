@@ -0,0 +1,171 @@
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+from bcci_tv.api.replay import Cassette, split_key
+
+logger = logging.getLogger(__name__)
+
+# Fixture served for each kind of feed, matched against the request path
+FIXTURE_ROUTES: List[Tuple[Pattern[str], str]] = [
+    (re.compile(r"/competition\.js$"), "competitions.js"),
+    (re.compile(r"-groupstandings\.js$"), "standings.js"),
+    (re.compile(r"-matchschedule\.js$"), "intl_schedule.js"),
+    (re.compile(r"-matchsummary\.js$"), "match_summary.js"),
+    (re.compile(r"-Innings\d\.js$|^/fetch-inning$"), "match_innings1.js"),
+]
+
+_Response = Tuple[int, Dict[str, str], bytes]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StubServer"
+
+    def do_GET(self):
+        status, headers, body = self.server.stub.respond(
+            self.path, self.headers.get("If-None-Match")
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], stub: "StubUpstream"):
+        super().__init__(address, _Handler)
+        self.stub = stub
+
+
+class StubUpstream:
+    """
+    Local stand-in for scores.bcci.tv and www.bcci.tv, for offline load tests
+    and benchmarks.
+
+    Serves the responses of a recorded cassette (matched on path and query,
+    whatever the host) and falls back to the fixture feeds by kind of feed:
+    any schedule gets the schedule fixture, any innings the innings fixture.
+    Fixture responses carry an ETag and honour If-None-Match.
+
+    Every response is delayed by `latency` seconds plus up to `jitter`, and
+    a share `error_rate` of requests fails with `error_status`. Pass a seed
+    to make the jitter and errors reproducible.
+
+    Point a client at it with RedirectTransport(stub.url).
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Union[str, Path, None] = "tests/fixtures",
+        cassette: Union[str, Path, Cassette, None] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else None
+        if cassette is not None and not isinstance(cassette, Cassette):
+            cassette = Cassette(cassette)
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._fixtures: Dict[str, bytes] = {}
+        # Recorded GETs by path and query, ignoring the host they were sent to
+        self._recorded: Dict[str, str] = {}
+        if cassette is not None:
+            for key in cassette.interactions:
+                method, url = split_key(key)
+                if method == "GET":
+                    self._recorded[url.raw_path.decode("ascii")] = key
+        self._server = _StubServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _fixture(self, name: str) -> bytes:
+        if name not in self._fixtures:
+            self._fixtures[name] = (self.fixtures_dir / name).read_bytes()
+        return self._fixtures[name]
+
+    def respond(self, path: str, if_none_match: Optional[str] = None) -> _Response:
+        """Builds the response to a GET of path (including its query)."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            return self.error_status, {"Content-Type": "text/plain"}, b"injected error"
+
+        key = self._recorded.get(path)
+        if key is not None:
+            with self._lock:
+                recorded = self.cassette.next_for_key(key)
+            return recorded["status"], recorded["headers"], Cassette.content(recorded)
+
+        route = path.split("?", 1)[0]
+        for pattern, name in FIXTURE_ROUTES:
+            if self.fixtures_dir is not None and pattern.search(route):
+                body = self._fixture(name)
+                etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                headers = {"Content-Type": "application/javascript", "ETag": etag}
+                if if_none_match == etag:
+                    return 304, headers, b""
+                return 200, headers, body
+        return 404, {"Content-Type": "text/plain"}, b"not found"
+
+    def start(self) -> "StubUpstream":
+        """Serves in a background thread; returns self."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            # Short poll so stop() returns quickly
+            kwargs={"poll_interval": 0.05},
+            name="bcci-tv-stub",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubUpstream":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
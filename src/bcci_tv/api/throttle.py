@@ -0,0 +1,330 @@
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: throttling and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing host.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are rejected for `reset_timeout` seconds. Then it is half-open: the next
+    call is let through as a trial, other calls are rejected while it is
+    pending, and its outcome closes the circuit or opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._trial_pending = False
+
+    def allow(self) -> bool:
+        """True if a call may be made now."""
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._trial_pending:
+                return False
+            self._trial_pending = True
+        return True
+
+    def release(self):
+        """
+        Gives up an allowed call without an outcome (e.g. it was cancelled),
+        so a half-open circuit lets another trial through.
+        """
+        self._trial_pending = False
+
+    def record_success(self):
+        self._trial_pending = False
+        self.failures = 0
+        self.state = "closed"
+
+    def record_failure(self):
+        self._trial_pending = False
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self.trips += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: allows `rate` requests per second on average,
+    with bursts of up to `burst` requests.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        # Tokens may go negative: later callers queue up behind earlier ones
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """Waits for a token; returns the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to upstream health (additive increase,
+    multiplicative decrease).
+
+    Each successful, fast request raises the limit by 1/limit, so it grows by
+    about one per round of requests. A failure, or a request slower than
+    `latency_threshold`, halves it, at most once per `cooldown` seconds.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        latency_threshold: float = 5.0,
+        cooldown: float = 1.0,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """Waits until a request slot is free and takes it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, ok: Optional[bool], latency: float):
+        """
+        Frees a slot and adjusts the limit from the request's outcome. With
+        ok=None (the request was cancelled, or failed for a reason that says
+        nothing about upstream) the limit is left as it is.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if ok is None:
+                pass
+            elif ok and latency <= self.latency_threshold:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            else:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self.limit = max(self.min_limit, self.limit / 2)
+            self._condition.notify_all()
+
+
+class RequestThrottle:
+    """
+    Client-level request policy: a token bucket and a circuit breaker per
+    host, an adaptive concurrency limit, and retries with jittered
+    exponential backoff that honour Retry-After.
+
+    Timeouts, connection errors and RETRY_STATUS_CODES responses are retried
+    up to `max_retries` times. A Retry-After longer than `retry_after_max`
+    is not waited out. The last response (or exception) is returned to the
+    caller as-is.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        retry_after_max: float = 60.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.limiter = limiter or AdaptiveLimiter()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self.rejected = 0
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Returns the circuit breaker of a host."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout
+            )
+        return breaker
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before retry number `attempt` (0-based): full jitter over an
+        exponentially growing window, or the server's Retry-After if longer.
+        """
+        window = min(self.backoff_max, self.backoff_base * 2**attempt)
+        delay = random.uniform(0, window)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def send(
+        self, host: str, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Sends a request through the circuit breaker, rate limit, concurrency
+        limit and retries. Raises CircuitOpenError while the host's circuit
+        is open.
+        """
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit open for {host}, not calling upstream")
+
+        try:
+            response = await self._send_with_retries(host, request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        if response.status_code in RETRY_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _send_with_retries(
+        self, host: str, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            waited = await self._bucket(host).acquire()
+            if waited:
+                self.throttled += 1
+                self.throttled_seconds += waited
+
+            await self.limiter.acquire()
+            self.requests += 1
+            start = time.monotonic()
+            response = None
+            # Stays None if request() is cancelled or raises a non-transport
+            # error, which shouldn't shrink the concurrency limit
+            ok: Optional[bool] = None
+            try:
+                response = await request()
+                ok = response.status_code not in RETRY_STATUS_CODES
+            except httpx.TransportError as e:
+                # Timeouts and connection errors
+                ok = False
+                if attempt >= self.max_retries:
+                    self.failures += 1
+                    raise
+                logger.warning(f"Request to {host} failed ({e!r}), retrying")
+            finally:
+                await self.limiter.release(ok, time.monotonic() - start)
+
+            if ok:
+                return response
+
+            retry_after = None
+            if response is not None:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if attempt >= self.max_retries or (
+                    retry_after is not None and retry_after > self.retry_after_max
+                ):
+                    self.failures += 1
+                    return response
+                logger.warning(
+                    f"Request to {host} returned {response.status_code}, retrying"
+                )
+
+            await asyncio.sleep(self.backoff(attempt, retry_after))
+            attempt += 1
+            self.retries += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns request, retry and throttling counters, the current concurrency
+        limit and the hosts whose circuit is open.
+        """
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "throttled": self.throttled,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "concurrency_limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "rejected": self.rejected,
+            "open_circuits": sorted(
+                host for host, b in self._breakers.items() if b.state == "open"
+            ),
+        }
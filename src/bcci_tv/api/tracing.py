@@ -0,0 +1,136 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Attribute names are prefixed with this unless they already contain a dot
+ATTRIBUTE_PREFIX = "bcci_tv."
+
+# The tracer spans are started with. Tracing is opt-in: None (the default)
+# makes traced functions plain calls, with no span or argument binding.
+_tracer: Any = None
+
+# Span of the innermost traced call in the current context
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+def set_tracer(tracer: Any):
+    """
+    Replaces the tracer spans are started with. Anything with an
+    OpenTelemetry-style start_as_current_span(name) context manager works;
+    None turns tracing off, which is the default.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def enable_opentelemetry() -> bool:
+    """
+    Starts tracing with the OpenTelemetry global tracer provider. Returns
+    False (leaving tracing off) when opentelemetry-api is not installed.
+    """
+    if otel_trace is None:
+        return False
+    set_tracer(otel_trace.get_tracer("bcci_tv"))
+    return True
+
+
+def get_tracer() -> Any:
+    return _tracer
+
+
+def _attribute_value(value: Any) -> Any:
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)) and all(
+        isinstance(v, (bool, int, float, str)) for v in value
+    ):
+        return list(value)
+    return str(value)
+
+
+def _set_attributes(span: Any, attributes: dict):
+    if not getattr(span, "is_recording", lambda: True)():
+        return
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        name = key if "." in key else ATTRIBUTE_PREFIX + key
+        span.set_attribute(name, _attribute_value(value))
+
+
+@contextmanager
+def span(name: str, /, **attributes: Any) -> Iterator[Any]:
+    """
+    Runs the block in a span named name, nested under the current one.
+    None-valued attributes are skipped. Yields None when tracing is off.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.start_as_current_span(name) as current:
+        _set_attributes(current, attributes)
+        token = _current_span.set(current)
+        try:
+            yield current
+        finally:
+            _current_span.reset(token)
+
+
+def set_attribute(key: str, value: Any):
+    """Sets an attribute on the innermost traced span, if any."""
+    current = _current_span.get()
+    if current is not None:
+        _set_attributes(current, {key: value})
+
+
+def traced(
+    name: Optional[str] = None, attributes: Sequence[str] = ()
+) -> Callable[[F], F]:
+    """
+    Decorates a function or coroutine function to run in a span, named
+    after its qualified name by default. The arguments named in attributes
+    are recorded on the span. When tracing is off the function is called
+    directly.
+    """
+
+    def decorate(fn: F) -> F:
+        span_name = name or fn.__qualname__
+        signature = inspect.signature(fn)
+
+        def arguments(args: tuple, kwargs: dict) -> dict:
+            if not attributes:
+                return {}
+            bound = signature.bind_partial(*args, **kwargs)
+            return {k: bound.arguments.get(k) for k in attributes}
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await fn(*args, **kwargs)
+                with span(span_name, **arguments(args, kwargs)):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(span_name, **arguments(args, kwargs)):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
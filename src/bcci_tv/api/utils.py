@@ -1,6 +1,15 @@
 from typing import Any, Dict, List, Optional
 
+from bcci_tv.api.models import (
+    schedule_records,
+    standings_records,
+    to_float,  # noqa: F401 (re-exported)
+    to_int,  # noqa: F401 (re-exported)
+)
+from bcci_tv.api.tracing import traced
 
+
+@traced()
 def filter_live_competitions(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Filters the competitions list to only include those marked as live.
@@ -18,6 +27,7 @@ def filter_live_competitions(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [comp for comp in all_competitions if comp.get("CompetitionID") in live_ids]
 
 
+@traced()
 def summarize_competitions(
     competitions: List[Dict[str, Any]], circuit: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -50,6 +60,7 @@ def search_competitions(
     return summarize_competitions(filtered, circuit=circuit)
 
 
+@traced()
 def filter_tournament_standings(
     data: Dict[str, Any],
 ) -> Dict[str, List[Dict[str, Any]]]:
@@ -60,50 +71,41 @@ def filter_tournament_standings(
     2. Groups teams from 'points' by their 'Category'.
     3. Sorts teams within each category by 'OrderNo' ascending.
     """
-    categories = data.get("category", [])
-    if not categories:
-        return {}
-
-    # Extract the string values from category objects (e.g. "Group A")
-    # and initialize the result dictionary with those strings as keys
-    category_names = [cat.get("Category") for cat in categories if cat.get("Category")]
-    grouped_standings = {name: [] for name in category_names}
-
-    points = data.get("points", [])
-    for team in points:
-        team_cat = team.get("Category")
-        if team_cat in grouped_standings:
-            grouped_standings[team_cat].append(team)
-
-    # Sort each group by OrderNo (ascending)
-    for cat in grouped_standings:
-        grouped_standings[cat].sort(key=lambda x: int(x.get("OrderNo", 0)))
-
-    return grouped_standings
+    return {
+        category: [record.to_dict() for record in records]
+        for category, records in standings_records(data).items()
+    }
 
 
+# Standings columns kept by simplify_standings by default
+STANDINGS_FIELDS = [
+    "TeamName",
+    "Matches",
+    "Wins",
+    "Loss",
+    "Tied",
+    "NoResult",
+    "Points",
+    "Draw",
+    "ForTeams",
+    "AgainstTeam",
+    "NetRunRate",
+    "Quotient",
+    "OrderNo",
+    "MatchPoints",
+]
+
+
+@traced()
 def simplify_standings(
     standings: Dict[str, List[Dict[str, Any]]],
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Simplifies the grouped standings by keeping only specific keys.
+    Callers can choose the keys with fields (defaults to STANDINGS_FIELDS).
     """
-    keys_to_keep = [
-        "TeamName",
-        "Matches",
-        "Wins",
-        "Loss",
-        "Tied",
-        "NoResult",
-        "Points",
-        "Draw",
-        "ForTeams",
-        "AgainstTeam",
-        "NetRunRate",
-        "Quotient",
-        "OrderNo",
-        "MatchPoints",
-    ]
+    keys_to_keep = fields if fields is not None else STANDINGS_FIELDS
 
     simplified = {}
     for category, teams in standings.items():
@@ -116,6 +118,7 @@ def simplify_standings(
     return simplified
 
 
+@traced(attributes=("match_status",))
 def filter_matches_by_status(
     data: Dict[str, Any], match_status: str
 ) -> List[Dict[str, Any]]:
@@ -123,11 +126,9 @@ def filter_matches_by_status(
     Filters the matches in the API response by their MatchStatus.
     Status can be 'upcoming', 'live', or 'post'.
     """
-    match_details = data.get("Matchsummary") or []
     target_status = match_status.lower()
-
     return [
-        match
-        for match in match_details
-        if match.get("MatchStatus", "").lower() == target_status
+        match.to_dict()
+        for match in schedule_records(data)
+        if match.status == target_status
     ]
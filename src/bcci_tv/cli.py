@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import json
+from typing import List, Optional
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.snapshot import export_tournament
+from bcci_tv.api.stub import StubUpstream
+from bcci_tv.config import Settings
+
+_MB = 1024 * 1024
+
+
+async def _snapshot(args: argparse.Namespace) -> int:
+    async with BCCIApiClient() as client:
+        summary = await export_tournament(
+            client,
+            args.competition_id,
+            circuit=args.circuit,
+            path=args.output,
+            concurrency=args.concurrency,
+        )
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["errors"] else 0
+
+
+async def _cache_stats(args: argparse.Namespace) -> int:
+    max_bytes = int(Settings.from_env().cache_max_mb * _MB)
+    async with BCCIApiClient(cache_max_bytes=max_bytes) as client:
+        usage = client.cache.usage()
+        usage["path"] = str(client.cache.cache_dir)
+    print(json.dumps(usage, indent=2))
+    return 0
+
+
+async def _cache_prune(args: argparse.Namespace) -> int:
+    max_bytes = int(Settings.from_env().cache_max_mb * _MB)
+    if args.max_mb is not None:
+        max_bytes = int(args.max_mb * _MB)
+    async with BCCIApiClient(cache_max_bytes=max_bytes) as client:
+        removed = client.cache.prune()
+        removed["remaining_bytes"] = client.cache.usage()["bytes"]
+    print(json.dumps(removed, indent=2))
+    return 0
+
+
+async def _stub(args: argparse.Namespace) -> int:
+    stub = StubUpstream(
+        fixtures_dir=args.fixtures,
+        cassette=args.cassette,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    ).start()
+    print(f"Serving on {stub.url} (BCCI_TV_UPSTREAM_URL={stub.url})", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        stub.stop()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bcci-tv", description="Command-line tools for bcci.tv data."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    snapshot = commands.add_parser(
+        "snapshot",
+        help="Export a tournament (details, schedule, standings, completed matches).",
+        description=(
+            "Exports a tournament to a compressed archive. Re-running the same "
+            "command resumes an interrupted export and skips stored matches."
+        ),
+    )
+    snapshot.add_argument("competition_id", type=int)
+    snapshot.add_argument(
+        "--circuit",
+        choices=["domestic", "international"],
+        help="Circuit of the competition (looked up if omitted).",
+    )
+    snapshot.add_argument(
+        "-o",
+        "--output",
+        help="Archive path (defaults to tournament_<competition_id>.jsonl.gz).",
+    )
+    snapshot.add_argument(
+        "--concurrency",
+        type=int,
+        default=BCCIApiClient.MATCH_BATCH_CONCURRENCY,
+        help="Matches fetched at once.",
+    )
+    snapshot.set_defaults(handler=_snapshot)
+
+    cache = commands.add_parser("cache", help="Inspect or shrink the feed cache.")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    stats = cache_commands.add_parser(
+        "stats", help="Show the number of cached feeds and their size on disk."
+    )
+    stats.set_defaults(handler=_cache_stats)
+    prune = cache_commands.add_parser(
+        "prune",
+        help="Evict least recently used feeds until the cache fits its size limit.",
+    )
+    prune.add_argument(
+        "--max-mb",
+        type=float,
+        help="Size limit to prune to, in MiB (defaults to BCCI_TV_CACHE_MAX_MB; "
+        "0 empties the cache).",
+    )
+    prune.set_defaults(handler=_cache_prune)
+
+    stub = commands.add_parser(
+        "stub",
+        help="Serve fixture feeds and recorded cassettes as a local upstream.",
+        description=(
+            "Serves recorded cassette responses, falling back to the fixture "
+            "feeds, for offline load tests. Point the server at it with "
+            "BCCI_TV_UPSTREAM_URL."
+        ),
+    )
+    stub.add_argument("--host", default="127.0.0.1")
+    stub.add_argument("--port", type=int, default=8080)
+    stub.add_argument(
+        "--fixtures", default="tests/fixtures", help="Directory of fixture feeds."
+    )
+    stub.add_argument("--cassette", help="Cassette of recorded responses to serve.")
+    stub.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to each response."
+    )
+    stub.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra latency, up to this."
+    )
+    stub.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests (0-1) answered with --error-status.",
+    )
+    stub.add_argument("--error-status", type=int, default=503)
+    stub.add_argument("--seed", type=int, help="Seed for jitter and errors.")
+    stub.set_defaults(handler=_stub)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the bcci-tv command-line tools.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(args.handler(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+import os
+from dataclasses import dataclass
+
+
+def _env_int(name: str, default: int) -> int:
+    """Reads an integer setting from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Reads a boolean setting (1/true/yes/on, anything else is off) from the env."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_str(name: str, default: str) -> str:
+    """Reads a string setting from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip()
+
+
+def _env_float(name: str, default: float) -> float:
+    """Reads a float setting from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+@dataclass
+class Settings:
+    """
+    Runtime settings for the MCP server.
+    Every field can be overridden with a BCCI_TV_<FIELD_NAME> environment variable.
+    """
+
+    timeout: float = 30.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    poll_interval: float = 15.0
+    poll_max_interval: float = 120.0
+    batch_concurrency: int = 8
+    rate_limit: float = 10.0
+    rate_burst: int = 20
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 10.0
+    latency_threshold: float = 5.0
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+    warmup: bool = True
+    warmup_concurrency: int = 4
+    cache_max_mb: float = 100.0
+    shared_cache: bool = False
+    # Record/replay upstream responses (see bcci_tv.api.replay)
+    cassette: str = ""
+    cassette_mode: str = "replay"
+    # Send every upstream request to this server instead, e.g. a stub upstream
+    upstream_url: str = ""
+    # Keep fetched data in the local SQLite store (see bcci_tv.api.store)
+    store: bool = False
+    # Start OpenTelemetry spans (see bcci_tv.api.tracing)
+    tracing: bool = False
+    # Empty means ~/.bcci-tv/store.db
+    store_path: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Builds settings from BCCI_TV_* environment variables."""
+        return cls(
+            timeout=_env_float("BCCI_TV_TIMEOUT", cls.timeout),
+            max_connections=_env_int("BCCI_TV_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=_env_int(
+                "BCCI_TV_MAX_KEEPALIVE_CONNECTIONS", cls.max_keepalive_connections
+            ),
+            keepalive_expiry=_env_float(
+                "BCCI_TV_KEEPALIVE_EXPIRY", cls.keepalive_expiry
+            ),
+            poll_interval=_env_float("BCCI_TV_POLL_INTERVAL", cls.poll_interval),
+            poll_max_interval=_env_float(
+                "BCCI_TV_POLL_MAX_INTERVAL", cls.poll_max_interval
+            ),
+            batch_concurrency=_env_int(
+                "BCCI_TV_BATCH_CONCURRENCY", cls.batch_concurrency
+            ),
+            rate_limit=_env_float("BCCI_TV_RATE_LIMIT", cls.rate_limit),
+            rate_burst=_env_int("BCCI_TV_RATE_BURST", cls.rate_burst),
+            max_retries=_env_int("BCCI_TV_MAX_RETRIES", cls.max_retries),
+            retry_backoff=_env_float("BCCI_TV_RETRY_BACKOFF", cls.retry_backoff),
+            retry_backoff_max=_env_float(
+                "BCCI_TV_RETRY_BACKOFF_MAX", cls.retry_backoff_max
+            ),
+            latency_threshold=_env_float(
+                "BCCI_TV_LATENCY_THRESHOLD", cls.latency_threshold
+            ),
+            breaker_threshold=_env_int(
+                "BCCI_TV_BREAKER_THRESHOLD", cls.breaker_threshold
+            ),
+            breaker_reset=_env_float("BCCI_TV_BREAKER_RESET", cls.breaker_reset),
+            warmup=_env_bool("BCCI_TV_WARMUP", cls.warmup),
+            warmup_concurrency=_env_int(
+                "BCCI_TV_WARMUP_CONCURRENCY", cls.warmup_concurrency
+            ),
+            cache_max_mb=_env_float("BCCI_TV_CACHE_MAX_MB", cls.cache_max_mb),
+            shared_cache=_env_bool("BCCI_TV_SHARED_CACHE", cls.shared_cache),
+            cassette=_env_str("BCCI_TV_CASSETTE", cls.cassette),
+            cassette_mode=_env_str("BCCI_TV_CASSETTE_MODE", cls.cassette_mode),
+            upstream_url=_env_str("BCCI_TV_UPSTREAM_URL", cls.upstream_url),
+            store=_env_bool("BCCI_TV_STORE", cls.store),
+            tracing=_env_bool("BCCI_TV_TRACING", cls.tracing),
+            store_path=_env_str("BCCI_TV_STORE_PATH", cls.store_path),
+        )
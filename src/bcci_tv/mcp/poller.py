@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.delta import SnapshotHistory
+
+logger = logging.getLogger(__name__)
+
+# Called with the resource URI whenever a watched match changes
+Listener = Callable[[str], Awaitable[Any]]
+
+_MATCH_URI_RE = re.compile(r"^match://(domestic|international)/(\d+)$")
+
+
+def match_uri(circuit: str, match_id: int) -> str:
+    """Returns the resource URI of a match, e.g. 'match://domestic/12345'."""
+    return f"match://{circuit}/{match_id}"
+
+
+def parse_match_uri(uri: str) -> Optional[Tuple[str, int]]:
+    """Parses a match resource URI into (circuit, match_id), or None."""
+    match = _MATCH_URI_RE.match(uri)
+    if not match:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+def _is_finished(snapshot: Dict[str, Any]) -> bool:
+    return str(snapshot.get("overall", {}).get("IsMatchEnd", "0")) == "1"
+
+
+class _WatchedMatch:
+    """Polling state of one subscribed match."""
+
+    __slots__ = ("circuit", "match_id", "uri", "snapshot", "listeners", "task")
+
+    def __init__(self, circuit: str, match_id: int):
+        self.circuit = circuit
+        self.match_id = match_id
+        self.uri = match_uri(circuit, match_id)
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.listeners: Set[Listener] = set()
+        self.task: Optional[asyncio.Task] = None
+
+
+class MatchPoller:
+    """
+    Polls subscribed live matches and notifies listeners when they change.
+
+    Each match is polled by a single task however many listeners it has. The
+    poll interval starts at `interval`, doubles (up to `max_interval`) while
+    the match is unchanged and resets as soon as it changes. Polling stops
+    once the match has ended or its last listener unsubscribes.
+    """
+
+    def __init__(
+        self,
+        client: BCCIApiClient,
+        interval: float = BCCIApiClient.LIVE_MATCH_TTL,
+        max_interval: float = 120.0,
+    ):
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self._matches: Dict[Tuple[str, int], _WatchedMatch] = {}
+        self.history = SnapshotHistory()
+
+    async def get_snapshot(self, circuit: str, match_id: int) -> Dict[str, Any]:
+        """
+        Returns the latest snapshot of a match, as from get_full_match_summary.
+        Subscribed matches are served from memory; others are fetched.
+        """
+        watched = self._matches.get((circuit, match_id))
+        if watched is not None and watched.snapshot is not None:
+            return watched.snapshot
+        return await self.client.get_full_match_summary(match_id, circuit=circuit)
+
+    async def get_versioned_snapshot(
+        self, circuit: str, match_id: int, since: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns the latest snapshot with its version token, or only the changes
+        since an earlier version (see SnapshotHistory.versioned).
+        """
+        snapshot = await self.get_snapshot(circuit, match_id)
+        return self.history.versioned((circuit, match_id), snapshot, since)
+
+    def subscribe(self, circuit: str, match_id: int, listener: Listener):
+        """Registers a listener and starts polling the match if needed."""
+        key = (circuit, match_id)
+        watched = self._matches.get(key)
+        if watched is None:
+            watched = self._matches[key] = _WatchedMatch(circuit, match_id)
+        watched.listeners.add(listener)
+        if watched.task is None:
+            watched.task = asyncio.create_task(self._poll(watched))
+
+    def unsubscribe(self, circuit: str, match_id: int, listener: Listener):
+        """Removes a listener; the match is dropped when none are left."""
+        watched = self._matches.get((circuit, match_id))
+        if watched is None:
+            return
+        watched.listeners.discard(listener)
+        if not watched.listeners:
+            del self._matches[(circuit, match_id)]
+            if watched.task is not None:
+                watched.task.cancel()
+
+    def remove_listener(self, listener: Listener):
+        """Removes a listener from every match, e.g. when its session closes."""
+        for circuit, match_id in list(self._matches):
+            self.unsubscribe(circuit, match_id, listener)
+
+    def is_polling(self, circuit: str, match_id: int) -> bool:
+        """True while the match is being polled."""
+        watched = self._matches.get((circuit, match_id))
+        return watched is not None and watched.task is not None
+
+    async def _poll(self, watched: _WatchedMatch):
+        interval = self.interval
+        try:
+            while True:
+                try:
+                    snapshot = await self.client.get_full_match_summary(
+                        watched.match_id, circuit=watched.circuit
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to poll {watched.uri}: {e}")
+                    interval = min(interval * 2, self.max_interval)
+                else:
+                    if snapshot != watched.snapshot:
+                        watched.snapshot = snapshot
+                        interval = self.interval
+                        await self._notify(watched)
+                    else:
+                        interval = min(interval * 2, self.max_interval)
+                    if _is_finished(snapshot):
+                        break
+                await asyncio.sleep(interval)
+        finally:
+            watched.task = None
+
+    async def _notify(self, watched: _WatchedMatch):
+        for listener in list(watched.listeners):
+            try:
+                await listener(watched.uri)
+            except Exception as e:
+                # The listener's session is most likely gone
+                logger.warning(f"Dropping listener for {watched.uri}: {e}")
+                watched.listeners.discard(listener)
+
+    async def close(self):
+        """Stops all polling tasks and forgets every subscription."""
+        tasks = [w.task for w in self._matches.values() if w.task is not None]
+        self._matches.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
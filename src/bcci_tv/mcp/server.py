@@ -1,18 +1,100 @@
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+import functools
 import json
 import asyncio
-from typing import Optional
-from bcci_tv.api.client import BCCIApiClient
-from bcci_tv.api.utils import (
-    filter_tournament_standings,
-    simplify_standings,
-    summarize_competitions,
-    search_competitions as search_competitions_util,
-    filter_matches_by_status,
-)
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, List, Optional
+from bcci_tv.api.client import track_staleness
+from bcci_tv.api.tracing import span
+from bcci_tv.api.utils import STANDINGS_FIELDS, summarize_competitions
+from bcci_tv.mcp.poller import MatchPoller, parse_match_uri
+from bcci_tv.mcp.session import get_client, get_poller, lifespan, run_in_background
+
+logger = logging.getLogger(__name__)
 
 # Create FastMCP instance
-mcp = FastMCP("bcci-tv")
+mcp = FastMCP("bcci-tv", lifespan=lifespan)
+
+
+class ToolMetrics(Middleware):
+    """Records the count, outcome and latency of every tool call."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = await call_next(context)
+            ok = True
+            return result
+        finally:
+            get_client().metrics.record_tool(
+                context.message.name, time.perf_counter() - start, ok=ok
+            )
+
+
+class ToolTracing(Middleware):
+    """
+    Runs every tool call in a trace span, so the client, HTTP and parsing
+    spans it causes nest under it. Scalar arguments such as match_id and
+    innings are recorded as span attributes.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        arguments = {
+            key: value
+            for key, value in (context.message.arguments or {}).items()
+            if isinstance(value, (bool, int, float, str))
+        }
+        with span(
+            f"tool {context.message.name}", tool=context.message.name, **arguments
+        ):
+            return await call_next(context)
+
+
+mcp.add_middleware(ToolMetrics())
+mcp.add_middleware(ToolTracing())
+
+
+def _report_staleness(
+    tool: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Tells the caller when a tool's answer was built from stale cached feeds
+    (served while refreshing, or because scores.bcci.tv is unavailable).
+    Dict results get a "stale" key; other results get a note alongside.
+    """
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        with track_staleness() as stale:
+            result = await tool(*args, **kwargs)
+        if not stale:
+            return result
+        if isinstance(result, dict):
+            return {**result, "stale": stale}
+
+        feeds = ", ".join(
+            f"{s['feed']} ({s['age_seconds'] // 60} min old, {s['reason']})"
+            for s in stale
+        )
+        note = f"Note: some of this data may be out of date. Served from cache: {feeds}"
+        return ToolResult(
+            content=[
+                TextContent(type="text", text=json.dumps(result)),
+                TextContent(type="text", text=note),
+            ],
+            structured_content={"result": result},
+            meta={"stale": stale},
+        )
+
+    return wrapper
 
 
 @mcp.resource("tournaments://domestic/catalog")
@@ -21,11 +103,11 @@ async def get_domestic_tournaments_catalog() -> str:
     Returns a minimal catalog of all domestic tournaments (CompetitionID and CompetitionName).
     Use this to look up domestic tournament IDs.
     """
-    async with BCCIApiClient() as client:
-        data = await client.get_domestic_competitions()
-        all_comps = data.get("competition", [])
-        catalog = summarize_competitions(all_comps)
-        return json.dumps(catalog, indent=2)
+    client = get_client()
+    data = await client.get_domestic_competitions()
+    all_comps = data.get("competition", [])
+    catalog = summarize_competitions(all_comps)
+    return json.dumps(catalog, indent=2)
 
 
 @mcp.resource("tournaments://international/catalog")
@@ -34,17 +116,138 @@ async def get_international_tournaments_catalog() -> str:
     Returns a minimal catalog of all international tournaments (CompetitionID and CompetitionName).
     Use this to look up international tournament IDs.
     """
-    async with BCCIApiClient() as client:
-        data = await client.get_international_competitions()
-        all_comps = data.get("competition", [])
-        catalog = summarize_competitions(all_comps)
-        return json.dumps(catalog, indent=2)
+    client = get_client()
+    data = await client.get_international_competitions()
+    all_comps = data.get("competition", [])
+    catalog = summarize_competitions(all_comps)
+    return json.dumps(catalog, indent=2)
+
+
+@mcp.resource("match://{circuit}/{match_id}")
+async def get_match_snapshot(circuit: str, match_id: int) -> str:
+    """
+    Returns the latest overall summary and innings details of a match.
+    Subscribe to this resource to be notified when a live match changes,
+    instead of polling the match summary tools.
+    """
+    if circuit not in ["domestic", "international"]:
+        raise ValueError(f"Unknown circuit: {circuit}")
+    snapshot = await get_poller().get_snapshot(circuit, match_id)
+    return json.dumps(snapshot)
+
+
+@mcp.resource("metrics://snapshot", mime_type="application/json")
+async def get_metrics_snapshot() -> str:
+    """
+    Returns the server's metrics as JSON: upstream requests, latency, bytes
+    and errors per endpoint, parse time, cache hit rates per feed and tool
+    call latency, plus the client's request counters.
+    """
+    client = get_client()
+    return json.dumps({"metrics": client.metrics.snapshot(), "client": client.stats()})
+
+
+@mcp.resource("metrics://prometheus", mime_type="text/plain")
+async def get_metrics_prometheus() -> str:
+    """Returns the server's metrics in the Prometheus text format."""
+    return get_client().metrics.to_prometheus()
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint, served when running over HTTP."""
+    return PlainTextResponse(
+        get_client().metrics.to_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def _enable_resource_subscriptions(server: FastMCP):
+    """
+    Handles resources/subscribe and resources/unsubscribe for match://
+    resources, and advertises resources.subscribe in the server capabilities.
+
+    FastMCP has no API for resource subscriptions, and the MCP SDK server it
+    wraps always advertises subscribe=False. Both are therefore set up on
+    FastMCP's private SDK server (_mcp_server): its get_capabilities is
+    wrapped, and its subscribe_resource/unsubscribe_resource handlers are
+    registered. Raises RuntimeError at import if a FastMCP release no longer
+    has them, rather than silently serving without subscriptions.
+    """
+    low_level = getattr(server, "_mcp_server", None)
+    missing = [
+        name
+        for name in ("get_capabilities", "subscribe_resource", "unsubscribe_resource")
+        if not callable(getattr(low_level, name, None))
+    ]
+    if low_level is None or missing:
+        raise RuntimeError(
+            "Unsupported fastmcp version: resource subscriptions need "
+            f"FastMCP._mcp_server with {', '.join(missing) or 'its handlers'}"
+        )
+    get_capabilities = low_level.get_capabilities
+
+    @functools.wraps(get_capabilities)
+    def with_subscriptions(*args, **kwargs):
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low_level.get_capabilities = with_subscriptions
+
+    # Sessions whose close already drops their listeners from the poller
+    watched_sessions: "weakref.WeakSet" = weakref.WeakSet()
+
+    def drop_listeners_on_close(session, poller: MatchPoller):
+        if session in watched_sessions:
+            return
+        exit_stack = getattr(session, "_exit_stack", None)
+        if exit_stack is None:
+            # Dead listeners are then only dropped when a notify to them fails
+            logger.warning("Cannot watch MCP session close; listeners drop on failure")
+            return
+        watched_sessions.add(session)
+        listener = session.send_resource_updated
+
+        async def remove_listener():
+            poller.remove_listener(listener)
+
+        exit_stack.push_async_callback(remove_listener)
+
+    @low_level.subscribe_resource()
+    async def subscribe_match(uri) -> None:
+        """Starts polling a match for the subscribing session."""
+        parsed = parse_match_uri(str(uri))
+        if parsed is not None:
+            session = low_level.request_context.session
+            poller = get_poller()
+            poller.subscribe(*parsed, session.send_resource_updated)
+            drop_listeners_on_close(session, poller)
+
+    @low_level.unsubscribe_resource()
+    async def unsubscribe_match(uri) -> None:
+        """Stops notifying the session; polling stops with the last subscriber."""
+        parsed = parse_match_uri(str(uri))
+        if parsed is not None:
+            session = low_level.request_context.session
+            get_poller().unsubscribe(*parsed, session.send_resource_updated)
+
+
+_enable_resource_subscriptions(mcp)
 
 
 @mcp.tool()
-async def search_competitions(query: str, circuit: Optional[str] = None) -> list:
+@_report_staleness
+async def search_competitions(
+    query: str, circuit: Optional[str] = None, limit: int = 10
+) -> list:
     """
     Searches for tournaments/competitions/series by name to find their ID.
+    Results are ranked by relevance, then by most recent season.
+
+    Matching tolerates prefixes ('Haz'), single typos ('Hazre'), abbreviations
+    ('SMAT', 'VHT') and season years ('Ranji 2025').
 
     It is best to provide the circuit ('domestic' or 'international') if known
     from context to speed up the search and avoid multiple lookups.
@@ -53,36 +256,36 @@ async def search_competitions(query: str, circuit: Optional[str] = None) -> list
     Args:
         query (str): The search term (e.g., 'Vijay Hazare Trophy', 'Ranji').
         circuit (str, optional): The circuit to search in ('domestic' or 'international').
+        limit (int, optional): Maximum number of results to return. Defaults to 10.
     """
-    async with BCCIApiClient() as client:
-        results = []
-
-        # Determine which circuits to search
-        circuits_to_search = []
-        if circuit in ["domestic", "international"]:
-            circuits_to_search = [circuit]
-        else:
-            circuits_to_search = ["domestic", "international"]
-
-        for c in circuits_to_search:
-            if c == "domestic":
-                data = await client.get_domestic_competitions()
-            else:
-                data = await client.get_international_competitions()
-
-            all_comps = data.get("competition", [])
-            matches = search_competitions_util(all_comps, query, circuit=c)
-            results.extend(matches)
-
-            # If we were searching without context and found matches in domestic,
-            # we return them immediately as per "domestic first" logic
-            if not circuit and results:
-                break
-
+    client = get_client()
+
+    async def search_circuit(c: str) -> list:
+        index = await client.get_competition_index(c)
+        return summarize_competitions(index.search(query, limit=limit), circuit=c)
+
+    if circuit in ["domestic", "international"]:
+        return await search_circuit(circuit)
+
+    # Without context, load both catalogs concurrently but keep "domestic first"
+    # semantics: domestic matches are returned as soon as they are available.
+    international = asyncio.create_task(search_circuit("international"))
+    try:
+        results = await search_circuit("domestic")
+    except BaseException:
+        international.cancel()
+        raise
+
+    if results:
+        # Let the international lookup finish in the background to warm its cache
+        run_in_background(international)
         return results
 
+    return await international
+
 
 @mcp.tool()
+@_report_staleness
 async def get_live_tournaments(circuit: Optional[str] = None) -> list:
     """
     Fetches and returns a list of live cricket tournaments/competitions.
@@ -92,12 +295,13 @@ async def get_live_tournaments(circuit: Optional[str] = None) -> list:
         Defaults to 'domestic' if unclear.
     """
     target_circuit = circuit if circuit in ["domestic", "international"] else "domestic"
-    async with BCCIApiClient() as client:
-        tournaments = await client.get_live_tournaments(circuit=target_circuit)
-        return summarize_competitions(tournaments, circuit=target_circuit)
+    client = get_client()
+    tournaments = await client.get_live_tournaments(circuit=target_circuit)
+    return summarize_competitions(tournaments, circuit=target_circuit)
 
 
 @mcp.tool()
+@_report_staleness
 async def get_tournament_details(competition_id: int, circuit: str) -> dict:
     """
     Fetches full metadata/details for a specific tournament/competition/series.
@@ -107,14 +311,15 @@ async def get_tournament_details(competition_id: int, circuit: str) -> dict:
         competition_id (int): The unique ID of the competition.
         circuit (str): The circuit the tournament belongs to ('domestic' or 'international').
     """
-    async with BCCIApiClient() as client:
-        details = await client.get_competition_details(competition_id, circuit=circuit)
-        if details:
-            return details
-        return {"error": f"Competition {competition_id} not found in {circuit} circuit"}
+    client = get_client()
+    details = await client.get_competition_details(competition_id, circuit=circuit)
+    if details:
+        return details
+    return {"error": f"Competition {competition_id} not found in {circuit} circuit"}
 
 
 @mcp.tool()
+@_report_staleness
 async def get_tournament_schedule(
     competition_id: int, circuit: str, match_status: Optional[str] = None
 ) -> list:
@@ -130,16 +335,18 @@ async def get_tournament_schedule(
             - 'live': For matches currently in progress.
             - 'post': For matches that have already completed.
     """
-    async with BCCIApiClient() as client:
-        data = await client.get_tournament_schedule(competition_id, circuit)
+    client = get_client()
+    matches = await client.get_schedule_records(competition_id, circuit)
 
-        if match_status:
-            return filter_matches_by_status(data, match_status)
+    if match_status:
+        target_status = match_status.lower()
+        return [m.to_dict() for m in matches if m.status == target_status]
 
-        return data.get("Matchsummary") or []
+    return [m.to_dict() for m in matches]
 
 
 @mcp.tool()
+@_report_staleness
 async def get_tournament_standings(competition_id: int) -> dict:
     """
     Fetches the standings for a specific tournament/competition/series.
@@ -154,102 +361,157 @@ async def get_tournament_standings(competition_id: int) -> dict:
     Args:
         competition_id (int): The unique ID of the competition/tournament.
     """
-    async with BCCIApiClient() as client:
-        raw_data = await client.get_tournament_standings(competition_id)
-        filtered = filter_tournament_standings(raw_data)
-        return simplify_standings(filtered)
+    client = get_client()
+    standings = await client.get_standings_records(
+        competition_id, fields=STANDINGS_FIELDS
+    )
+    return {
+        category: [team.to_dict(STANDINGS_FIELDS) for team in teams]
+        for category, teams in standings.items()
+    }
 
 
 @mcp.tool()
+@_report_staleness
 async def get_domestic_match_summary(
-    match_id: int, innings: Optional[int] = None
+    match_id: int, innings: Optional[int] = None, since: Optional[str] = None
 ) -> dict:
     """
     Fetches the summary for a specific domestic match.
     If no innings is specified, it automatically retrieves the overall summary
     and all completed innings details.
 
+    Every response carries a 'version' token. To follow a live match, pass the
+    last token back as `since`: only the fields and BattingCard / BowlingCard /
+    FallOfWickets rows that changed since that version are returned. If the
+    version is no longer known, or anything was removed since, the full
+    summary is returned instead (without a 'since' key).
+
     Args:
         match_id (int): The unique ID of the match.
         innings (int, optional): Specific innings number (1-4) to retrieve.
+        since (str, optional): Version token from an earlier response.
     """
-    async with BCCIApiClient() as client:
-        # 1. If user specified a particular innings, get only that.
-        if innings is not None:
-            return await client.get_domestic_match_summary(match_id, innings)
-
-        # 2. Get the match summary without any innings (overall summary).
-        overall_data = await client.get_domestic_match_summary(match_id)
-
-        # Match data is nested within 'MatchSummary' list
-        match_summary_list = overall_data.get("MatchSummary", [])
-        overall_summary = match_summary_list[0] if match_summary_list else {}
+    client = get_client()
+    poller = get_poller()
+    # 1. If user specified a particular innings, get only that.
+    if innings is not None:
+        data = await client.get_domestic_match_summary(match_id, innings)
+        return poller.history.versioned(("domestic", match_id, innings), data, since)
 
-        # 3. Use CurrentInnings to determine how many innings to fetch.
-        # User confirmed we can assume this is a string value.
-        current_innings_str = overall_summary.get("CurrentInnings", "0")
-        try:
-            num_innings = int(current_innings_str)
-        except (ValueError, TypeError):
-            num_innings = 0
-
-        # 4. Collect details for each innings concurrently.
-        innings_details = []
-        if num_innings > 0:
-            tasks = [
-                client.get_domestic_match_summary(match_id, i)
-                for i in range(1, num_innings + 1)
-            ]
-            innings_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for i, result in enumerate(innings_results):
-                if not isinstance(result, Exception):
-                    innings_details.append(result)
-
-        return {"overall": overall_summary, "innings_details": innings_details}
+    # 2. Otherwise, get the overall summary plus every innings played so far,
+    # from the poller's snapshot when the match is subscribed.
+    return await poller.get_versioned_snapshot("domestic", match_id, since)
 
 
 @mcp.tool()
-async def get_intl_match_summary(match_id: int, innings: Optional[int] = None) -> dict:
+@_report_staleness
+async def get_intl_match_summary(
+    match_id: int, innings: Optional[int] = None, since: Optional[str] = None
+) -> dict:
     """
     Fetches the summary for a specific international match.
     If no innings is specified, it automatically retrieves the overall summary
     and all completed innings details.
 
+    Every response carries a 'version' token. To follow a live match, pass the
+    last token back as `since`: only the fields and BattingCard / BowlingCard /
+    FallOfWickets rows that changed since that version are returned. If the
+    version is no longer known, or anything was removed since, the full
+    summary is returned instead (without a 'since' key).
+
     Args:
         match_id (int): The unique ID of the match.
         innings (int, optional): Specific innings number (1-4) to retrieve.
+        since (str, optional): Version token from an earlier response.
     """
-    async with BCCIApiClient() as client:
-        # 1. If user specified a particular innings, get only that.
-        if innings is not None:
-            return await client.get_international_match_summary(match_id, innings)
+    client = get_client()
+    poller = get_poller()
+    # 1. If user specified a particular innings, get only that.
+    if innings is not None:
+        data = await client.get_international_match_summary(match_id, innings)
+        return poller.history.versioned(
+            ("international", match_id, innings), data, since
+        )
 
-        # 2. Get the match summary without any innings (overall summary).
-        overall_data = await client.get_international_match_summary(match_id)
+    # 2. Otherwise, get the overall summary plus every innings played so far,
+    # from the poller's snapshot when the match is subscribed.
+    return await poller.get_versioned_snapshot("international", match_id, since)
 
-        # Match data is nested within 'MatchSummary' list
-        match_summary_list = overall_data.get("MatchSummary", [])
-        overall_summary = match_summary_list[0] if match_summary_list else {}
 
-        # 3. Use CurrentInnings to determine how many innings to fetch.
-        current_innings_str = overall_summary.get("CurrentInnings", "0")
-        try:
-            num_innings = int(current_innings_str)
-        except (ValueError, TypeError):
-            num_innings = 0
-
-        # 4. Collect details for each innings concurrently.
-        innings_details = []
-        if num_innings > 0:
-            tasks = [
-                client.get_international_match_summary(match_id, i)
-                for i in range(1, num_innings + 1)
-            ]
-            innings_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for i, result in enumerate(innings_results):
-                if not isinstance(result, Exception):
-                    innings_details.append(result)
-
-        return {"overall": overall_summary, "innings_details": innings_details}
+@mcp.tool()
+@_report_staleness
+async def get_match_summaries(
+    match_ids: List[int], circuit: str, innings: Optional[int] = None
+) -> list:
+    """
+    Fetches the summaries of several matches at once, e.g. every match of a
+    tournament round. Use this instead of calling the match summary tools
+    one match at a time.
+
+    Results are returned in the same order as match_ids, each as
+    {"match_id": ..., "data": {...}}, or {"match_id": ..., "error": "..."}
+    if that match could not be fetched.
+
+    Args:
+        match_ids (list[int]): The unique IDs of the matches.
+        circuit (str): The circuit ('domestic' or 'international').
+        innings (int, optional): Specific innings number (1-4) to retrieve for
+            every match. By default, the overall summary and all innings are returned.
+    """
+    client = get_client()
+    return await client.get_match_summaries(
+        match_ids,
+        circuit=circuit,
+        innings="all" if innings is None else innings,
+    )
+
+
+@mcp.tool()
+async def get_team_history(
+    team: str,
+    season: Optional[str] = None,
+    circuit: Optional[str] = None,
+    limit: int = 50,
+) -> dict:
+    """
+    Lists the matches of a team, newest first, answered from the local store
+    without calling bcci.tv. The store holds every schedule fetched before
+    (live tournaments are loaded on startup), so use get_tournament_schedule
+    first if a tournament's matches are missing.
+
+    Args:
+        team (str): Part of the team name (e.g., 'Mumbai', 'India').
+        season (str, optional): The season ('2025-26') or year ('2025').
+        circuit (str, optional): The circuit ('domestic' or 'international').
+        limit (int, optional): Maximum number of matches to return. Defaults to 50.
+    """
+    store = get_client().store
+    if store is None:
+        return {"error": "The local store is disabled (set BCCI_TV_STORE=1)"}
+    return {
+        "teams": await asyncio.to_thread(store.find_teams, team, circuit),
+        "matches": await asyncio.to_thread(
+            store.team_matches, team, season, circuit, limit=limit
+        ),
+    }
+
+
+@mcp.tool()
+async def get_player_history(
+    player: str, circuit: Optional[str] = None, limit: int = 50
+) -> dict:
+    """
+    Lists a player's batting and bowling innings, newest first, answered from
+    the local store. Only scorecards fetched before (with the match summary
+    tools) are included.
+
+    Args:
+        player (str): Part of the player name (e.g., 'Kohli').
+        circuit (str, optional): The circuit ('domestic' or 'international').
+        limit (int, optional): Maximum number of innings of each kind. Defaults to 50.
+    """
+    store = get_client().store
+    if store is None:
+        return {"error": "The local store is disabled (set BCCI_TV_STORE=1)"}
+    return await asyncio.to_thread(store.player_innings, player, circuit, limit=limit)
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Optional, Set, Union
+
+import httpx
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.replay import build_transport
+from bcci_tv.api.store import MatchStore
+from bcci_tv.api.throttle import AdaptiveLimiter, RequestThrottle
+from bcci_tv.api.tracing import enable_opentelemetry
+from bcci_tv.config import Settings
+from bcci_tv.mcp.poller import MatchPoller
+from bcci_tv.mcp.warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[BCCIApiClient] = None
+_poller: Optional[MatchPoller] = None
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _open_store(path: str) -> Optional[MatchStore]:
+    """
+    Opens the local store, or returns None (running without one) if it can't
+    be opened: store errors must not stop the server.
+    """
+    try:
+        return MatchStore(path or None)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Running without the local store, it could not be opened: {e}")
+        return None
+
+
+def get_client() -> BCCIApiClient:
+    """
+    Returns the process-wide API client shared by all tools and resources.
+    The client (and its connection pool) is created on first use.
+    """
+    global _client
+    if _client is None:
+        settings = Settings.from_env()
+        if settings.tracing and not enable_opentelemetry():
+            logger.warning(
+                "BCCI_TV_TRACING is set but opentelemetry-api is not installed"
+            )
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        )
+        # Adaptive concurrency starts at the keep-alive pool size and can grow
+        # up to the connection limit while upstream stays healthy
+        throttle = RequestThrottle(
+            rate=settings.rate_limit,
+            burst=settings.rate_burst,
+            max_retries=settings.max_retries,
+            backoff_base=settings.retry_backoff,
+            backoff_max=settings.retry_backoff_max,
+            failure_threshold=settings.breaker_threshold,
+            reset_timeout=settings.breaker_reset,
+            limiter=AdaptiveLimiter(
+                initial=settings.max_keepalive_connections,
+                max_limit=settings.max_connections,
+                latency_threshold=settings.latency_threshold,
+            ),
+        )
+        store = _open_store(settings.store_path) if settings.store else None
+        _client = BCCIApiClient(
+            limits=limits,
+            timeout=settings.timeout,
+            throttle=throttle,
+            store=store,
+            cache_max_bytes=int(settings.cache_max_mb * 1024 * 1024),
+            shared_cache=settings.shared_cache,
+            batch_concurrency=settings.batch_concurrency,
+            transport=build_transport(
+                limits,
+                cassette=settings.cassette,
+                cassette_mode=settings.cassette_mode,
+                upstream_url=settings.upstream_url,
+            ),
+        )
+    return _client
+
+
+def get_poller() -> MatchPoller:
+    """Returns the process-wide live-match poller, backed by the shared client."""
+    global _poller
+    if _poller is None:
+        settings = Settings.from_env()
+        _poller = MatchPoller(
+            get_client(),
+            interval=settings.poll_interval,
+            max_interval=settings.poll_max_interval,
+        )
+    return _poller
+
+
+def _log_background_failure(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background task failed: {task.exception()}")
+
+
+def run_in_background(
+    task: Union[asyncio.Task, Coroutine[Any, Any, Any]],
+) -> asyncio.Task:
+    """
+    Keeps a task (or coroutine) running after the caller has returned.
+    Failures are logged, and pending tasks are cancelled when the client closes.
+    """
+    if not isinstance(task, asyncio.Task):
+        task = asyncio.create_task(task)
+    _background_tasks.add(task)
+    task.add_done_callback(_log_background_failure)
+    return task
+
+
+async def close_client():
+    """
+    Stops the poller, cancels background work and closes the shared API client
+    and its local store, if one exists.
+    """
+    global _client, _poller
+    if _poller is not None:
+        poller, _poller = _poller, None
+        await poller.close()
+
+    pending = list(_background_tasks)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
+        if client.store is not None:
+            client.store.close()
+
+
+@asynccontextmanager
+async def lifespan(server: Any) -> AsyncIterator[None]:
+    """
+    MCP server lifespan: opens the shared client on startup and
+    closes its connection pool on shutdown.
+
+    Unless disabled with BCCI_TV_WARMUP=0, caches are warmed in the background
+    so the MCP handshake isn't delayed.
+    """
+    client = get_client()
+    settings = Settings.from_env()
+    if settings.warmup:
+        run_in_background(warm_up(client, concurrency=settings.warmup_concurrency))
+    try:
+        yield
+    finally:
+        await close_client()
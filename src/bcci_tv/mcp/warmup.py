@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+from bcci_tv.api.client import BCCIApiClient
+
+logger = logging.getLogger(__name__)
+
+CIRCUITS = ["domestic", "international"]
+
+
+async def warm_up(client: BCCIApiClient, concurrency: int = 4) -> Dict[str, Any]:
+    """
+    Pre-loads the caches the first tool calls would otherwise pay for: both
+    competition catalogs and their indexes, then the schedules of every live
+    tournament (at most `concurrency` at a time).
+
+    The live tournaments are fetched the way the get_live_tournaments tool
+    does, revalidating the catalogs with upstream, so an old cached catalog
+    doesn't pick the schedules. The indexes are then built from the
+    refreshed catalogs.
+
+    Failures are logged and skipped; warm-up never raises for upstream errors.
+    Returns a summary of what was loaded.
+    """
+    started = time.monotonic()
+    live_lists = await asyncio.gather(
+        *(client.get_live_tournaments(c) for c in CIRCUITS), return_exceptions=True
+    )
+    indexes = await asyncio.gather(
+        *(client.get_competition_index(c) for c in CIRCUITS), return_exceptions=True
+    )
+
+    live: List[Tuple[str, int]] = []
+    for circuit, comps, index in zip(CIRCUITS, live_lists, indexes):
+        if isinstance(index, Exception):
+            logger.warning(f"Warm-up could not load the {circuit} catalog: {index}")
+        if isinstance(comps, Exception):
+            logger.warning(
+                f"Warm-up could not fetch the live {circuit} tournaments: {comps}"
+            )
+            continue
+        for comp in comps:
+            live.append((circuit, comp["CompetitionID"]))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load_schedule(circuit: str, competition_id: int) -> bool:
+        async with semaphore:
+            try:
+                await client.get_tournament_schedule(competition_id, circuit)
+                return True
+            except Exception as e:
+                logger.warning(
+                    f"Warm-up could not load the schedule of {competition_id}: {e}"
+                )
+                return False
+
+    loaded = await asyncio.gather(*(load_schedule(c, cid) for c, cid in live))
+
+    summary = {
+        "catalogs": sum(not isinstance(i, Exception) for i in indexes),
+        "live_tournaments": len(live),
+        "schedules": sum(loaded),
+        "seconds": round(time.monotonic() - started, 2),
+    }
+    logger.info(f"Cache warm-up finished: {summary}")
+    return summary
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from bcci_tv.api.cache import FeedCache, MemoryCache
+
+
+def test_feed_cache_memory_tier(tmp_path):
+    cache = FeedCache(tmp_path)
+    assert cache.get("feed.json") is None
+
+    cache.set("feed.json", {"competition": [{"CompetitionID": "1"}]})
+
+    first = cache.get("feed.json")
+    second = cache.get("feed.json")
+    assert first == {"competition": [{"CompetitionID": "1"}]}
+    # Served from memory: the same object, no re-decode
+    assert second is first
+    assert cache.stats() == {
+        "memory_hits": 2,
+        "disk_hits": 0,
+        "misses": 1,
+        "revalidations": 0,
+    }
+
+
+def test_feed_cache_reloads_when_file_changes(tmp_path):
+    cache = FeedCache(tmp_path)
+    cache.set("feed.json", {"v": 1})
+
+    # Another writer replaces the file with a newer mtime
+    cache_file = tmp_path / "feed.json"
+    cache_file.write_text('{"v": 2}')
+    later = time.time() + 5
+    os.utime(cache_file, (later, later))
+
+    assert cache.get("feed.json") == {"v": 2}
+    assert cache.disk_hits == 1
+
+
+def test_feed_cache_expires(tmp_path):
+    cache = FeedCache(tmp_path, ttl=60)
+    cache.set("feed.json", {"v": 1})
+
+    old = time.time() - 120
+    os.utime(tmp_path / "feed.json", (old, old))
+
+    assert cache.get("feed.json") is None
+    assert cache.misses == 1
+
+
+def test_feed_cache_validators_and_touch(tmp_path):
+    cache = FeedCache(tmp_path, ttl=60)
+    cache.set("feed.json", {"v": 1}, validators={"etag": '"abc"'})
+
+    old = time.time() - 120
+    os.utime(tmp_path / "feed.json", (old, old))
+    assert cache.get("feed.json") is None
+
+    # Expired entries are still available for revalidation
+    stale = cache.get_stale("feed.json")
+    assert stale.data == {"v": 1}
+    assert stale.validators == {"etag": '"abc"'}
+
+    cache.touch("feed.json")
+    assert cache.get("feed.json") == {"v": 1}
+    assert cache.revalidations == 1
+
+
+def test_memory_cache_ttl_and_eviction():
+    cache = MemoryCache(max_entries=2)
+    cache.set("live", {"v": 1}, ttl=0)
+    cache.set("done", {"v": 2})
+    assert cache.get("live") is None
+    assert cache.get("done") == {"v": 2}
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # "done" was least recently used and is evicted
+    assert cache.get("done") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+
+def test_feed_cache_compresses_entries(tmp_path):
+    cache = FeedCache(tmp_path)
+    data = {"competition": [{"CompetitionName": "Ranji Trophy"}] * 100}
+    cache.set("feed.json", data)
+
+    raw = (tmp_path / "feed.json").read_bytes()
+    assert len(raw) < len(json.dumps(data)) / 10
+    cache.clear_memory()
+    assert cache.get("feed.json") == data
+
+
+def test_feed_cache_evicts_least_recently_used(tmp_path):
+    payload = {"v": os.urandom(300).hex()}
+    cache = FeedCache(tmp_path)
+    cache.set("a.json", payload)
+    entry_size = cache.usage()["bytes"]
+    cache.max_bytes = entry_size * 2
+
+    cache.set("b.json", payload)
+    time.sleep(0.01)
+    # Reading a makes b the least recently used entry
+    assert cache.get("a.json") == payload
+    cache.set("c.json", payload)
+
+    assert not (tmp_path / "b.json").exists()
+    assert cache.get("a.json") == payload
+    assert cache.usage()["evictions"] == 1
+
+    # Access times survive a restart
+    reopened = FeedCache(tmp_path, max_bytes=entry_size)
+    assert reopened.prune() == {"entries": 1, "bytes": entry_size}
+    assert not (tmp_path / "a.json").exists()
+    assert (tmp_path / "c.json").exists()
+
+
+def test_feed_cache_prune_to_zero(tmp_path):
+    cache = FeedCache(tmp_path)
+    cache.set("a.json", {"v": 1}, validators={"etag": '"a"'})
+    cache.set("b.json", {"v": 2})
+
+    removed = cache.prune(max_bytes=0)
+
+    assert removed["entries"] == 2
+    assert cache.usage()["entries"] == 0
+    assert cache.get("a.json") is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".manifest.json"]
+
+
+def test_feed_cache_failed_write_keeps_previous_copy(tmp_path):
+    cache = FeedCache(tmp_path)
+    cache.set("feed.json", {"v": 1})
+
+    # Not JSON serializable: the write fails before the file is replaced
+    cache.set("feed.json", {"v": object()})
+
+    assert cache.get("feed.json") == {"v": 1}
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_lock_is_exclusive_across_instances(tmp_path):
+    first = FeedCache(tmp_path, shared=True)
+    second = FeedCache(tmp_path, shared=True)
+    order = []
+
+    async def hold():
+        async with first.lock("feed.json") as waited:
+            order.append(("first", waited))
+            await asyncio.sleep(0.2)
+            order.append(("first done", waited))
+
+    async def wait_for_it():
+        await asyncio.sleep(0.05)
+        async with second.lock("feed.json") as waited:
+            order.append(("second", waited))
+
+    await asyncio.gather(hold(), wait_for_it())
+
+    assert order == [("first", False), ("first done", False), ("second", True)]
+    assert second.usage()["lock_waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_lock_is_noop_when_not_shared(tmp_path):
+    cache = FeedCache(tmp_path)
+    async with cache.lock("feed.json") as waited:
+        async with cache.lock("feed.json") as nested:
+            assert not waited and not nested
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_feed_cache_prunes_only_over_the_limit(tmp_path, monkeypatch):
+    cache = FeedCache(tmp_path)
+    cache.set("a.json", {"v": 1})
+    entry_size = cache.usage()["bytes"]
+    cache.max_bytes = entry_size * 2
+
+    scans = []
+    entry_sizes = cache._entry_sizes
+    monkeypatch.setattr(cache, "_entry_sizes", lambda: scans.append(1) or entry_sizes())
+    # Under the limit, writes don't rescan the directory
+    cache.set("b.json", {"v": 2})
+    cache.set("b.json", {"v": 3})
+    assert scans == []
+
+    cache.set("c.json", {"v": 4})
+    assert scans == [1]
+    assert not (tmp_path / "a.json").exists()
+
+    # Past PRUNE_INTERVAL the next write rescans anyway
+    cache._next_prune = 0.0
+    cache.set("c.json", {"v": 5})
+    assert scans == [1, 1]
+
+
+def test_feed_cache_flush_saves_access_times(tmp_path):
+    cache = FeedCache(tmp_path)
+    cache.set("a.json", {"v": 1})
+    cache.set("b.json", {"v": 2})
+    time.sleep(0.01)
+    assert cache.get("a.json") == {"v": 1}
+    cache.flush()
+
+    reopened = FeedCache(tmp_path)
+    assert reopened.access_times["a.json"] > reopened.access_times["b.json"]
@@ -1,5 +1,10 @@
+import asyncio
+import httpx
+import json
+import os
 import pytest
-from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.client import BCCIApiClient, track_staleness
+from bcci_tv.api.throttle import CircuitOpenError, RequestThrottle
 
 
 @pytest.mark.asyncio
@@ -68,6 +73,24 @@ async def test_get_tournament_standings(api_client, httpx_mock):
         )
 
 
+@pytest.mark.asyncio
+async def test_get_tournament_standings_fields(api_client, httpx_mock):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=318)
+    )
+    httpx_mock.add_response(url=mock_url, text=mock_raw_response, is_reusable=True)
+
+    result = await api_client.get_tournament_standings(318, fields=["TeamName"])
+    assert result["category"]
+    assert set(result["points"][0]) == {"Category", "OrderNo", "TeamName"}
+
+    # The projected copy is cached apart from the full feed
+    full = await api_client.get_tournament_standings(318)
+    assert "Points" in full["points"][0]
+
+
 @pytest.mark.asyncio
 async def test_get_tournament_schedule_intl(api_client, httpx_mock):
     # Read from fixture file
@@ -207,3 +230,444 @@ def test_parse_jsonp():
     # 4. JSONP with different wrapper name
     different_wrapper = 'onScoringMatchsummary({"status": true});'
     assert client._parse_jsonp(different_wrapper) == {"status": True}
+
+    # 5. Raw response bytes, with surrounding whitespace
+    raw_bytes = b'\n  callback({"name": "\xc3\xa9"});\r\n'
+    assert client._parse_jsonp(raw_bytes) == {"name": "\u00e9"}
+    assert client._parse_jsonp(b" [1, 2] ") == [1, 2]
+
+
+def test_parse_jsonp_invalid():
+    client = BCCIApiClient()
+    with pytest.raises(json.JSONDecodeError):
+        client._parse_jsonp(b"callback({invalid});")
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_not_closed(httpx_mock):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+
+    competition_id = 318
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=competition_id)
+    )
+    httpx_mock.add_response(url=mock_url, text=mock_raw_response, status_code=200)
+
+    # An injected pool without a base_url must still resolve relative endpoints
+    async with httpx.AsyncClient() as shared:
+        async with BCCIApiClient(http_client=shared) as client:
+            result = await client.get_tournament_standings(competition_id)
+            assert "points" in result
+
+        assert not shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_competitions_served_from_memory_cache(api_client, httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        mock_raw_response = f.read()
+
+    url = BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS)
+    httpx_mock.add_response(url=url, text=mock_raw_response, status_code=200)
+
+    first = await api_client.get_domestic_competitions()
+    second = await api_client.get_domestic_competitions()
+
+    assert second is first
+    assert api_client.cache.memory_hits == 1
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_standings_revalidated_with_etag(api_client, httpx_mock):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+
+    competition_id = 318
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=competition_id)
+    )
+    httpx_mock.add_response(
+        url=mock_url,
+        text=mock_raw_response,
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 07 Jan 2026 10:00:00 GMT"},
+    )
+    httpx_mock.add_response(
+        url=mock_url,
+        status_code=304,
+        match_headers={
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 07 Jan 2026 10:00:00 GMT",
+        },
+    )
+
+    first = await api_client.get_tournament_standings(competition_id)
+    second = await api_client.get_tournament_standings(competition_id)
+
+    assert second == first
+    assert api_client.cache.revalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_live_tournaments_revalidate_catalog(api_client, httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        mock_raw_response = f.read()
+
+    url = BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS)
+    httpx_mock.add_response(url=url, text=mock_raw_response, headers={"ETag": "c1"})
+    httpx_mock.add_response(url=url, status_code=304)
+
+    first = await api_client.get_live_tournaments()
+    second = await api_client.get_live_tournaments()
+
+    assert second == first
+    assert httpx_mock.get_requests()[1].headers["If-None-Match"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_finished_match_is_cached(api_client, httpx_mock):
+    with open("tests/fixtures/match_summary.js", "r") as f:
+        summary_raw = f.read()
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        innings_raw = f.read()
+
+    match_id = 999
+    for suffix in ["matchsummary", "Innings1", "Innings2"]:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(
+                BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                    MatchID=match_id, suffix=suffix
+                )
+            ),
+            text=summary_raw if suffix == "matchsummary" else innings_raw,
+        )
+
+    first = await api_client.get_full_match_summary(match_id, circuit="domestic")
+    second = await api_client.get_full_match_summary(match_id, circuit="domestic")
+
+    # The fixture match has ended, so nothing is fetched twice
+    assert second == first
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_live_innings_is_refetched(api_client, httpx_mock, monkeypatch):
+    monkeypatch.setattr(BCCIApiClient, "LIVE_MATCH_TTL", 0)
+    with open("tests/fixtures/match_summary.js", "r") as f:
+        summary_raw = f.read().replace('"IsMatchEnd":"1"', '"IsMatchEnd":"0"')
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        innings_raw = f.read()
+
+    match_id = 999
+
+    def url(suffix):
+        return BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                MatchID=match_id, suffix=suffix
+            )
+        )
+
+    httpx_mock.add_response(url=url("matchsummary"), text=summary_raw)
+    httpx_mock.add_response(url=url("matchsummary"), text=summary_raw)
+    httpx_mock.add_response(url=url("Innings1"), text=innings_raw)
+    httpx_mock.add_response(url=url("Innings2"), text=innings_raw)
+    httpx_mock.add_response(url=url("Innings2"), text=innings_raw)
+
+    await api_client.get_full_match_summary(match_id, circuit="domestic")
+    await api_client.get_full_match_summary(match_id, circuit="domestic")
+
+    # Innings 1 is complete (CurrentInnings is 2) and only fetched once
+    innings1_requests = httpx_mock.get_requests(url=url("Innings1"))
+    innings2_requests = httpx_mock.get_requests(url=url("Innings2"))
+    assert len(innings1_requests) == 1
+    assert len(innings2_requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced(api_client, httpx_mock):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+
+    competition_id = 318
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=competition_id)
+    )
+    httpx_mock.add_response(url=mock_url, text=mock_raw_response)
+
+    results = await asyncio.gather(
+        *[api_client.get_tournament_standings(competition_id) for _ in range(5)]
+    )
+
+    assert all(result is results[0] for result in results)
+    assert len(httpx_mock.get_requests()) == 1
+    assert api_client.stats()["upstream_requests"] == 1
+    assert api_client.stats()["coalesced_requests"] == 4
+
+
+@pytest.mark.asyncio
+async def test_resolve_competitions(api_client, httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        mock_raw_response = f.read()
+
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS),
+        text=mock_raw_response,
+    )
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.INTERNATIONAL_COMPETITIONS
+        ),
+        text='oncomptetion({"competition": [{"CompetitionID": 236}]});',
+    )
+
+    results = await api_client.resolve_competitions([317, 318, 236, 1])
+
+    assert results[317]["CompetitionName"] == "RANJI TROPHY ELITE"
+    assert results[318]["CompetitionName"] == "VIJAY HAZARE TROPHY ELITE"
+    assert results[236] == {"CompetitionID": 236}
+    assert results[1] is None
+
+    assert await api_client.get_competition_circuit(236) == "international"
+
+    # The index is reused while the catalog is unchanged
+    index = await api_client.get_competition_index("domestic")
+    assert await api_client.get_competition_index("domestic") is index
+
+
+@pytest.mark.asyncio
+async def test_get_match_summary_innings_fields(api_client, httpx_mock):
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        mock_raw_response = f.read()
+
+    match_id = 999
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+            MatchID=match_id, suffix="Innings1"
+        )
+    )
+    httpx_mock.add_response(url=mock_url, text=mock_raw_response, status_code=200)
+
+    result = await api_client.get_domestic_match_summary(
+        match_id, innings=1, fields=["BattingCard", "WagonWheelSummary"]
+    )
+    assert list(result["Innings1"].keys()) == ["BattingCard", "WagonWheelSummary"]
+
+    with pytest.raises(ValueError):
+        await api_client.get_domestic_match_summary(match_id, fields=["BattingCard"])
+
+
+@pytest.mark.asyncio
+async def test_get_match_summaries(api_client, httpx_mock):
+    with open("tests/fixtures/match_summary.js", "r") as f:
+        mock_raw_response = f.read()
+
+    for match_id in [1, 3]:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(
+                BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                    MatchID=match_id, suffix="matchsummary"
+                )
+            ),
+            text=mock_raw_response,
+        )
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                MatchID=2, suffix="matchsummary"
+            )
+        ),
+        status_code=404,
+    )
+
+    results = await api_client.get_match_summaries(
+        [1, 2, 3], circuit="domestic", innings=None
+    )
+
+    assert [r["match_id"] for r in results] == [1, 2, 3]
+    assert "MatchSummary" in results[0]["data"]
+    assert "error" in results[1]
+    assert "MatchSummary" in results[2]["data"]
+
+
+@pytest.mark.asyncio
+async def test_get_match_summaries_reports_missing_innings(api_client, httpx_mock):
+    def summary_url(match_id, suffix):
+        return BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                MatchID=match_id, suffix=suffix
+            )
+        )
+
+    summary = {"MatchSummary": [{"MatchID": "77", "CurrentInnings": "2"}]}
+    httpx_mock.add_response(
+        url=summary_url(77, "matchsummary"), text=f"cb({json.dumps(summary)});"
+    )
+    httpx_mock.add_response(
+        url=summary_url(77, "Innings1"), text='cb({"Innings1": {"BattingCard": []}});'
+    )
+    httpx_mock.add_response(
+        url=summary_url(77, "Innings2"), status_code=404, is_reusable=True
+    )
+
+    [result] = await api_client.get_match_summaries([77], circuit="domestic")
+    assert result["match_id"] == 77
+    assert "404" in result["error"]
+    assert "data" not in result
+
+    # Without strict, the innings that could be fetched are still returned
+    full = await api_client.get_full_match_summary(77, "domestic")
+    assert len(full["innings_details"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_match_summaries_bounded_concurrency(api_client, monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_summary(match_id, innings=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"MatchID": match_id}
+
+    monkeypatch.setattr(api_client, "get_domestic_match_summary", fake_summary)
+
+    results = await api_client.get_match_summaries(
+        list(range(19)), circuit="domestic", innings=1, concurrency=4
+    )
+
+    assert peak == 4
+    assert [r["data"]["MatchID"] for r in results] == list(range(19))
+
+
+@pytest.mark.asyncio
+async def test_expired_feed_is_served_while_revalidating(httpx_mock, mock_cache_dir):
+    url = BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS)
+    httpx_mock.add_response(url=url, text='callback({"competition": [1]});')
+    httpx_mock.add_response(url=url, text='callback({"competition": [2]});')
+
+    async with BCCIApiClient() as client:
+        await client.get_domestic_competitions()
+        cache_file = mock_cache_dir / BCCIApiClient.Cache.DOMESTIC_COMPETITIONS
+        expired = cache_file.stat().st_mtime - client.cache.ttl - 60
+        os.utime(cache_file, (expired, expired))
+
+        with track_staleness() as stale:
+            result = await client.get_domestic_competitions()
+        assert result == {"competition": [1]}
+        assert stale[0]["feed"] == BCCIApiClient.Cache.DOMESTIC_COMPETITIONS
+
+        # The background refresh stores the new copy
+        await asyncio.gather(*client._refreshes.values())
+        assert await client.get_domestic_competitions() == {"competition": [2]}
+
+
+@pytest.mark.asyncio
+async def test_stale_feed_is_served_when_upstream_fails(httpx_mock):
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=318)
+    )
+    httpx_mock.add_response(
+        url=url, text='callback({"points": []});', headers={"ETag": '"v1"'}
+    )
+    httpx_mock.add_response(url=url, status_code=503, is_reusable=True)
+
+    throttle = RequestThrottle(max_retries=0, failure_threshold=1)
+    async with BCCIApiClient(throttle=throttle) as client:
+        await client.get_tournament_standings(318)
+
+        with track_staleness() as stale:
+            assert await client.get_tournament_standings(318) == {"points": []}
+        assert stale[0]["reason"] == "upstream unavailable"
+
+        # The circuit is now open: upstream isn't called, the cache still answers
+        with track_staleness() as stale:
+            assert await client.get_tournament_standings(318) == {"points": []}
+        assert client.stats()["throttle"]["rejected"] == 1
+        assert client.stats()["stale_served"] == 2
+
+        # Without a cached copy the error surfaces
+        with pytest.raises(CircuitOpenError):
+            await client.get_tournament_standings(1)
+
+
+@pytest.mark.asyncio
+async def test_stale_innings_is_served_when_upstream_fails(httpx_mock):
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        mock_raw_response = f.read()
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+            MatchID=15629, suffix="Innings1"
+        )
+    )
+    httpx_mock.add_response(url=url, text=mock_raw_response)
+    httpx_mock.add_response(url=url, status_code=503, is_reusable=True)
+
+    throttle = RequestThrottle(max_retries=0, failure_threshold=1)
+    async with BCCIApiClient(throttle=throttle) as client:
+        # The innings is in play, and expires straight away
+        client.LIVE_MATCH_TTL = 0
+        first = await client.get_domestic_match_summary(15629, innings=1)
+
+        with track_staleness() as stale:
+            assert await client.get_domestic_match_summary(15629, innings=1) is first
+        assert stale[0]["feed"] == "domestic match 15629 innings 1"
+        assert stale[0]["reason"] == "upstream unavailable"
+
+        # The circuit is now open, and the expired copy still answers
+        with track_staleness() as stale:
+            assert await client.get_domestic_match_summary(15629, innings=1) is first
+        assert client.stats()["throttle"]["rejected"] == 1
+        assert client.stats()["stale_served"] == 2
+
+        # Without a cached copy the error surfaces
+        with pytest.raises(CircuitOpenError):
+            await client.get_domestic_match_summary(15630, innings=1)
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_refreshes_feed_once(httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        mock_raw_response = f.read()
+    url = BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS)
+    # A single response: the second client must reuse the first one's result
+    httpx_mock.add_response(url=url, text=mock_raw_response)
+
+    async with (
+        BCCIApiClient(shared_cache=True) as first,
+        BCCIApiClient(shared_cache=True) as second,
+    ):
+        results = await asyncio.gather(
+            first.get_domestic_competitions(), second.get_domestic_competitions()
+        )
+
+    assert results[0] == results[1]
+    assert first.upstream_requests + second.upstream_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_standings_records_built_once_per_feed(api_client, httpx_mock):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=318)
+    )
+    httpx_mock.add_response(
+        url=mock_url, text=mock_raw_response, headers={"ETag": '"v1"'}
+    )
+    httpx_mock.add_response(url=mock_url, status_code=304)
+    httpx_mock.add_response(
+        url=mock_url, text=mock_raw_response, headers={"ETag": '"v2"'}
+    )
+
+    first = await api_client.get_standings_records(318)
+    # The revalidated feed is the same object, so its records are reused
+    assert await api_client.get_standings_records(318) is first
+    group = [t.order_no for t in first["Elite Group A"]]
+    assert group == sorted(group)
+
+    # A changed feed gets new records
+    assert await api_client.get_standings_records(318) is not first
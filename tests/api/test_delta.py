@@ -0,0 +1,126 @@
+import copy
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.delta import (
+    SnapshotHistory,
+    diff_snapshot,
+    has_removals,
+    snapshot_version,
+)
+
+
+def _innings():
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        return BCCIApiClient()._parse_jsonp(f.read())
+
+
+def test_snapshot_version_tracks_content():
+    data = _innings()
+    assert snapshot_version(data) == snapshot_version(copy.deepcopy(data))
+
+    changed = copy.deepcopy(data)
+    changed["Innings1"]["BattingCard"][0]["Runs"] = "99"
+    assert snapshot_version(changed) != snapshot_version(data)
+
+
+def test_diff_snapshot_returns_changed_rows():
+    old = {
+        "overall": {"Score": "100/2", "Venue": "Indore"},
+        "innings_details": [_innings()],
+    }
+    new = copy.deepcopy(old)
+    innings = new["innings_details"][0]["Innings1"]
+    innings["BattingCard"][3]["Runs"] = "99"
+    innings["OverHistory"].append({"Over": "51"})
+    new["overall"]["Score"] = "104/2"
+
+    changes = diff_snapshot(old, new)
+
+    assert changes["overall"] == {"Score": "104/2"}
+    [innings_changes] = changes["innings_details"]
+    assert set(innings_changes["Innings1"]) == {"BattingCard", "OverHistory"}
+    assert innings_changes["Innings1"]["BattingCard"] == [innings["BattingCard"][3]]
+    assert innings_changes["Innings1"]["OverHistory"] == [{"Over": "51"}]
+
+
+def test_has_removals():
+    old = {
+        "overall": {"Score": "100/2", "Comments": "Rain delay"},
+        "innings_details": [_innings()],
+    }
+    assert not has_removals(old, copy.deepcopy(old))
+
+    grown = copy.deepcopy(old)
+    grown["innings_details"][0]["Innings1"]["OverHistory"].append({"Over": "51"})
+    assert not has_removals(old, grown)
+
+    no_comments = copy.deepcopy(old)
+    del no_comments["overall"]["Comments"]
+    assert has_removals(old, no_comments)
+
+    # A batter's row corrected away
+    fewer_batters = copy.deepcopy(old)
+    fewer_batters["innings_details"][0]["Innings1"]["BattingCard"].pop(0)
+    assert has_removals(old, fewer_batters)
+
+    fewer_overs = copy.deepcopy(old)
+    fewer_overs["innings_details"][0]["Innings1"]["OverHistory"].pop()
+    assert has_removals(old, fewer_overs)
+
+    assert has_removals(old, {**old, "innings_details": []})
+
+
+def test_snapshot_history_versioned():
+    history = SnapshotHistory()
+    old = {"overall": {"Score": "100/2"}, "innings_details": []}
+    first = history.versioned("match", old)
+    assert first["overall"] == old["overall"]
+
+    new = {"overall": {"Score": "104/2"}, "innings_details": []}
+    delta = history.versioned("match", new, since=first["version"])
+    assert delta == {
+        "version": history.snapshot_version(new),
+        "since": first["version"],
+        "overall": {"Score": "104/2"},
+    }
+
+    # Unchanged since the given version: nothing but the tokens
+    same = history.versioned("match", new, since=delta["version"])
+    assert same == {"version": delta["version"], "since": delta["version"]}
+
+    # Removals can't be expressed as a delta, so the full snapshot is sent
+    cleared = {"overall": {}, "innings_details": []}
+    full = history.versioned("match", cleared, since=first["version"])
+    assert "since" not in full
+    assert full["overall"] == {}
+
+    # Unknown versions fall back to the full snapshot
+    full = history.versioned("match", new, since="unknown")
+    assert "since" not in full
+    assert full["overall"] == new["overall"]
+
+
+def test_snapshot_history_reuses_component_versions(monkeypatch):
+    from bcci_tv.api import delta
+
+    history = SnapshotHistory()
+    overall = {"Score": "100/2"}
+    innings = [_innings()]
+    first = history.versioned("match", {"overall": overall, "innings_details": innings})
+
+    hashed = []
+    original = delta.snapshot_version
+    monkeypatch.setattr(
+        delta, "snapshot_version", lambda data: hashed.append(data) or original(data)
+    )
+
+    # A new snapshot dict built from the same cached parts isn't re-serialized
+    again = {"overall": overall, "innings_details": list(innings)}
+    assert history.versioned("match", again)["version"] == first["version"]
+    assert hashed == []
+
+    # Only the part that changed is
+    changed = {"overall": {"Score": "104/2"}, "innings_details": list(innings)}
+    version = history.versioned("match", changed)["version"]
+    assert version != first["version"]
+    assert hashed == [{"Score": "104/2"}]
+    assert version == SnapshotHistory().snapshot_version(copy.deepcopy(changed))
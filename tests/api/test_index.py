@@ -0,0 +1,104 @@
+import time
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.index import CompetitionIndex, _within_one_edit, tokenize
+
+
+def _load_index():
+    with open("tests/fixtures/competitions.js", "r") as f:
+        data = BCCIApiClient()._parse_jsonp(f.read())
+    return CompetitionIndex(data, "domestic")
+
+
+def _ids(results):
+    return [c["CompetitionID"] for c in results]
+
+
+def test_tokenize_expands_age_groups():
+    assert tokenize("MENS U23 STATE A TROPHY") == [
+        "mens",
+        "u23",
+        "under",
+        "23",
+        "state",
+        "a",
+        "trophy",
+    ]
+
+
+def test_search_exact_prefix_and_typo():
+    index = _load_index()
+    assert _ids(index.search("COOCH")) == ["326", "346"]
+    assert _ids(index.search("coo beh")) == ["326", "346"]
+    assert _ids(index.search("vijay hazre")) == ["318", "342"]
+
+
+def test_search_acronyms_and_aliases():
+    index = _load_index()
+    assert _ids(index.search("SMAT")) == ["319", "343"]
+    assert _ids(index.search("VHT elite")) == ["318"]
+    assert _ids(index.search("ckn plate")) == ["344"]
+
+
+def test_search_season_year_and_limit():
+    index = _load_index()
+    assert _ids(index.search("ranji 2025-26")) == ["317", "341"]
+    assert len(index.search("trophy", limit=5)) == 5
+    assert index.search("") == []
+
+
+def test_search_ranks_recent_seasons_first():
+    data = {
+        "division": [
+            {"SeasonID": "1", "SeasonName": "2024-25"},
+            {"SeasonID": "2", "SeasonName": "2025-26"},
+        ],
+        "competition": [
+            {
+                "CompetitionID": "1",
+                "CompetitionName": "RANJI TROPHY",
+                "SeasonID": "1",
+                "MatchStartDate": "11 Oct 2024",
+            },
+            {
+                "CompetitionID": "2",
+                "CompetitionName": "RANJI TROPHY",
+                "SeasonID": "2",
+                "MatchStartDate": "15 Oct 2025",
+            },
+        ],
+    }
+    index = CompetitionIndex(data, "domestic")
+    assert _ids(index.search("ranji")) == ["2", "1"]
+    assert _ids(index.search("ranji 2024")) == ["1"]
+
+
+def test_search_falls_back_to_substring():
+    index = _load_index()
+    assert _ids(index.search("ZARE")) == ["318", "342"]
+
+
+def test_search_is_fast_on_large_catalogs():
+    competitions = [
+        {
+            "CompetitionID": str(i),
+            "CompetitionName": f"TOURNAMENT {i} TROPHY ELITE",
+            "MatchStartDate": "1 Jan 2025",
+        }
+        for i in range(10000)
+    ]
+    index = CompetitionIndex({"competition": competitions}, "domestic")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        index.search("tournament 4242")
+    elapsed = (time.perf_counter() - start) / 100
+
+    assert _ids(index.search("tournament 4242")) == ["4242"]
+    assert elapsed < 0.05
+
+
+def test_within_one_edit():
+    assert _within_one_edit("hazare", "hazre")
+    assert _within_one_edit("hazare", "hazaer")
+    assert _within_one_edit("ranji", "ranjo")
+    assert not _within_one_edit("ranji", "irani")
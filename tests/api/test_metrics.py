@@ -0,0 +1,94 @@
+import httpx
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.metrics import Histogram, Metrics, TemplateMatcher
+
+
+def test_template_matcher_maps_endpoints_to_templates():
+    matcher = TemplateMatcher.from_class(BCCIApiClient.Endpoints)
+    assert matcher.match("/feeds/318-matchschedule.js") == "domestic_schedule"
+    assert matcher.match("/feeds/stats/326-groupstandings.js") == "standings"
+    assert matcher.match("/somewhere/else.js") == "other"
+
+
+def test_histogram_quantiles():
+    h = Histogram((0.1, 0.5, 1.0))
+    assert h.quantile(0.5) is None
+    for value in [0.05, 0.05, 0.3, 2.0]:
+        h.observe(value)
+    assert h.counts == [2, 1, 0, 1]
+    assert h.quantile(0.5) == 0.1
+    assert h.quantile(0.99) == 1.0
+
+
+def test_prometheus_format():
+    metrics = Metrics()
+    metrics.record_request("standings", 0.02, status=200, size=512)
+    metrics.record_request("standings", 0.3, status=503, error="503")
+    metrics.record_cache("standings", "hit")
+
+    text = metrics.to_prometheus()
+    assert "# TYPE bcci_tv_upstream_requests_total counter" in text
+    assert (
+        'bcci_tv_upstream_requests_total{endpoint="standings",status="200"} 1' in text
+    )
+    assert 'bcci_tv_upstream_errors_total{code="503",endpoint="standings"} 1' in text
+    assert 'bcci_tv_upstream_response_bytes_total{endpoint="standings"} 512' in text
+    assert (
+        'bcci_tv_upstream_request_duration_seconds_bucket{endpoint="standings",le="0.025"} 1'
+        in text
+    )
+    assert (
+        'bcci_tv_upstream_request_duration_seconds_bucket{endpoint="standings",le="+Inf"} 2'
+        in text
+    )
+    assert (
+        'bcci_tv_upstream_request_duration_seconds_count{endpoint="standings"} 2'
+        in text
+    )
+    # Metrics that were never recorded are left out
+    assert "bcci_tv_tool_calls_total" not in text
+
+
+def test_cache_hit_rates_ignore_refreshes():
+    metrics = Metrics()
+    for outcome in ["hit", "hit", "stale", "miss", "revalidated"]:
+        metrics.record_cache("domestic_competitions", outcome)
+    assert metrics.cache_hit_rates() == {"domestic_competitions": 0.75}
+
+
+@pytest.mark.asyncio
+async def test_client_records_requests_parse_and_cache(api_client, httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        raw = f.read()
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS),
+        text=raw,
+    )
+
+    await api_client.get_domestic_competitions()
+    await api_client.get_domestic_competitions()
+
+    snapshot = api_client.metrics.snapshot()
+    requests = snapshot["bcci_tv_upstream_requests_total"]
+    assert requests == [
+        {"labels": {"endpoint": "domestic_competitions", "status": "200"}, "value": 1}
+    ]
+    parse = snapshot["bcci_tv_parse_duration_seconds"]
+    assert parse[0]["labels"] == {"endpoint": "domestic_competitions"}
+    assert parse[0]["count"] == 1
+    assert snapshot["cache_hit_rates"] == {"domestic_competitions": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_client_records_upstream_errors(api_client, httpx_mock):
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=326)
+    )
+    httpx_mock.add_response(url=url, status_code=404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await api_client.get_tournament_standings(326)
+
+    errors = api_client.metrics.snapshot()["bcci_tv_upstream_errors_total"]
+    assert errors == [{"labels": {"code": "404", "endpoint": "standings"}, "value": 1}]
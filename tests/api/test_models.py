@@ -0,0 +1,66 @@
+import json
+
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.models import (
+    InningsRecord,
+    StandingRecord,
+    schedule_records,
+    standings_records,
+)
+from bcci_tv.api.utils import STANDINGS_FIELDS, filter_matches_by_status
+
+
+def _load(path):
+    with open(path, "r") as f:
+        return BCCIApiClient()._parse_jsonp(f.read())
+
+
+def test_standings_records():
+    records = standings_records(_load("tests/fixtures/standings.js"))
+
+    first = records["Elite Group A"][0]
+    assert first.order_no == 1
+    assert first.points == 16
+    assert first.net_run_rate == 0.935
+    assert not hasattr(first, "__dict__")
+
+    # to_dict() gives the same output as the dict helpers
+    with open("tests/fixtures/simplified_standings.json", "r") as f:
+        expected = json.load(f)
+    assert {
+        category: [team.to_dict(STANDINGS_FIELDS) for team in teams]
+        for category, teams in records.items()
+    } == expected
+
+
+def test_record_conversion_defaults():
+    record = StandingRecord.from_dict({"TeamName": None, "Points": "2.5"})
+    assert record.team_name == ""
+    assert record.points == 2.5
+    assert record.order_no == 0
+    assert record.to_dict(["TeamName", "OrderNo"]) == {
+        "TeamName": None,
+        "OrderNo": None,
+    }
+
+
+def test_schedule_records():
+    data = _load("tests/fixtures/intl_schedule.js")
+    matches = schedule_records(data)
+
+    upcoming = [m.to_dict() for m in matches if m.status == "upcoming"]
+    assert upcoming == filter_matches_by_status(data, "UPCOMING")
+    assert matches[0].to_dict() is data["Matchsummary"][0]
+    assert isinstance(matches[0].match_id, int)
+
+
+def test_innings_record():
+    data = _load("tests/fixtures/match_innings1.js")
+    innings = InningsRecord.from_feed(data, 1)
+
+    assert innings.batting[0].player_name == "PRIYANSH ARYA"
+    assert innings.batting[0].runs == 1
+    assert innings.bowling[0].economy == 5.6
+    assert innings.total == "254/9 (50.0 Overs)"
+    assert innings.extras == 6
+    assert InningsRecord.from_feed(data, 2) is None
@@ -0,0 +1,36 @@
+from bcci_tv.api.projection import build_projection, project
+
+
+def test_build_projection():
+    assert build_projection(["Innings1.BattingCard", "Innings1.Extras", "Status"]) == {
+        "Innings1": {"BattingCard": None, "Extras": None},
+        "Status": None,
+    }
+
+
+def test_project():
+    data = {
+        "Innings1": {"Extras": 1, "WagonWheel": [1, 2], "BattingCard": []},
+        "Other": {},
+    }
+    projection = build_projection(["Innings1.BattingCard", "Innings1.Extras"])
+
+    # Keys follow projection order; missing ones are skipped
+    assert project(data, projection) == {"Innings1": {"BattingCard": [], "Extras": 1}}
+    assert list(project(data, projection)["Innings1"]) == ["BattingCard", "Extras"]
+    assert project({"Innings1": None}, projection) == {"Innings1": None}
+    assert project({}, projection) == {}
+
+
+def test_build_projection_whole_subtree_wins():
+    expected = {"Innings1": None}
+    assert build_projection(["Innings1", "Innings1.BattingCard"]) == expected
+    assert build_projection(["Innings1.BattingCard", "Innings1"]) == expected
+    assert build_projection(["a.b", "a.b.c", "a.d"]) == {"a": {"b": None, "d": None}}
+
+
+def test_project_lists():
+    data = {"points": [{"TeamName": "A", "Wins": 1}, {"TeamName": "B", "Wins": 0}]}
+    assert project(data, build_projection(["points.TeamName"])) == {
+        "points": [{"TeamName": "A"}, {"TeamName": "B"}]
+    }
@@ -0,0 +1,105 @@
+import httpx
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.replay import (
+    Cassette,
+    CassetteMissError,
+    CassetteTransport,
+    RedirectTransport,
+)
+from bcci_tv.api.stub import StubUpstream
+from bcci_tv.api.throttle import RequestThrottle
+
+STANDINGS_URL = BCCIApiClient.get_full_url(
+    BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=318)
+)
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(httpx_mock, tmp_path):
+    with open("tests/fixtures/standings.js", "r") as f:
+        mock_raw_response = f.read()
+    httpx_mock.add_response(
+        url=STANDINGS_URL, text=mock_raw_response, headers={"ETag": '"v1"'}
+    )
+    path = tmp_path / "cassette.json"
+
+    transport = CassetteTransport(path, mode="record")
+    async with BCCIApiClient(transport=transport) as client:
+        recorded = await client.get_tournament_standings(318)
+    assert transport.recorded == 1
+    assert len(Cassette(path)) == 1
+
+    # Replayed from the cassette: no response is mocked for this client
+    transport = CassetteTransport(path, mode="replay")
+    async with BCCIApiClient(transport=transport) as client:
+        client.cache.clear_memory()
+        response = await client.client.get(STANDINGS_URL)
+        assert response.headers["etag"] == '"v1"'
+        assert client._parse_jsonp(response.content) == recorded
+
+        with pytest.raises(CassetteMissError):
+            await client.get_tournament_standings(999)
+    assert transport.replayed == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recordings_in_order(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.json")
+    request = httpx.Request("GET", STANDINGS_URL)
+    for body in [b"first", b"second"]:
+        cassette.add("GET", STANDINGS_URL, httpx.Response(200), body)
+
+    transport = CassetteTransport(cassette, mode="replay")
+    bodies = []
+    for _ in range(3):
+        response = await transport.handle_async_request(request)
+        bodies.append(response.content)
+
+    # The last recording repeats once the sequence runs out
+    assert bodies == [b"first", b"second", b"second"]
+
+
+@pytest.mark.asyncio
+async def test_stub_upstream_serves_fixtures():
+    with StubUpstream() as stub:
+        async with BCCIApiClient(transport=RedirectTransport(stub.url)) as client:
+            competitions = await client.get_domestic_competitions()
+            schedule = await client.get_tournament_schedule(236, "international")
+            innings = await client.get_international_match_summary(2014, innings=1)
+
+        async with httpx.AsyncClient() as http:
+            response = await http.get(f"{stub.url}/feeds/competition.js")
+            etag = response.headers["etag"]
+            revalidated = await http.get(
+                f"{stub.url}/feeds/competition.js", headers={"If-None-Match": etag}
+            )
+            missing = await http.get(f"{stub.url}/unknown.js")
+
+    assert competitions["competition"]
+    assert schedule["Matchsummary"][0]["MatchID"] == 2014
+    assert "BattingCard" in innings["Innings1"]
+    assert revalidated.status_code == 304
+    assert missing.status_code == 404
+    assert stub.requests == 6
+
+
+@pytest.mark.asyncio
+async def test_stub_upstream_injects_errors_and_serves_cassettes(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.json")
+    cassette.add("GET", STANDINGS_URL, httpx.Response(200), b'cb({"v": 1});')
+
+    with StubUpstream(fixtures_dir=None, cassette=cassette) as stub:
+        async with BCCIApiClient(transport=RedirectTransport(stub.url)) as client:
+            assert await client.get_tournament_standings(318) == {"v": 1}
+
+        stub.error_rate = 1.0
+        throttle = RequestThrottle(max_retries=0)
+        async with BCCIApiClient(
+            transport=RedirectTransport(stub.url), throttle=throttle
+        ) as client:
+            with pytest.raises(httpx.HTTPStatusError) as excinfo:
+                await client.get_tournament_standings(318)
+
+    assert excinfo.value.response.status_code == 503
+    assert stub.errors == 1
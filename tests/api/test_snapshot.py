@@ -0,0 +1,110 @@
+import httpx
+import json
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.snapshot import export_tournament, read_snapshot
+
+
+class FakeClient:
+    MATCH_BATCH_CONCURRENCY = 2
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.fetched = []
+
+    async def get_competition_circuit(self, competition_id):
+        return "domestic"
+
+    async def get_competition_details(self, competition_id, circuit):
+        return {"CompetitionID": competition_id}
+
+    async def get_tournament_schedule(self, competition_id, circuit):
+        return {
+            "Matchsummary": [
+                {"MatchID": 1, "MatchStatus": "Post"},
+                {"MatchID": 2, "MatchStatus": "Post"},
+                {"MatchID": 3, "MatchStatus": "Post"},
+                {"MatchID": 4, "MatchStatus": "Upcoming"},
+            ]
+        }
+
+    async def get_tournament_standings(self, competition_id):
+        return {"points": []}
+
+    async def get_full_match_summary(self, match_id, circuit, strict=False):
+        self.fetched.append(match_id)
+        if match_id in self.failing:
+            raise RuntimeError("upstream error")
+        return {"overall": {"MatchID": match_id}, "innings_details": []}
+
+
+@pytest.mark.asyncio
+async def test_export_tournament(tmp_path):
+    path = tmp_path / "snapshot.jsonl.gz"
+    summary = await export_tournament(FakeClient(), 326, path=path)
+
+    assert summary["circuit"] == "domestic"
+    assert (summary["matches"], summary["written"], summary["skipped"]) == (3, 3, 0)
+
+    records = list(read_snapshot(path))
+    assert [r["type"] for r in records[:3]] == ["competition", "schedule", "standings"]
+    assert sorted(r["id"] for r in records if r["type"] == "match") == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_export_tournament_resumes(tmp_path):
+    path = tmp_path / "snapshot.jsonl.gz"
+    first = await export_tournament(FakeClient(failing={2}), 326, path=path)
+    assert first["errors"] == [{"match_id": 2, "error": "upstream error"}]
+
+    # Simulate an export killed while writing a record
+    with open(path, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00partial")
+
+    client = FakeClient()
+    second = await export_tournament(client, 326, path=path)
+
+    assert client.fetched == [2]
+    assert (second["written"], second["skipped"], second["errors"]) == (1, 2, [])
+    records = list(read_snapshot(path))
+    assert len(records) == 6
+    assert [r["type"] for r in records].count("schedule") == 1
+
+
+@pytest.mark.asyncio
+async def test_export_tournament_retries_match_with_missing_innings(tmp_path):
+    feeds = {
+        "/feeds/competition.js": {
+            "competition": [{"CompetitionID": "326", "CompetitionName": "Trophy"}],
+            "livecompetition": [],
+        },
+        "/feeds/326-matchschedule.js": {
+            "Matchsummary": [{"MatchID": "77", "MatchStatus": "Post"}]
+        },
+        "/feeds/stats/326-groupstandings.js": {"category": [], "points": []},
+        "/feeds/77-matchsummary.js": {
+            "MatchSummary": [{"MatchID": "77", "CurrentInnings": "2"}]
+        },
+        "/feeds/77-Innings1.js": {"Innings1": {"BattingCard": [{"Runs": "1"}]}},
+        "/feeds/77-Innings2.js": {"Innings2": {"BattingCard": [{"Runs": "2"}]}},
+    }
+    broken = {"/feeds/77-Innings2.js"}
+
+    def handler(request):
+        if request.url.path in broken or request.url.path not in feeds:
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"cb({json.dumps(feeds[request.url.path])});")
+
+    path = tmp_path / "snapshot.jsonl.gz"
+    async with BCCIApiClient(transport=httpx.MockTransport(handler)) as client:
+        first = await export_tournament(client, 326, circuit="domestic", path=path)
+    assert first["written"] == 0
+    assert first["errors"][0]["match_id"] == 77
+    assert not [r for r in read_snapshot(path) if r["type"] == "match"]
+
+    broken.clear()
+    async with BCCIApiClient(transport=httpx.MockTransport(handler)) as client:
+        second = await export_tournament(client, 326, circuit="domestic", path=path)
+    assert (second["written"], second["skipped"], second["errors"]) == (1, 0, [])
+    [match] = [r for r in read_snapshot(path) if r["type"] == "match"]
+    assert len(match["data"]["innings_details"]) == 2
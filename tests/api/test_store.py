@@ -0,0 +1,161 @@
+import sqlite3
+
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.store import MatchStore
+
+
+def _load(path):
+    with open(path, "r") as f:
+        return BCCIApiClient()._parse_jsonp(f.read())
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MatchStore(tmp_path / "store.db")
+    yield store
+    store.close()
+
+
+def test_add_catalog(store):
+    store.add_catalog(_load("tests/fixtures/competitions.js"), "domestic")
+
+    stats = store.stats()
+    assert stats["competitions"] > 0
+    assert stats["teams"] > 0
+    # Venues without a name are skipped
+    assert (
+        store.conn.execute("SELECT COUNT(*) FROM venues WHERE name IS NULL").fetchone()[
+            0
+        ]
+        == 0
+    )
+
+    season = store.conn.execute("SELECT DISTINCT season FROM competitions").fetchall()
+    assert [row[0] for row in season] == ["2025-26"]
+    # Leading spaces in team names are stripped
+    assert store.find_teams("TBD Mens Under 16")[0]["name"] == (
+        "TBD Mens Under 16 Years"
+    )
+
+
+def test_team_matches(store):
+    schedule = _load("tests/fixtures/intl_schedule.js")
+    store.add_schedule(schedule, "international", 236)
+    # Upserts: adding the same schedule again doesn't duplicate matches
+    store.add_schedule(schedule, "international", 236)
+
+    expected = [
+        m
+        for m in schedule["Matchsummary"]
+        if "New Zealand" in (m["FirstBattingTeamName"], m["SecondBattingTeamName"])
+    ]
+    matches = store.team_matches("new zealand")
+    assert len(matches) == len(expected)
+    assert [m["match_date"] for m in matches] == sorted(
+        (m["match_date"] for m in matches), reverse=True
+    )
+    assert matches[-1]["match_id"] == 2014
+    assert matches[-1]["venue"] == "Vidarbha Cricket Association Stadium"
+    assert matches[-1]["city"] == "Nagpur"
+    assert {matches[-1]["team1"], matches[-1]["team2"]} == {"India", "New Zealand"}
+
+    assert store.team_matches("new zealand", season="2026") == matches
+    assert store.team_matches("new zealand", season="2019") == []
+    assert store.team_matches("new zealand", circuit="domestic") == []
+    assert len(store.team_matches("new zealand", limit=2)) == 2
+
+
+def test_add_innings_and_player_innings(store):
+    data = _load("tests/fixtures/match_innings1.js")
+    store.add_innings(data, "domestic", 15629, 1)
+
+    innings = store.conn.execute("SELECT * FROM innings").fetchone()
+    assert innings["total"] == "254/9 (50.0 Overs)"
+    assert innings["extras"] == 6
+
+    batting = data["Innings1"]["BattingCard"]
+    assert store.stats()["batting"] == len(batting)
+    history = store.player_innings("arpit rana")
+    assert history["batting"][0]["runs"] == 10
+    assert history["batting"][0]["player_name"] == "ARPIT RANA"
+    assert history["bowling"] == []
+
+    bowler = data["Innings1"]["BowlingCard"][0]["PlayerName"]
+    assert store.player_innings(bowler)["bowling"][0]["innings_no"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_feeds_store(httpx_mock, tmp_path):
+    with open("tests/fixtures/intl_schedule.js", "r") as f:
+        mock_raw_response = f.read()
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.INTERNATIONAL_SCHEDULE.format(CompetitionID=236)
+    )
+    httpx_mock.add_response(url=url, text=mock_raw_response)
+
+    store = MatchStore(tmp_path / "store.db")
+    async with BCCIApiClient(store=store) as client:
+        await client.get_tournament_schedule(236, "international")
+    assert store.stats()["matches"] > 0
+    assert store.team_matches("India")[0]["circuit"] == "international"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_errors_do_not_break_client(httpx_mock, tmp_path):
+    with open("tests/fixtures/intl_schedule.js", "r") as f:
+        mock_raw_response = f.read()
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.INTERNATIONAL_SCHEDULE.format(CompetitionID=236)
+    )
+    httpx_mock.add_response(url=url, text=mock_raw_response)
+
+    store = MatchStore(tmp_path / "store.db")
+    store.close()
+    async with BCCIApiClient(store=store) as client:
+        data = await client.get_tournament_schedule(236, "international")
+    assert data["Matchsummary"]
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.stats()
+
+
+def test_name_lookups_use_the_name_indexes(store):
+    store.add_catalog(_load("tests/fixtures/competitions.js"), "domestic")
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT rowid FROM teams_names WHERE name LIKE ?",
+        ("%under 16%",),
+    ).fetchall()
+    assert "VIRTUAL TABLE" in plan[0]["detail"]
+
+    # Replaced rows are re-indexed under their new name
+    store.conn.execute("INSERT OR REPLACE INTO teams VALUES ('domestic', 1, 'Old XI')")
+    store.conn.execute("INSERT OR REPLACE INTO teams VALUES ('domestic', 1, 'New XI')")
+    assert [t["name"] for t in store.find_teams("xi")] == ["New XI"]
+    assert store.find_teams("old") == []
+
+
+def test_older_databases_get_name_indexes(tmp_path):
+    path = tmp_path / "store.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE teams (
+            circuit TEXT NOT NULL,
+            team_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            PRIMARY KEY (circuit, team_id)
+        );
+        CREATE INDEX teams_name ON teams (name COLLATE NOCASE);
+        INSERT INTO teams VALUES ('domestic', 1, 'Mumbai');
+        """
+    )
+    conn.close()
+
+    store = MatchStore(path)
+    assert store.find_teams("mum")[0]["team_id"] == 1
+    indexes = store.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'teams_name'"
+    ).fetchall()
+    assert indexes == []
+    store.close()
@@ -0,0 +1,219 @@
+import asyncio
+import httpx
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.api.throttle import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestThrottle,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_shrinks_and_grows():
+    limiter = AdaptiveLimiter(initial=8, max_limit=10, latency_threshold=1.0)
+
+    await limiter.acquire()
+    await limiter.release(ok=False, latency=0.1)
+    assert limiter.limit == 4
+
+    # Decreases are rate limited by the cooldown
+    await limiter.acquire()
+    await limiter.release(ok=True, latency=5.0)
+    assert limiter.limit == 4
+
+    await limiter.acquire()
+    await limiter.release(ok=True, latency=0.1)
+    assert limiter.limit == 4.25
+    assert limiter.in_flight == 0
+
+
+def _responses(*items):
+    items = list(items)
+
+    async def request():
+        item = items.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return httpx.Response(item[0], headers=item[1] if len(item) > 1 else None)
+
+    return request
+
+
+@pytest.mark.asyncio
+async def test_throttle_retries_transient_errors():
+    throttle = RequestThrottle(backoff_base=0)
+    request = _responses(httpx.ConnectTimeout("timeout"), (503,), (200,))
+
+    response = await throttle.send("scores.bcci.tv", request)
+
+    assert response.status_code == 200
+    assert throttle.stats()["retries"] == 2
+    assert throttle.stats()["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_throttle_gives_up_after_max_retries():
+    throttle = RequestThrottle(max_retries=1, backoff_base=0)
+
+    response = await throttle.send("h", _responses((500,), (500,)))
+    assert response.status_code == 500
+    assert throttle.failures == 1
+
+    with pytest.raises(httpx.ConnectError):
+        await throttle.send(
+            "h", _responses(httpx.ConnectError("down"), httpx.ConnectError("down"))
+        )
+
+    # Client errors are not retried
+    response = await throttle.send("h", _responses((404,)))
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_throttle_honours_retry_after():
+    throttle = RequestThrottle(backoff_base=0, retry_after_max=5)
+    assert throttle.backoff(0, retry_after=2.0) == 2.0
+
+    # Longer than retry_after_max: returned instead of waited out
+    response = await throttle.send("h", _responses((429, {"Retry-After": "120"})))
+    assert response.status_code == 429
+    assert throttle.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_client_retries_server_errors(httpx_mock):
+    url = BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS)
+    httpx_mock.add_response(url=url, status_code=503)
+    httpx_mock.add_response(url=url, text='callback({"competition": []});')
+
+    async with BCCIApiClient(throttle=RequestThrottle(backoff_base=0)) as client:
+        result = await client.get_domestic_competitions()
+        assert result == {"competition": []}
+        assert client.stats()["throttle"]["retries"] == 1
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("bcci_tv.api.throttle.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    now += 30
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.trips == 2
+
+
+@pytest.mark.asyncio
+async def test_throttle_rejects_calls_while_circuit_open():
+    throttle = RequestThrottle(max_retries=0, failure_threshold=1)
+
+    await throttle.send("h", _responses((502,)))
+    with pytest.raises(CircuitOpenError):
+        await throttle.send("h", _responses((200,)))
+
+    # Other hosts are unaffected
+    assert (await throttle.send("other", _responses((200,)))).status_code == 200
+    assert throttle.stats()["open_circuits"] == ["h"]
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_lets_one_trial_through():
+    throttle = RequestThrottle(max_retries=0, failure_threshold=1, reset_timeout=0)
+    await throttle.send("h", _responses((502,)))
+    assert throttle.breaker("h").state == "open"
+    calls = 0
+    release = asyncio.Event()
+
+    async def slow_ok():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return httpx.Response(200)
+
+    async def send():
+        return await throttle.send("h", slow_ok)
+
+    tasks = [asyncio.create_task(send()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Only the trial reached upstream; the rest were rejected while it was pending
+    assert calls == 1
+    assert [isinstance(r, CircuitOpenError) for r in results].count(True) == 4
+    assert throttle.breaker("h").state == "closed"
+    assert (await throttle.send("h", _responses((200,)))).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_frees_the_half_open_circuit():
+    throttle = RequestThrottle(max_retries=0, failure_threshold=1, reset_timeout=0)
+    await throttle.send("h", _responses((502,)))
+    assert throttle.breaker("h").state == "open"
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    trial = asyncio.create_task(throttle.send("h", hang))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    assert (await throttle.send("h", _responses((200,)))).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_do_not_shrink_the_limit():
+    throttle = RequestThrottle(
+        max_retries=0, limiter=AdaptiveLimiter(initial=8, max_limit=10)
+    )
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def broken():
+        raise ValueError("not an upstream failure")
+
+    request = asyncio.create_task(throttle.send("h", hang))
+    await asyncio.sleep(0.01)
+    request.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await request
+    with pytest.raises(ValueError):
+        await throttle.send("h", broken)
+
+    assert throttle.limiter.limit == 8
+    assert throttle.limiter.in_flight == 0
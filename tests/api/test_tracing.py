@@ -0,0 +1,86 @@
+import pytest
+from bcci_tv.api import tracing
+from bcci_tv.api.client import BCCIApiClient
+
+
+def test_traced_is_a_no_op_without_a_tracer():
+    previous = tracing.get_tracer()
+    tracing.set_tracer(None)
+    try:
+
+        @tracing.traced(attributes=("x",))
+        def double(x):
+            tracing.set_attribute("ignored", True)
+            return x * 2
+
+        assert double(3) == 6
+        with tracing.span("unused") as span:
+            assert span is None
+    finally:
+        tracing.set_tracer(previous)
+
+
+def test_tracing_is_opt_in():
+    # conftest's autouse fixtures don't install a tracer
+    assert tracing.get_tracer() is None
+
+    previous = tracing.get_tracer()
+    try:
+        assert tracing.enable_opentelemetry() is (tracing.otel_trace is not None)
+        if tracing.otel_trace is not None:
+            assert tracing.get_tracer() is not None
+    finally:
+        tracing.set_tracer(previous)
+
+
+def test_span_attributes(tracer):
+    @tracing.traced(attributes=("match_id", "innings"))
+    def fetch(match_id, innings=None, fields=None):
+        tracing.set_attribute("cache", "hit")
+        tracing.set_attribute("http.response.status_code", 200)
+
+    with tracing.span("outer", tool="get_domestic_match_summary") as outer:
+        fetch(15629)
+
+    inner = tracer.named("test_span_attributes.<locals>.fetch")[0]
+    assert inner.parent is outer
+    assert outer.attributes == {"bcci_tv.tool": "get_domestic_match_summary"}
+    # None-valued attributes are skipped; dotted names are kept as they are
+    assert inner.attributes == {
+        "bcci_tv.match_id": 15629,
+        "bcci_tv.cache": "hit",
+        "http.response.status_code": 200,
+    }
+
+
+@pytest.mark.asyncio
+async def test_client_spans_nest(api_client, httpx_mock, tracer):
+    with open("tests/fixtures/match_innings1.js", "rb") as f:
+        raw = f.read()
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+            MatchID=999, suffix="Innings1"
+        )
+    )
+    httpx_mock.add_response(url=url, content=raw)
+
+    await api_client.get_domestic_match_summary(999, innings=1)
+    await api_client.get_domestic_match_summary(999, innings=1)
+
+    summaries = tracer.named("BCCIApiClient.get_domestic_match_summary")
+    assert len(summaries) == 2
+    first, second = summaries
+    assert first.attributes["bcci_tv.match_id"] == 999
+    assert first.attributes["bcci_tv.innings"] == 1
+    assert first.attributes["bcci_tv.cache"] == "miss"
+    assert second.attributes["bcci_tv.cache"] == "hit"
+
+    (fetch,) = tracer.named("BCCIApiClient._fetch_feed")
+    assert fetch.parent is first
+    (request,) = tracer.named("BCCIApiClient._make_request")
+    assert request.parent is fetch
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.attributes["url.full"] == url
+    (parse,) = tracer.named("BCCIApiClient._parse_jsonp")
+    assert parse.parent is fetch
+    assert parse.attributes["bcci_tv.response_bytes"] == len(raw)
@@ -4,6 +4,8 @@ from bcci_tv.api.utils import (
     filter_tournament_standings,
     simplify_standings,
     filter_matches_by_status,
+    to_float,
+    to_int,
 )
 from bcci_tv.api.client import BCCIApiClient
 
@@ -56,6 +58,10 @@ def test_filter_tournament_standings():
     simplified_result = simplify_standings(filtered_result)
     assert simplified_result == expected_simplified_result
 
+    narrow_result = simplify_standings(filtered_result, fields=["TeamName", "Points"])
+    for category, teams in narrow_result.items():
+        assert [list(team) for team in teams] == [["TeamName", "Points"]] * len(teams)
+
 
 def test_filter_tournament_standings_empty():
     assert filter_tournament_standings({}) == {}
@@ -81,3 +87,12 @@ def test_filter_matches_by_status():
     # Assert post: 0 matches
     post = filter_matches_by_status(parsed_data, "post")
     assert len(post) == 0
+
+
+def test_number_converters():
+    assert to_int("7") == 7
+    assert to_int("7.0") == 7
+    assert to_int("") == 0
+    assert to_int(None) == 0
+    assert to_float("0.935") == 0.935
+    assert to_float("-") == 0.0
@@ -1,12 +1,17 @@
 import pytest
 import pytest_asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from bcci_tv.api import tracing
 from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.mcp.session import close_client
 
 
 @pytest.fixture(autouse=True)
 def mock_cache_dir(monkeypatch, tmp_path):
-    """Ensure tests use a temporary cache directory."""
+    """Ensure tests use a temporary cache directory and local store."""
     monkeypatch.setattr(BCCIApiClient, "_get_cache_dir", lambda self: tmp_path)
+    monkeypatch.setenv("BCCI_TV_STORE_PATH", str(tmp_path / "store.db"))
     return tmp_path
 
 
@@ -14,3 +19,54 @@ def mock_cache_dir(monkeypatch, tmp_path):
 async def api_client():
     async with BCCIApiClient() as client:
         yield client
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_shared_client():
+    """Ensure each test starts with a fresh shared MCP client."""
+    yield
+    await close_client()
+
+
+class RecordingSpan:
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.attributes = {}
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def is_recording(self):
+        return True
+
+
+class RecordingTracer:
+    """Minimal stand-in for an OpenTelemetry tracer."""
+
+    def __init__(self):
+        self.spans = []
+        self._current = ContextVar("recording_span", default=None)
+
+    @contextmanager
+    def start_as_current_span(self, name):
+        span = RecordingSpan(name, self._current.get())
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            self._current.reset(token)
+
+    def named(self, name):
+        return [s for s in self.spans if s.name == name]
+
+
+@pytest.fixture
+def tracer():
+    """Records trace spans with a stand-in tracer for the test."""
+    previous = tracing.get_tracer()
+    recording = RecordingTracer()
+    tracing.set_tracer(recording)
+    yield recording
+    tracing.set_tracer(previous)
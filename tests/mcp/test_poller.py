@@ -0,0 +1,254 @@
+import asyncio
+import json
+import pytest
+from bcci_tv.mcp.poller import MatchPoller, match_uri, parse_match_uri
+from bcci_tv.mcp.server import get_match_snapshot
+from bcci_tv.api.client import BCCIApiClient
+
+
+class FakeClient:
+    """Returns queued snapshots, repeating the last one."""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    async def get_full_match_summary(self, match_id, circuit):
+        self.calls += 1
+        if len(self.snapshots) > 1:
+            return self.snapshots.pop(0)
+        return self.snapshots[0]
+
+
+def _snapshot(runs, finished=False):
+    overall = {"Score": runs, "IsMatchEnd": "1" if finished else "0"}
+    return {"overall": overall, "innings_details": []}
+
+
+def test_match_uri_round_trip():
+    assert match_uri("domestic", 42) == "match://domestic/42"
+    assert parse_match_uri("match://domestic/42") == ("domestic", 42)
+    assert parse_match_uri("match://elsewhere/42") is None
+
+
+@pytest.mark.asyncio
+async def test_poller_shares_one_poll_and_notifies_on_change():
+    client = FakeClient(_snapshot(10), _snapshot(10), _snapshot(14))
+    poller = MatchPoller(client, interval=0.01, max_interval=0.01)
+    updates_a, updates_b = [], []
+
+    async def listener_a(uri):
+        updates_a.append(uri)
+
+    async def listener_b(uri):
+        updates_b.append(uri)
+
+    poller.subscribe("domestic", 1, listener_a)
+    poller.subscribe("domestic", 1, listener_b)
+    await asyncio.sleep(0.1)
+
+    # One update for the first snapshot, one for the change; none for the repeat
+    assert updates_a == updates_b == ["match://domestic/1"] * 2
+    assert await poller.get_snapshot("domestic", 1) == _snapshot(14)
+    await poller.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_stops_when_match_ends():
+    client = FakeClient(_snapshot(10), _snapshot(20, finished=True))
+    poller = MatchPoller(client, interval=0.01)
+
+    async def listener(uri):
+        pass
+
+    poller.subscribe("international", 2, listener)
+    await asyncio.sleep(0.1)
+
+    assert client.calls == 2
+    assert not poller.is_polling("international", 2)
+    assert (await poller.get_snapshot("international", 2))["overall"]["Score"] == 20
+    await poller.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_unsubscribe_stops_polling():
+    client = FakeClient(_snapshot(10))
+    poller = MatchPoller(client, interval=0.01)
+
+    async def listener(uri):
+        pass
+
+    poller.subscribe("domestic", 3, listener)
+    await asyncio.sleep(0.03)
+    poller.unsubscribe("domestic", 3, listener)
+    await asyncio.sleep(0)
+    calls = client.calls
+
+    await asyncio.sleep(0.05)
+    assert client.calls == calls
+    assert not poller.is_polling("domestic", 3)
+
+
+@pytest.mark.asyncio
+async def test_poller_drops_failing_listener():
+    client = FakeClient(_snapshot(10))
+    poller = MatchPoller(client, interval=0.01)
+
+    async def broken(uri):
+        raise RuntimeError("session closed")
+
+    poller.subscribe("domestic", 4, broken)
+    await asyncio.sleep(0.03)
+    assert poller._matches[("domestic", 4)].listeners == set()
+    await poller.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_remove_listener_drops_it_everywhere():
+    client = FakeClient(_snapshot(10))
+    poller = MatchPoller(client, interval=0.01)
+
+    async def gone(uri):
+        pass
+
+    async def staying(uri):
+        pass
+
+    poller.subscribe("domestic", 5, gone)
+    poller.subscribe("domestic", 6, gone)
+    poller.subscribe("domestic", 6, staying)
+    poller.remove_listener(gone)
+
+    assert not poller.is_polling("domestic", 5)
+    assert poller._matches[("domestic", 6)].listeners == {staying}
+    await poller.close()
+
+
+@pytest.mark.asyncio
+async def test_match_snapshot_resource(httpx_mock):
+    match_id = 12345
+    with open("tests/fixtures/match_summary.js", "r") as f:
+        summary_raw = f.read().replace('"CurrentInnings":"2"', '"CurrentInnings":"0"')
+
+    summary_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+            MatchID=match_id, suffix="matchsummary"
+        )
+    )
+    httpx_mock.add_response(url=summary_url, text=summary_raw)
+
+    result = json.loads(await get_match_snapshot.fn("domestic", match_id))
+    assert "overall" in result
+    assert result["innings_details"] == []
+
+    with pytest.raises(ValueError):
+        await get_match_snapshot.fn("elsewhere", match_id)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_through_mcp_client(httpx_mock, monkeypatch):
+    import httpx
+    import mcp.types
+    from fastmcp import Client
+    from bcci_tv.mcp.server import mcp as server
+
+    monkeypatch.setenv("BCCI_TV_WARMUP", "0")
+    monkeypatch.setenv("BCCI_TV_POLL_INTERVAL", "0.02")
+    monkeypatch.setenv("BCCI_TV_POLL_MAX_INTERVAL", "0.02")
+    # Poll upstream every time rather than reuse the live-match cache
+    monkeypatch.setattr(BCCIApiClient, "LIVE_MATCH_TTL", 0)
+
+    comments = {"value": "Delhi 10/0"}
+
+    def summary(request):
+        body = {
+            "MatchSummary": [
+                {
+                    "MatchID": "77",
+                    "CurrentInnings": "0",
+                    "IsMatchEnd": "0",
+                    "Comments": comments["value"],
+                }
+            ]
+        }
+        return httpx.Response(200, text=f"onScoringMatchsummary({json.dumps(body)});")
+
+    httpx_mock.add_callback(
+        summary,
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                MatchID=77, suffix="matchsummary"
+            )
+        ),
+        is_reusable=True,
+        is_optional=True,
+    )
+
+    updates = []
+
+    async def message_handler(message):
+        if isinstance(message, mcp.types.ServerNotification) and isinstance(
+            message.root, mcp.types.ResourceUpdatedNotification
+        ):
+            updates.append(str(message.root.params.uri))
+
+    async with Client(server, message_handler=message_handler) as client:
+        capabilities = client.initialize_result.capabilities
+        assert capabilities.resources.subscribe is True
+
+        await client.session.subscribe_resource("match://domestic/77")
+        for _ in range(100):
+            if updates:
+                break
+            await asyncio.sleep(0.01)
+        assert updates == ["match://domestic/77"]
+
+        comments["value"] = "Delhi 14/0"
+        for _ in range(100):
+            if len(updates) > 1:
+                break
+            await asyncio.sleep(0.01)
+        assert updates == ["match://domestic/77"] * 2
+
+        snapshot = await client.read_resource("match://domestic/77")
+        assert json.loads(snapshot[0].text)["overall"]["Comments"] == "Delhi 14/0"
+
+        await client.session.unsubscribe_resource("match://domestic/77")
+
+
+@pytest.mark.asyncio
+async def test_closed_session_listeners_are_dropped(httpx_mock, monkeypatch):
+    from fastmcp import Client
+    from bcci_tv.mcp.server import mcp as server
+    from bcci_tv.mcp.session import get_poller
+
+    monkeypatch.setenv("BCCI_TV_WARMUP", "0")
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                MatchID=78, suffix="matchsummary"
+            )
+        ),
+        text='onScoringMatchsummary({"MatchSummary": [{"MatchID": "78"}]});',
+        is_reusable=True,
+        is_optional=True,
+    )
+
+    async with Client(server) as client:
+        await client.session.subscribe_resource("match://domestic/78")
+        poller = get_poller()
+        assert poller.is_polling("domestic", 78)
+
+    # The session closed without unsubscribing
+    assert not poller.is_polling("domestic", 78)
+    assert ("domestic", 78) not in poller._matches
+
+
+def test_resource_subscriptions_need_the_sdk_server():
+    from fastmcp import FastMCP
+    from bcci_tv.mcp.server import _enable_resource_subscriptions
+
+    server = FastMCP("broken")
+    server._mcp_server = object()
+    with pytest.raises(RuntimeError, match="Unsupported fastmcp version"):
+        _enable_resource_subscriptions(server)
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import re
+import pytest
+from bcci_tv.api.client import BCCIApiClient
+from bcci_tv.mcp import session
+from bcci_tv.mcp.session import get_client, lifespan
+from bcci_tv.mcp.warmup import warm_up
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_shared():
+    assert get_client() is get_client()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_shared_client(monkeypatch):
+    monkeypatch.setenv("BCCI_TV_MAX_CONNECTIONS", "5")
+    monkeypatch.setenv("BCCI_TV_WARMUP", "0")
+
+    async with lifespan(None):
+        client = get_client()
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
+    assert get_client() is not client
+
+
+def _mock_warm_up_feeds(httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        competitions = f.read()
+    for endpoint in [
+        BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS,
+        BCCIApiClient.Endpoints.INTERNATIONAL_COMPETITIONS,
+    ]:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(endpoint), text=competitions
+        )
+    httpx_mock.add_response(
+        url=re.compile(r".*-matchschedule\.js$"),
+        text='callback({"Matchsummary": []});',
+        is_reusable=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_catalogs_and_live_schedules(httpx_mock):
+    _mock_warm_up_feeds(httpx_mock)
+    with open("tests/fixtures/live_tournaments_summary.json", "r") as f:
+        live = json.load(f)
+
+    async with BCCIApiClient() as client:
+        summary = await warm_up(client)
+
+        assert summary["catalogs"] == 2
+        # The fixture catalog is used for both circuits
+        assert summary["live_tournaments"] == summary["schedules"] == 2 * len(live)
+        assert "domestic" in client._competition_indexes
+        assert "international" in client._competition_indexes
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_up_in_background(httpx_mock):
+    _mock_warm_up_feeds(httpx_mock)
+
+    async with lifespan(None):
+        client = get_client()
+        # Startup isn't blocked on the warm-up
+        assert client.upstream_requests == 0
+        for _ in range(100):
+            if not session._background_tasks:
+                break
+            await asyncio.sleep(0.01)
+        assert len(client._competition_indexes) == 2
@@ -8,8 +8,12 @@ from bcci_tv.mcp.server import (
     get_tournament_schedule,
     get_domestic_match_summary,
     get_intl_match_summary,
+    get_match_summaries,
+    get_team_history,
+    get_player_history,
 )
 from bcci_tv.api.client import BCCIApiClient
+from fastmcp.tools.tool import ToolResult
 
 
 @pytest.mark.asyncio
@@ -50,11 +54,51 @@ async def test_search_competitions_tool_fallback(httpx_mock):
         status_code=200,
     )
 
-    # Search without circuit - should find in domestic and stop
+    # International is fetched concurrently to warm its cache
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.INTERNATIONAL_COMPETITIONS
+        ),
+        text=mock_raw_response,
+        status_code=200,
+        is_optional=True,
+    )
+
+    # Search without circuit - should return the domestic matches
     result = await search_competitions.fn(query="COOCH")
     assert result == expected_output
 
 
+@pytest.mark.asyncio
+async def test_search_competitions_tool_international(httpx_mock):
+    with open("tests/fixtures/competitions.js", "r") as f:
+        mock_raw_response = f.read()
+
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS),
+        text=mock_raw_response,
+        status_code=200,
+    )
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.INTERNATIONAL_COMPETITIONS
+        ),
+        text='oncomptetion({"competition": [{"CompetitionID": 236, '
+        '"CompetitionName": "New Zealand tour of India 2026"}]});',
+        status_code=200,
+    )
+
+    # Nothing matches in domestic, so the international result is used
+    result = await search_competitions.fn(query="New Zealand")
+    assert result == [
+        {
+            "CompetitionID": 236,
+            "CompetitionName": "New Zealand tour of India 2026",
+            "circuit": "international",
+        }
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_tournament_standings_tool(httpx_mock):
     competition_id = 326
@@ -122,6 +166,37 @@ async def test_get_tournament_schedule_tool_intl(httpx_mock):
     assert all(match["MatchStatus"].lower() == "upcoming" for match in result)
 
 
+@pytest.mark.asyncio
+async def test_get_tournament_schedule_tool_reports_stale_data(httpx_mock, monkeypatch):
+    monkeypatch.setenv("BCCI_TV_MAX_RETRIES", "0")
+    competition_id = 236
+    with open("tests/fixtures/intl_schedule.js", "r") as f:
+        mock_raw_response = f.read()
+
+    mock_url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.INTERNATIONAL_SCHEDULE.format(
+            CompetitionID=competition_id
+        )
+    )
+    httpx_mock.add_response(
+        url=mock_url, text=mock_raw_response, headers={"ETag": '"v1"'}
+    )
+    httpx_mock.add_response(url=mock_url, status_code=503)
+
+    fresh = await get_tournament_schedule.fn(
+        competition_id=competition_id, circuit="international"
+    )
+    stale = await get_tournament_schedule.fn(
+        competition_id=competition_id, circuit="international"
+    )
+
+    assert isinstance(fresh, list)
+    assert isinstance(stale, ToolResult)
+    assert stale.structured_content == {"result": fresh}
+    assert "out of date" in stale.content[-1].text
+    assert stale.meta["stale"][0]["reason"] == "upstream unavailable"
+
+
 @pytest.mark.asyncio
 async def test_get_domestic_match_summary_tool(httpx_mock):
     match_id = 999
@@ -162,6 +237,12 @@ async def test_get_domestic_match_summary_tool(httpx_mock):
     assert "innings_details" in result
     assert len(result["innings_details"]) == 2
 
+    # Nothing changed since the returned version, so no data is resent
+    unchanged = await get_domestic_match_summary.fn(
+        match_id=match_id, since=result["version"]
+    )
+    assert unchanged == {"version": result["version"], "since": result["version"]}
+
 
 @pytest.mark.asyncio
 async def test_get_intl_match_summary_tool(httpx_mock):
@@ -197,3 +278,157 @@ async def test_get_intl_match_summary_tool(httpx_mock):
     assert "overall" in result
     assert "innings_details" in result
     assert len(result["innings_details"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_match_summaries_tool(httpx_mock):
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        innings_raw = f.read()
+
+    for match_id in [101, 102]:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(
+                BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+                    MatchID=match_id, suffix="Innings1"
+                )
+            ),
+            text=innings_raw,
+        )
+
+    result = await get_match_summaries.fn(
+        match_ids=[102, 101], circuit="domestic", innings=1
+    )
+
+    assert [r["match_id"] for r in result] == [102, 101]
+    assert all("BattingCard" in r["data"]["Innings1"] for r in result)
+
+
+def test_batch_concurrency_is_set_on_the_shared_client(monkeypatch):
+    from bcci_tv.mcp.session import get_client
+
+    monkeypatch.setenv("BCCI_TV_BATCH_CONCURRENCY", "3")
+    assert get_client().batch_concurrency == 3
+
+
+@pytest.mark.asyncio
+async def test_history_tools_answer_from_store(httpx_mock, monkeypatch):
+    monkeypatch.setenv("BCCI_TV_STORE", "1")
+    with open("tests/fixtures/intl_schedule.js", "r") as f:
+        schedule_raw = f.read()
+    httpx_mock.add_response(
+        url=BCCIApiClient.get_full_url(
+            BCCIApiClient.Endpoints.INTERNATIONAL_SCHEDULE.format(CompetitionID=236)
+        ),
+        text=schedule_raw,
+    )
+    await get_tournament_schedule.fn(competition_id=236, circuit="international")
+
+    result = await get_team_history.fn(team="New Zealand", season="2026")
+    assert result["teams"] == [
+        {"circuit": "international", "team_id": 4, "name": "New Zealand"}
+    ]
+    assert result["matches"][-1]["match_id"] == 2014
+
+    # Player history only covers scorecards fetched before
+    assert await get_player_history.fn(player="Arpit") == {
+        "batting": [],
+        "bowling": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_history_tools_with_store_disabled():
+    # The store is off by default
+    result = await get_team_history.fn(team="India")
+    assert "disabled" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_server_runs_without_a_broken_store(monkeypatch, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("BCCI_TV_STORE", "1")
+    monkeypatch.setenv("BCCI_TV_STORE_PATH", str(blocker / "store.db"))
+
+    result = await get_team_history.fn(team="India")
+    assert "disabled" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_recorded_in_metrics(httpx_mock, monkeypatch):
+    from fastmcp import Client
+    from bcci_tv.mcp.server import mcp
+
+    monkeypatch.setenv("BCCI_TV_WARMUP", "0")
+
+    with open("tests/fixtures/competitions.js", "r") as f:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(
+                BCCIApiClient.Endpoints.DOMESTIC_COMPETITIONS
+            ),
+            text=f.read(),
+        )
+
+    async with Client(mcp) as client:
+        await client.call_tool("get_live_tournaments", {"circuit": "domestic"})
+        prometheus = await client.read_resource("metrics://prometheus")
+        snapshot = await client.read_resource("metrics://snapshot")
+
+    text = prometheus[0].text
+    assert (
+        'bcci_tv_tool_calls_total{outcome="ok",tool="get_live_tournaments"} 1' in text
+    )
+    assert 'endpoint="domestic_competitions"' in text
+    data = json.loads(snapshot[0].text)
+    assert data["client"]["upstream_requests"] == 1
+    assert data["metrics"]["bcci_tv_tool_duration_seconds"][0]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_traced(httpx_mock, monkeypatch, tracer):
+    from fastmcp import Client
+    from bcci_tv.mcp.server import mcp
+
+    monkeypatch.setenv("BCCI_TV_WARMUP", "0")
+    with open("tests/fixtures/standings.js", "r") as f:
+        httpx_mock.add_response(
+            url=BCCIApiClient.get_full_url(
+                BCCIApiClient.Endpoints.STANDINGS.format(CompetitionID=326)
+            ),
+            text=f.read(),
+        )
+
+    async with Client(mcp) as client:
+        await client.call_tool("get_tournament_standings", {"competition_id": 326})
+
+    (tool,) = tracer.named("tool get_tournament_standings")
+    assert tool.attributes["bcci_tv.competition_id"] == 326
+    (records,) = tracer.named("BCCIApiClient.get_standings_records")
+    assert records.parent is tool
+    (standings,) = tracer.named("BCCIApiClient.get_tournament_standings")
+    assert standings.parent is records
+
+
+@pytest.mark.asyncio
+async def test_match_tools_report_stale_innings(httpx_mock, monkeypatch):
+    from bcci_tv.mcp.session import get_client
+
+    with open("tests/fixtures/match_innings1.js", "r") as f:
+        mock_raw_response = f.read()
+    url = BCCIApiClient.get_full_url(
+        BCCIApiClient.Endpoints.DOMESTIC_MATCH_DETAILS.format(
+            MatchID=15629, suffix="Innings1"
+        )
+    )
+    httpx_mock.add_response(url=url, text=mock_raw_response)
+    httpx_mock.add_response(url=url, status_code=503, is_reusable=True)
+    monkeypatch.setenv("BCCI_TV_MAX_RETRIES", "0")
+    monkeypatch.setattr(BCCIApiClient, "LIVE_MATCH_TTL", 0)
+
+    fresh = await get_domestic_match_summary.fn(match_id=15629, innings=1)
+    assert "stale" not in fresh
+
+    result = await get_domestic_match_summary.fn(match_id=15629, innings=1)
+    assert result["Innings1"] == fresh["Innings1"]
+    assert result["stale"][0]["reason"] == "upstream unavailable"
+    assert get_client().stats()["stale_served"] == 1
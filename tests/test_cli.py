@@ -0,0 +1,40 @@
+import json
+from bcci_tv import cli
+from bcci_tv.api.cache import FeedCache
+
+
+def test_snapshot_command(monkeypatch, capsys, tmp_path):
+    calls = {}
+
+    async def fake_export(client, competition_id, **kwargs):
+        calls.update(kwargs, competition_id=competition_id)
+        return {"path": kwargs["path"], "errors": []}
+
+    monkeypatch.setattr(cli, "export_tournament", fake_export)
+    output = str(tmp_path / "out.jsonl.gz")
+
+    exit_code = cli.main(["snapshot", "326", "--circuit", "domestic", "-o", output])
+
+    assert exit_code == 0
+    assert calls == {
+        "competition_id": 326,
+        "circuit": "domestic",
+        "path": output,
+        "concurrency": 8,
+    }
+    assert json.loads(capsys.readouterr().out)["path"] == output
+
+
+def test_cache_commands(capsys, mock_cache_dir):
+    cache = FeedCache(mock_cache_dir)
+    cache.set("a.json", {"v": 1})
+    cache.set("b.json", {"v": 2})
+
+    assert cli.main(["cache", "stats"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["entries"] == 2
+    assert stats["path"] == str(mock_cache_dir)
+
+    assert cli.main(["cache", "prune", "--max-mb", "0"]) == 0
+    assert json.loads(capsys.readouterr().out)["entries"] == 2
+    assert cache.usage()["entries"] == 0